@@ -89,6 +89,29 @@ interface ChartData {
   bollingerLower?: number;
 }
 
+// Backend sends chartData column-wise: one array per field (macd/bollinger nested),
+// all the same length as `time`. Rebuild the per-bar rows the series setters expect.
+// Indicator warm-up bars arrive as null; map them to undefined as the old per-bar payload did.
+const columnarToChartData = (cols: any): ChartData[] =>
+  (cols?.time ?? []).map((time: number, i: number) => ({
+    time: time as Time,
+    open: cols.open[i],
+    high: cols.high[i],
+    low: cols.low[i],
+    close: cols.close[i],
+    volume: cols.volume[i],
+    rsi: cols.rsi[i] ?? undefined,
+    macd: cols.macd.macd[i] ?? undefined,
+    signal: cols.macd.signal[i] ?? undefined,
+    histogram: cols.macd.histogram[i] ?? undefined,
+    sma20: cols.sma20[i] ?? undefined,
+    sma50: cols.sma50[i] ?? undefined,
+    sma200: cols.sma200[i] ?? undefined,
+    bollingerUpper: cols.bollinger.upper[i] ?? undefined,
+    bollingerMiddle: cols.bollinger.middle[i] ?? undefined,
+    bollingerLower: cols.bollinger.lower[i] ?? undefined
+  }));
+
 /**
  * Professional Market Index Chart Component
  * Features:
@@ -174,24 +197,7 @@ export const MarketIndexChart: React.FC<MarketIndexChartProps> = ({
       }
 
       // Transform backend data to chart format
-      const transformedData: ChartData[] = apiResponse.chartData.map((item: any) => ({
-        time: item.time as Time,
-        open: item.open,
-        high: item.high,
-        low: item.low,
-        close: item.close,
-        volume: item.volume,
-        rsi: item.rsi,
-        macd: item.macd?.macd,
-        signal: item.macd?.signal,
-        histogram: item.macd?.histogram,
-        sma20: item.sma20,
-        sma50: item.sma50,
-        sma200: item.sma200,
-        bollingerUpper: item.bollinger?.upper,
-        bollingerMiddle: item.bollinger?.middle,
-        bollingerLower: item.bollinger?.lower
-      }));
+      const transformedData: ChartData[] = columnarToChartData(apiResponse.chartData);
 
       setChartData(transformedData);
     } catch (error) {
@@ -231,24 +237,7 @@ export const MarketIndexChart: React.FC<MarketIndexChartProps> = ({
         return;
       }
 
-      const transformedData: ChartData[] = apiResponse.chartData.map((item: any) => ({
-        time: item.time as Time,
-        open: item.open,
-        high: item.high,
-        low: item.low,
-        close: item.close,
-        volume: item.volume,
-        rsi: item.rsi,
-        macd: item.macd?.macd,
-        signal: item.macd?.signal,
-        histogram: item.macd?.histogram,
-        sma20: item.sma20,
-        sma50: item.sma50,
-        sma200: item.sma200,
-        bollingerUpper: item.bollinger?.upper,
-        bollingerMiddle: item.bollinger?.middle,
-        bollingerLower: item.bollinger?.lower
-      }));
+      const transformedData: ChartData[] = columnarToChartData(apiResponse.chartData);
 
       setChartData(transformedData);
       setHasFullHistory(true);
@@ -387,6 +387,13 @@ export class QuantitativeAPI {
     }
 
     const result = await response.json();
+    // Backend ships the equity curve columnar ({dates, portfolioValue, benchmark}); zip it into rows
+    const cols = result.chart;
+    result.chart = (cols?.dates ?? []).map((date: string, i: number) => ({
+      date,
+      portfolioValue: cols.portfolioValue[i],
+      benchmark: cols.benchmark[i]
+    }));
     console.log('✅ [BACKTEST] Response received:', {
       dataPoints: result.chart?.length || 0,
       symbols: result.symbols,
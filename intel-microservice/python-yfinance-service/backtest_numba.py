@@ -0,0 +1,243 @@
+"""
+Numba-compiled backtest day loops.
+
+backtest_strategy computes each strategy's indicators and entry/exit signals as
+(bars x symbols) matrices up front; the kernels here only walk the cash/position
+state machine bar by bar over those contiguous arrays. Trades come back as parallel
+arrays (bar index, symbol index, side, shares, price, total) and are turned into
+the API's trade dicts at the Python level.
+"""
+import numpy as np
+
+# PERFORMANCE FIX: Numba JIT for the per-bar loops (optional - plain Python loops otherwise)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+TRADE_BUY = 1
+TRADE_SELL = -1
+
+
+@njit(cache=True)
+def _new_trade_buffers(capacity):
+    """Preallocated trade arrays: bar, symbol, side, shares, price, total"""
+    return (np.empty(capacity, dtype=np.int64), np.empty(capacity, dtype=np.int64),
+            np.empty(capacity, dtype=np.int8), np.empty(capacity, dtype=np.int64),
+            np.empty(capacity), np.empty(capacity))
+
+
+@njit(cache=True)
+def _mark_to_market(cash, positions, prices):
+    value = cash
+    for k in range(positions.size):
+        if positions[k] > 0:
+            value += positions[k] * prices[k]
+    return value
+
+
+@njit(cache=True)
+def run_signal_strategy(close_mat, buy_sig, sell_sig, start, position_size, initial_cash):
+    """
+    Per-symbol entry/exit strategies (mean reversion, RSI, Bollinger, MA crossover, breakout).
+
+    On every bar from `start`, symbols are visited in order: a flat symbol with a buy
+    signal gets int(cash * position_size / price) shares if affordable, a held symbol
+    with a sell signal is closed out. Returns (equity, t_bar, t_sym, t_side, t_shares, t_price, t_total).
+    """
+    n, s = close_mat.shape
+    positions = np.zeros(s, dtype=np.int64)
+    equity = np.empty(n)
+    t_bar, t_sym, t_side, t_shares, t_price, t_total = _new_trade_buffers(n * s)
+    n_trades = 0
+    cash = initial_cash
+
+    for i in range(min(start, n)):
+        equity[i] = cash
+
+    for i in range(start, n):
+        for k in range(s):
+            price = close_mat[i, k]
+            if buy_sig[i, k] and positions[k] == 0:
+                if price > 0:
+                    shares = int((cash * position_size) / price)
+                    if shares > 0:
+                        cost = shares * price
+                        if cost <= cash:
+                            positions[k] = shares
+                            cash -= cost
+                            t_bar[n_trades] = i
+                            t_sym[n_trades] = k
+                            t_side[n_trades] = TRADE_BUY
+                            t_shares[n_trades] = shares
+                            t_price[n_trades] = price
+                            t_total[n_trades] = cost
+                            n_trades += 1
+            elif sell_sig[i, k] and positions[k] > 0:
+                proceeds = positions[k] * price
+                t_bar[n_trades] = i
+                t_sym[n_trades] = k
+                t_side[n_trades] = TRADE_SELL
+                t_shares[n_trades] = positions[k]
+                t_price[n_trades] = price
+                t_total[n_trades] = proceeds
+                n_trades += 1
+                cash += proceeds
+                positions[k] = 0
+        equity[i] = _mark_to_market(cash, positions, close_mat[i])
+
+    return (equity, t_bar[:n_trades], t_sym[:n_trades], t_side[:n_trades],
+            t_shares[:n_trades], t_price[:n_trades], t_total[:n_trades])
+
+
+@njit(cache=True)
+def run_momentum(close_mat, momentum_mat, start, position_size, initial_cash):
+    """
+    Cross-sectional momentum: each bar holds the top max(1, int(valid * position_size))
+    symbols by lookback return (ties keep symbol order), selling everything that drops out
+    and splitting cash evenly across new entries. Same return layout as run_signal_strategy.
+    """
+    n, s = close_mat.shape
+    positions = np.zeros(s, dtype=np.int64)
+    equity = np.empty(n)
+    t_bar, t_sym, t_side, t_shares, t_price, t_total = _new_trade_buffers(2 * n * s)
+    n_trades = 0
+    cash = initial_cash
+    is_top = np.zeros(s, dtype=np.bool_)
+
+    for i in range(min(start, n)):
+        equity[i] = cash
+
+    for i in range(start, n):
+        scores = momentum_mat[i]
+        valid = np.where(~np.isnan(scores))[0]
+        if valid.size > 0:
+            # Stable descending sort == sorted(..., reverse=True) over the valid symbols
+            order = valid[np.argsort(-scores[valid], kind='mergesort')]
+            num_positions = max(1, int(valid.size * position_size))
+            top = order[:num_positions]
+            is_top[:] = False
+            for k in top:
+                is_top[k] = True
+
+            # Exit positions not in top performers
+            for k in range(s):
+                if positions[k] > 0 and not is_top[k]:
+                    price = close_mat[i, k]
+                    proceeds = positions[k] * price
+                    t_bar[n_trades] = i
+                    t_sym[n_trades] = k
+                    t_side[n_trades] = TRADE_SELL
+                    t_shares[n_trades] = positions[k]
+                    t_price[n_trades] = price
+                    t_total[n_trades] = proceeds
+                    n_trades += 1
+                    cash += proceeds
+                    positions[k] = 0
+
+            # Enter positions in top performers
+            for k in top:
+                price = close_mat[i, k]
+                if positions[k] == 0 and price > 0:
+                    shares = int((cash / num_positions) / price)
+                    if shares > 0:
+                        cost = shares * price
+                        if cost <= cash:
+                            positions[k] = shares
+                            cash -= cost
+                            t_bar[n_trades] = i
+                            t_sym[n_trades] = k
+                            t_side[n_trades] = TRADE_BUY
+                            t_shares[n_trades] = shares
+                            t_price[n_trades] = price
+                            t_total[n_trades] = cost
+                            n_trades += 1
+        equity[i] = _mark_to_market(cash, positions, close_mat[i])
+
+    return (equity, t_bar[:n_trades], t_sym[:n_trades], t_side[:n_trades],
+            t_shares[:n_trades], t_price[:n_trades], t_total[:n_trades])
+
+
+@njit(cache=True)
+def run_pairs_trading(close_mat, long0_sig, long1_sig, exit_sig, start, position_size, initial_cash):
+    """
+    Pairs trade on symbols 0 and 1 driven by precomputed z-score masks of their price ratio:
+    long1_sig (z > 2) buys leg 1, long0_sig (z < -2) buys leg 0 (only when flat), exit_sig
+    (|z| < 0.5) closes both legs. Same return layout as run_signal_strategy.
+    """
+    n, s = close_mat.shape
+    positions = np.zeros(s, dtype=np.int64)
+    equity = np.empty(n)
+    t_bar, t_sym, t_side, t_shares, t_price, t_total = _new_trade_buffers(2 * n)
+    n_trades = 0
+    cash = initial_cash
+
+    for i in range(min(start, n)):
+        equity[i] = cash
+
+    for i in range(start, n):
+        flat = positions[0] == 0 and positions[1] == 0
+        leg = -1
+        fraction = 0.0
+        if long1_sig[i] and flat:
+            # Spread too high: long sym2 (the short sym1 leg is simulated by holding cash)
+            leg = 1
+            fraction = 0.5 * position_size
+        elif long0_sig[i] and flat:
+            # Spread too low: long sym1
+            leg = 0
+            fraction = position_size
+        elif exit_sig[i]:
+            # Spread normalized: close positions
+            for k in range(2):
+                if positions[k] > 0:
+                    price = close_mat[i, k]
+                    proceeds = positions[k] * price
+                    t_bar[n_trades] = i
+                    t_sym[n_trades] = k
+                    t_side[n_trades] = TRADE_SELL
+                    t_shares[n_trades] = positions[k]
+                    t_price[n_trades] = price
+                    t_total[n_trades] = proceeds
+                    n_trades += 1
+                    cash += proceeds
+                    positions[k] = 0
+
+        if leg >= 0:
+            price = close_mat[i, leg]
+            if price > 0:
+                shares = int((cash * fraction) / price)
+                if shares > 0:
+                    cost = shares * price
+                    if cost <= cash:
+                        positions[leg] = shares
+                        cash -= cost
+                        t_bar[n_trades] = i
+                        t_sym[n_trades] = leg
+                        t_side[n_trades] = TRADE_BUY
+                        t_shares[n_trades] = shares
+                        t_price[n_trades] = price
+                        t_total[n_trades] = cost
+                        n_trades += 1
+        equity[i] = _mark_to_market(cash, positions, close_mat[i])
+
+    return (equity, t_bar[:n_trades], t_sym[:n_trades], t_side[:n_trades],
+            t_shares[:n_trades], t_price[:n_trades], t_total[:n_trades])
+
+
+def warmup_backtest_kernels():
+    """Compile the backtest kernels up front so the first backtest doesn't pay JIT latency"""
+    if not NUMBA_AVAILABLE:
+        return
+    close = np.linspace(100.0, 110.0, 60).reshape(30, 2)
+    sig = np.zeros((30, 2), dtype=np.bool_)
+    run_signal_strategy(close, sig, sig, 5, 0.1, 10000.0)
+    run_momentum(close, close / 100.0 - 1.0, 5, 0.5, 10000.0)
+    run_pairs_trading(close, sig[:, 0], sig[:, 0], sig[:, 0], 5, 0.1, 10000.0)
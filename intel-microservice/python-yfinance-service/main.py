@@ -1,36 +1,77 @@
 # Git commit: 6070705 - Black-Litterman with Efficient Frontier v2
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any, Tuple
 import yfinance as yf
+from yfinance.data import YfData  # yfinance's cookie/crumb-aware Yahoo client
 import pandas as pd
 import numpy as np
 import asyncio
-import redis
+import aiohttp
+import redis.asyncio as aredis
 import json
 import time
 import logging
 import random
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 import uvicorn
 from scipy.stats import norm
+from scipy.linalg import cho_factor, cho_solve
 import math
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
 # Technical analysis library for comprehensive intel
 from ta.trend import MACD
 from ta.momentum import RSIIndicator
+# Process-wide yfinance session (shared with portfolio_analytics - YfData is a singleton)
+from yf_session import SHARED_YF_SESSION
 # Portfolio analytics service
 from portfolio_analytics import portfolio_analytics
+# Numba-compiled backtest day loops
+from backtest_numba import (
+    TRADE_BUY, TRADE_SELL, run_signal_strategy, run_momentum, run_pairs_trading, warmup_backtest_kernels
+)
 # Memory optimization utilities
 from memory_optimizer import memory_manager, create_cache_cleanup_strategy
 # PERFORMANCE FIX: malloc_trim for aggressive memory cleanup (fixes pandas/yfinance leak)
 from ctypes import cdll, CDLL
 import gc
 import psutil
+import functools
+import heapq
+from types import MappingProxyType
+from collections import Counter, defaultdict, deque
+from cachetools import TTLCache, LRUCache
+import diskcache
+import orjson
+import zstandard
+# PERFORMANCE FIX: bottleneck moving-window kernels (optional - falls back to numpy stride tricks)
+from numpy.lib.stride_tricks import sliding_window_view
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    bn = None
+    BOTTLENECK_AVAILABLE = False
+# PERFORMANCE FIX: Numba JIT for hot numeric kernels (optional - falls back to NumPy paths)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # Helper function to sanitize float values for JSON serialization
 def sanitize_float(value):
@@ -53,94 +94,171 @@ def sanitize_dict(data):
         return sanitize_float(data)
 
 # Greeks Calculation Functions (Black-Scholes Model)
-def calculate_days_to_expiration(expiration_str):
-    """Calculate days to expiration from date string"""
+RISK_FREE_RATE = 0.05  # Risk-free rate (5%)
+
+@functools.lru_cache(maxsize=256)
+def _parse_exp(expiration_str):
+    """Parse an expiration date once (a chain has only a handful of distinct expirations)"""
+    return datetime.strptime(expiration_str, '%Y-%m-%d')
+
+def precompute_T(expiration_str, now=None) -> float:
+    """
+    Time to expiration in years (minimum 1 day, default 30 days on bad input).
+    Call once per expiration group and pass the float T into the Greeks.
+    """
     try:
-        exp_date = datetime.strptime(expiration_str, '%Y-%m-%d')
-        days = (exp_date - datetime.now()).days
+        days = (_parse_exp(expiration_str) - (now or datetime.now())).days
         return max(1, days) / 365.0  # Convert to years, minimum 1 day
     except:
         return 30 / 365.0  # Default to 30 days
 
-def calculate_delta(S, K, sigma, T_str, option_type='call'):
-    """Calculate Delta (sensitivity to stock price)"""
-    try:
-        T = calculate_days_to_expiration(T_str)
-        r = 0.05  # Risk-free rate (5%)
-
-        if sigma <= 0 or T <= 0:
-            return 0.5 if option_type == 'call' else -0.5
-
-        d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-
-        if option_type == 'call':
-            delta = norm.cdf(d1)
-        else:  # put
-            delta = norm.cdf(d1) - 1
+def calculate_days_to_expiration(expiration_str):
+    """Calculate days to expiration from date string"""
+    return precompute_T(expiration_str)
+
+def expirations_to_years(expirations):
+    """Vectorized calculate_days_to_expiration: parse a whole expiration column at once"""
+    exp_dates = pd.to_datetime(pd.Index(np.atleast_1d(expirations)), format='%Y-%m-%d', errors='coerce')
+    days = np.asarray((exp_dates - pd.Timestamp.now()).days, dtype=np.float64)
+    return np.where(np.isnan(days), 30.0, np.maximum(days, 1.0)) / 365.0
+
+@njit(parallel=True, fastmath=True, cache=True)
+def greeks_kernel(S, K, sigma, T, is_call, out_delta, out_gamma, out_theta, out_vega):
+    """Fused Black-Scholes Greeks loop (d1, d2, N(x), phi(x) inline, no Python dispatch)"""
+    r = RISK_FREE_RATE
+    sqrt2 = math.sqrt(2.0)
+    inv_sqrt_2pi = 1.0 / math.sqrt(2.0 * math.pi)
+    for i in prange(K.size):
+        k = K[i]
+        sig = sigma[i]
+        t = T[i]
+        if sig <= 0.0 or t <= 0.0 or k <= 0.0 or S <= 0.0:
+            out_delta[i] = 0.5 if is_call[i] else -0.5
+            out_gamma[i] = 0.001
+            out_theta[i] = -0.05
+            out_vega[i] = 0.01
+            continue
 
-        # Debug extremely low deltas for ATM options
-        if abs(S - K) / S < 0.05 and abs(delta) < 0.1:  # ATM option with very low delta
-            logger.warning(f"⚠️ Suspiciously low delta: S={S}, K={K}, sigma={sigma}, T={T}, delta={delta}")
+        sqrtT = math.sqrt(t)
+        d1 = (math.log(S / k) + (r + 0.5 * sig * sig) * t) / (sig * sqrtT)
+        d2 = d1 - sig * sqrtT
+        cdf_d1 = 0.5 * (1.0 + math.erf(d1 / sqrt2))
+        pdf_d1 = math.exp(-0.5 * d1 * d1) * inv_sqrt_2pi
+        decay = -S * pdf_d1 * sig / (2.0 * sqrtT)
+        discount = r * k * math.exp(-r * t)
+
+        if is_call[i]:
+            out_delta[i] = cdf_d1
+            out_theta[i] = (decay - discount * 0.5 * (1.0 + math.erf(d2 / sqrt2))) / 365.0
+        else:
+            out_delta[i] = cdf_d1 - 1.0
+            out_theta[i] = (decay + discount * 0.5 * (1.0 + math.erf(-d2 / sqrt2))) / 365.0
+        out_gamma[i] = max(pdf_d1 / (S * sig * sqrtT), 0.0001)
+        out_vega[i] = max(S * pdf_d1 * sqrtT / 100.0, 0.001)
+
+def warmup_jit_kernels():
+    """Compile Numba kernels up front so the first request doesn't pay JIT latency"""
+    if not NUMBA_AVAILABLE:
+        return
+    start = time.time()
+    calculate_greeks_batch(100.0, [95.0, 105.0], [0.3, 0.3], [0.1, 0.1], np.array(['call', 'put']))
+    sample = np.linspace(100.0, 110.0, 30)
+    macd_kernel(sample, 2.0 / 13, 2.0 / 27, 2.0 / 10, np.empty(30), np.empty(30), np.empty(30))
+    ewma(sample, 2.0 / 13, np.empty(30))
+    rsi_wilder(sample, 14)
+    compute_ma_bb(sample)
+    bollinger_kernel(sample, 20)
+    sliding_max(sample, 20)
+    rsi_last(sample, 14)
+    macd_last(sample, 2.0 / 13, 2.0 / 27, 2.0 / 10)
+    warmup_backtest_kernels()
+    logger.info(f"⚡ Numba kernels compiled in {time.time() - start:.2f}s")
+
+def calculate_greeks_batch(S, K_array, sigma_array, T_array, types):
+    """
+    PERFORMANCE FIX: Black-Scholes Greeks for a whole option chain in one pass.
 
-        return delta
+    S is the spot price (scalar), K/sigma/T are arrays (T in years) and types is
+    'call'/'put' (scalar or array). Returns dict of delta/gamma/theta/vega arrays
+    with the same fallbacks as the scalar functions for invalid inputs.
+    Uses the Numba greeks_kernel when available, NumPy ufuncs otherwise.
+    """
+    K = np.ascontiguousarray(K_array, dtype=np.float64)
+    sigma = np.nan_to_num(np.asarray(sigma_array, dtype=np.float64), nan=0.0)
+    T = np.ascontiguousarray(np.broadcast_to(np.asarray(T_array, dtype=np.float64), K.shape))
+    is_call = np.ascontiguousarray(np.broadcast_to(np.asarray(types) == 'call', K.shape))
+    S = float(S)
+    r = RISK_FREE_RATE
+    invalid = (sigma <= 0) | (T <= 0) | ~(K > 0) | (not S > 0)
+
+    if NUMBA_AVAILABLE:
+        delta = np.empty_like(K)
+        gamma = np.empty_like(K)
+        theta = np.empty_like(K)
+        vega = np.empty_like(K)
+        greeks_kernel(S, K, sigma, T, is_call, delta, gamma, theta, vega)
+    else:
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            sqrtT = np.sqrt(T)
+            d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * sqrtT)
+            d2 = d1 - sigma * sqrtT
+            cdf_d1 = norm.cdf(d1)
+            pdf_d1 = norm.pdf(d1)
+
+            delta = np.where(is_call, cdf_d1, cdf_d1 - 1)
+            gamma = np.maximum(pdf_d1 / (S * sigma * sqrtT), 0.0001)
+            decay = -S * pdf_d1 * sigma / (2 * sqrtT)
+            discount = r * K * np.exp(-r * T)
+            theta = np.where(is_call, decay - discount * norm.cdf(d2), decay + discount * norm.cdf(-d2)) / 365  # Daily theta
+            vega = np.maximum(S * pdf_d1 * sqrtT / 100, 0.001)  # Divide by 100 for 1% move
+
+        # Degenerate inputs (no IV, expired, bad strike/spot) fall back to display defaults
+        invalid |= ~np.isfinite(d1)
+        delta = np.where(invalid, np.where(is_call, 0.5, -0.5), delta)
+        gamma = np.where(invalid, 0.001, gamma)
+        theta = np.where(invalid, -0.05, theta)
+        vega = np.where(invalid, 0.01, vega)
+
+    # Debug extremely low deltas for ATM options
+    if S > 0:
+        suspicious = ~invalid & (np.abs(S - K) / S < 0.05) & (np.abs(delta) < 0.1)
+        if suspicious.any():
+            logger.warning(f"⚠️ Suspiciously low delta for {int(suspicious.sum())} ATM options: S={S}, K={K[suspicious].tolist()}")
+
+    return {'delta': delta, 'gamma': gamma, 'theta': theta, 'vega': vega}
+
+def _calculate_greek(name, S, K, sigma, T, option_type):
+    """Scalar back-compat wrapper: 1-element call into calculate_greeks_batch"""
+    if isinstance(T, str):
+        T = precompute_T(T)  # Deprecated: expiration string instead of precomputed years
+    return float(calculate_greeks_batch(S, [K], [sigma], [T], option_type)[name][0])
+
+def calculate_delta(S, K, sigma, T, option_type='call'):
+    """Calculate Delta (sensitivity to stock price)"""
+    try:
+        return _calculate_greek('delta', S, K, sigma, T, option_type)
     except Exception as e:
         logger.error(f"❌ Delta calculation error: {e}")
         return 0.5 if option_type == 'call' else -0.5
 
-def calculate_gamma(S, K, sigma, T_str):
+def calculate_gamma(S, K, sigma, T):
     """Calculate Gamma (rate of change of delta)"""
     try:
-        T = calculate_days_to_expiration(T_str)
-        r = 0.05
-
-        if sigma <= 0 or T <= 0:
-            return 0.001
-
-        d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-        gamma = norm.pdf(d1) / (S * sigma * math.sqrt(T))
-
-        # Ensure minimum non-zero value for display
-        return max(gamma, 0.0001)
+        return _calculate_greek('gamma', S, K, sigma, T, 'call')
     except:
         return 0.001
 
-def calculate_theta(S, K, sigma, T_str, option_type='call'):
+def calculate_theta(S, K, sigma, T, option_type='call'):
     """Calculate Theta (time decay)"""
     try:
-        T = calculate_days_to_expiration(T_str)
-        r = 0.05
-
-        if sigma <= 0 or T <= 0:
-            return -0.05
-
-        d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-        d2 = d1 - sigma * math.sqrt(T)
-
-        if option_type == 'call':
-            theta = (-S * norm.pdf(d1) * sigma / (2 * math.sqrt(T))
-                    - r * K * math.exp(-r * T) * norm.cdf(d2))
-        else:  # put
-            theta = (-S * norm.pdf(d1) * sigma / (2 * math.sqrt(T))
-                    + r * K * math.exp(-r * T) * norm.cdf(-d2))
-
-        return theta / 365  # Daily theta
+        return _calculate_greek('theta', S, K, sigma, T, option_type)
     except:
         return -0.05
 
-def calculate_vega(S, K, sigma, T_str):
+def calculate_vega(S, K, sigma, T):
     """Calculate Vega (sensitivity to volatility)"""
     try:
-        T = calculate_days_to_expiration(T_str)
-        r = 0.05
-
-        if sigma <= 0 or T <= 0:
-            return 0.01
-
-        d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-        vega = S * norm.pdf(d1) * math.sqrt(T) / 100  # Divide by 100 for 1% move
-
-        # Ensure minimum non-zero value for display
-        return max(vega, 0.001)
+        return _calculate_greek('vega', S, K, sigma, T, 'call')
     except:
         return 0.01
 
@@ -205,36 +323,45 @@ def check_memory_circuit_breaker():
 # Max 2 concurrent heavy requests to prevent memory spikes
 REQUEST_SEMAPHORE = asyncio.Semaphore(2)
 
-app = FastAPI(title="xStocks Intel Microservice", version="2.0.0-BL-FRONTIER")
+class AppJSONResponse(ORJSONResponse):
+    """PERFORMANCE FIX: Default response class - orjson bytes (numpy-aware, NaN -> null) with the pandas fallbacks of _json_default"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(title="xStocks Intel Microservice", version="2.0.0-BL-FRONTIER", default_response_class=AppJSONResponse)
 
 # Request rate limiting middleware (prevent API abuse from clients)
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
 class ClientRateLimitMiddleware(BaseHTTPMiddleware):
+    CLEANUP_INTERVAL = 60  # seconds between sweeps of idle IPs
+
     def __init__(self, app, max_requests=100, window_seconds=60):
         super().__init__(app)
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = {}  # ip -> [timestamps]
+        # PERFORMANCE FIX: deque per IP - expired timestamps pop off the left in O(1)
+        self.requests: Dict[str, deque] = defaultdict(deque)  # ip -> deque[monotonic timestamps]
+        self._cleanup_task = None
 
     async def dispatch(self, request, call_next):
+        # Sweep idle IPs from a background task instead of a per-request coin flip
+        if self._cleanup_task is None:
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
         # Get client IP
         client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-
-        # Initialize or get request log for this IP
-        if client_ip not in self.requests:
-            self.requests[client_ip] = []
+        current_time = time.monotonic()
 
         # Remove old requests outside the window
-        self.requests[client_ip] = [
-            ts for ts in self.requests[client_ip]
-            if current_time - ts < self.window_seconds
-        ]
+        timestamps = self.requests[client_ip]
+        cutoff = current_time - self.window_seconds
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
         # Check if limit exceeded
-        if len(self.requests[client_ip]) >= self.max_requests:
+        if len(timestamps) >= self.max_requests:
             return JSONResponse(
                 status_code=429,
                 content={
@@ -245,20 +372,26 @@ class ClientRateLimitMiddleware(BaseHTTPMiddleware):
             )
 
         # Add current request
-        self.requests[client_ip].append(current_time)
-
-        # Clean up old IPs periodically (1% chance)
-        if random.random() < 0.01:
-            self._cleanup(current_time)
+        timestamps.append(current_time)
 
         response = await call_next(request)
         return response
 
+    async def _cleanup_loop(self):
+        """Periodically drop IPs with no requests left in the window"""
+        while True:
+            await asyncio.sleep(self.CLEANUP_INTERVAL)
+            try:
+                self._cleanup(time.monotonic())
+            except Exception as e:
+                logger.warning(f"Rate limiter cleanup failed: {e}")
+
     def _cleanup(self, current_time):
         """Remove old IP entries"""
+        cutoff = current_time - self.window_seconds
         ips_to_remove = [
             ip for ip, timestamps in self.requests.items()
-            if not any(current_time - ts < self.window_seconds for ts in timestamps)
+            if not timestamps or timestamps[-1] <= cutoff
         ]
         for ip in ips_to_remove:
             del self.requests[ip]
@@ -307,6 +440,8 @@ app.add_middleware(
 )
 
 # Redis connection with authentication
+# PERFORMANCE FIX: redis.asyncio client - cache I/O no longer blocks the event loop.
+# The connection is verified (ping) in the startup hook, see connect_redis().
 redis_client = None
 try:
     import os
@@ -317,15 +452,15 @@ try:
 
     # Prefer REDIS_URL if provided (Upstash format)
     if redis_url:
-        redis_client = redis.from_url(redis_url, decode_responses=True)
+        redis_client = aredis.from_url(redis_url, decode_responses=False)
         logger.info(f"Connecting to Redis via URL: {redis_url.split('@')[1] if '@' in redis_url else redis_url}")
     elif redis_password:
-        redis_client = redis.Redis(
+        redis_client = aredis.Redis(
             host=redis_host,
             port=redis_port,
             db=0,
             password=redis_password,
-            decode_responses=True,
+            decode_responses=False,
             ssl=True,  # Upstash requires SSL
             ssl_cert_reqs=None  # Don't verify SSL cert for Upstash
         )
@@ -333,13 +468,22 @@ try:
     else:
         logger.warning("No Redis configuration found - using in-memory caching")
         raise Exception("No Redis config")
-
-    redis_client.ping()
-    logger.info("✅ Redis connected successfully")
 except Exception as e:
     logger.warning(f"Redis not available ({e}), using in-memory caching")
     redis_client = None
 
+async def connect_redis():
+    """Ping Redis on startup; fall back to in-memory caching if it's unreachable"""
+    global redis_client
+    if redis_client is None:
+        return
+    try:
+        await redis_client.ping()
+        logger.info("✅ Redis connected successfully")
+    except Exception as e:
+        logger.warning(f"Redis not available ({e}), using in-memory caching")
+        redis_client = None
+
 # Global flag to prevent concurrent unusual activity scans
 _scanning_in_progress = False
 
@@ -360,6 +504,8 @@ def load_xstock_mappings():
 
 # Official xStock symbol mapping (63 stocks)
 STOCK_SYMBOLS = load_xstock_mappings()
+# PERFORMANCE FIX: Yahoo-form tickers (dots -> dashes) computed once instead of .replace() on every fetch
+STOCK_SYMBOLS_YF = {xstock: ticker.replace('.', '-') for xstock, ticker in STOCK_SYMBOLS.items()}
 
 def normalize_symbol(symbol: str) -> str:
     """
@@ -419,26 +565,70 @@ RATE_LIMIT_DELAY = 15.0  # 15 seconds between requests (ultra conservative)
 MAX_RETRIES = 2
 BASE_BACKOFF = 15.0
 
+YAHOO_HOST = "query1.finance.yahoo.com"
+YAHOO_BURST = 8  # Max concurrent requests a host bucket lets through before spacing kicks in
+
 # Rate limiting state
-last_request_time = 0
 request_count = 0
 
-async def smart_rate_limit():
-    """Conservative rate limiting with jitter to avoid Yahoo Finance rate limits"""
-    global last_request_time, request_count
-    current_time = time.time()
-    time_since_last_request = current_time - last_request_time
-
-    # Add significant jitter to avoid synchronized requests
-    jitter = random.uniform(5.0, 10.0)
-    required_delay = RATE_LIMIT_DELAY + jitter
-
-    if time_since_last_request < required_delay:
-        sleep_time = required_delay - time_since_last_request
-        logger.info(f"Rate limiting: waiting {sleep_time:.2f}s before next request")
-        await asyncio.sleep(sleep_time)
+class TokenBucket:
+    """
+    PERFORMANCE FIX: Async token bucket on time.monotonic() (immune to wall-clock jumps).
+    One bucket per upstream host, so independent Yahoo endpoints don't throttle each other.
+    """
 
-    last_request_time = time.time()
+    def __init__(self, rate: float, burst: int, jitter: tuple = (5.0, 10.0)):
+        self.rate = rate  # tokens per second
+        self.burst = burst
+        self.jitter = jitter  # extra random wait (seconds) once the bucket is empty
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        # Guards the reservation only - never held while sleeping, so it's safe from threads and the loop
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token (borrowing against future refill if empty) and return how long to wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            # Add jitter to avoid synchronized requests
+            return -self.tokens / self.rate + random.uniform(*self.jitter)
+
+    async def acquire(self):
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limiting: waiting {sleep_time:.2f}s before next request")
+            await asyncio.sleep(sleep_time)
+
+    def acquire_blocking(self):
+        """Same as acquire() for worker threads running blocking yfinance calls"""
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+
+# host (URL origin) -> TokenBucket
+rate_limit_buckets: Dict[str, TokenBucket] = defaultdict(lambda: TokenBucket(1.0 / RATE_LIMIT_DELAY, YAHOO_BURST))
+
+# PERFORMANCE FIX: Throughput-oriented buckets for the bulk dashboard fetches - pace by tokens/second
+# (with backoff on 429) instead of capping concurrency with a fixed worker count
+YAHOO_CHART_RATE = 30.0    # chart endpoint requests per second (aiohttp index/history fetches)
+YAHOO_INFO_RATE = 10.0     # yfinance quoteSummary/earnings calls per second (stock fan-out threads)
+YAHOO_429_MAX_RETRIES = 4
+yahoo_chart_limiter = TokenBucket(YAHOO_CHART_RATE, int(YAHOO_CHART_RATE), jitter=(0.0, 0.05))
+yahoo_info_limiter = TokenBucket(YAHOO_INFO_RATE, int(YAHOO_INFO_RATE), jitter=(0.0, 0.1))
+
+def rate_limited_backoff(attempt: int) -> float:
+    """Exponential backoff after a 429: 1, 2, 4 ... capped at 60s, plus up to 1s of jitter"""
+    return min(60, 2 ** attempt) + random.uniform(0, 1)
+
+async def smart_rate_limit(host: str = YAHOO_HOST):
+    """Conservative per-host rate limiting to avoid Yahoo Finance rate limits"""
+    global request_count
+    await rate_limit_buckets[host].acquire()
     request_count += 1
 
 async def fetch_with_retry(func, *args, **kwargs):
@@ -456,15 +646,72 @@ async def fetch_with_retry(func, *args, **kwargs):
             logger.error(f"Max retries exceeded for {args[0] if args else 'unknown'}: {e}")
             raise
 
+# PERFORMANCE FIX: In-flight request coalescing - concurrent callers for the same fetch share one
+# upstream call instead of stampeding Yahoo on a cache miss
+_inflight: Dict[tuple, asyncio.Future] = {}
+inflight_stats = {'cached_dedupe': 0}
+
+def coalesce_inflight(func):
+    """Decorator: while a call with identical args is running, later callers await its result"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        fut = _inflight.get(key)
+        if fut is not None:
+            inflight_stats['cached_dedupe'] += 1
+            logger.info(f"🔗 Coalesced duplicate in-flight {func.__name__}{args}")
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        _inflight[key] = fut
+        try:
+            result = await func(*args, **kwargs)
+            fut.set_result(result)
+            return result
+        except Exception as e:
+            fut.set_exception(e)
+            # Mark retrieved so an exception with no waiters doesn't log "never retrieved"
+            fut.exception()
+            raise
+        finally:
+            # Leader cancelled (CancelledError is a BaseException): release followers instead of hanging them
+            if not fut.done():
+                fut.cancel()
+            del _inflight[key]
+    return wrapper
+
+# PERFORMANCE FIX: One bounded gather over every symbol instead of fixed batches of 10/50 - a slow
+# symbol holds a single slot rather than stalling the rest of its batch (head-of-line blocking)
+SYMBOL_FETCH_CONCURRENCY = 32
+
+async def gather_bounded(coros, limit: int = SYMBOL_FETCH_CONCURRENCY, return_exceptions: bool = False) -> list:
+    """asyncio.gather with at most `limit` of the coroutines running at once (results in input order)"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def guarded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(guarded(coro) for coro in coros), return_exceptions=return_exceptions)
+
 # In-memory cache for when Redis is not available
-_memory_cache: Dict[str, Tuple[Any, float]] = {}  # key -> (data, expiration_timestamp)
+# PERFORMANCE FIX: Bounded TTLCache buckets (one per TTL) instead of an unbounded dict -
+# expired entries are evicted on insert and total size is capped
+MEMORY_CACHE_MAXSIZE = 10_000
+_memory_cache: Dict[int, TTLCache] = {}  # ttl_seconds -> TTLCache(key -> data)
+
+def _memory_cache_bucket(ttl_seconds: int) -> TTLCache:
+    """Get (or create) the in-memory cache bucket for a TTL"""
+    bucket = _memory_cache.get(ttl_seconds)
+    if bucket is None:
+        bucket = _memory_cache[ttl_seconds] = TTLCache(maxsize=MEMORY_CACHE_MAXSIZE, ttl=ttl_seconds)
+    return bucket
 
 # ============================================================================
 # COMPREHENSIVE INTEL CACHE STRUCTURES (Merged from comprehensive_intel_service.py)
 # ============================================================================
 
-# Period-aware cache for stock data to prevent timeouts
-# MEMORY OPTIMIZED: Increased to 15 min to align with frontend polling + async cache
+# Period-aware cache for stock data to prevent timeouts (TTL per period via period_cache_ttl)
 _stock_data_cache = {
     '1d': {'data': None, 'timestamp': 0},
     '1w': {'data': None, 'timestamp': 0},
@@ -472,12 +719,62 @@ _stock_data_cache = {
     '3mo': {'data': None, 'timestamp': 0},
     'ytd': {'data': None, 'timestamp': 0},
     '1y': {'data': None, 'timestamp': 0},
-    'cache_duration': 900  # 15 minute cache (increased from 5 min to reduce refetch load)
 }
 
-# Cache for indices data (NO CHART DATA) - 1 hour cache
+# Cache for indices data (NO CHART DATA) - TTL per period via period_cache_ttl
 _indices_data_cache = {}  # Period-specific cache dictionary
 
+# PERFORMANCE FIX: TTL tiered by period - intraday views refresh fast, long horizons only change daily
+TTL_BY_PERIOD = {'1d': 60, '1w': 300, '1m': 900, '1mo': 900, '3m': 3600, '3mo': 3600, 'ytd': 3600, '1y': 14400}
+OFF_HOURS_TTL_MULTIPLIER = 10
+
+def is_us_market_open() -> bool:
+    """Regular US session: weekdays 09:30-16:00 America/New_York (holidays not considered)"""
+    now = pd.Timestamp.now(tz='America/New_York')
+    minutes = now.hour * 60 + now.minute
+    return now.weekday() < 5 and 570 <= minutes < 960
+
+def period_cache_ttl(period_key: str) -> int:
+    """Cache TTL in seconds for a dashboard period, x10 outside market hours"""
+    ttl = TTL_BY_PERIOD.get(period_key, 300)
+    return ttl if is_us_market_open() else ttl * OFF_HOURS_TTL_MULTIPLIER
+
+# PERFORMANCE FIX: Disk-backed copy of the stock/indices caches so a restarted worker serves warm data
+# instead of refetching every symbol. Entries are versioned orjson blobs (no pickle), expired by diskcache.
+DISK_CACHE_DIR = os.getenv('XSTOCK_CACHE_DIR', '/tmp/xstock_cache')
+DISK_CACHE_VERSION = 1
+try:
+    _disk_cache = diskcache.Cache(DISK_CACHE_DIR, size_limit=2**30)
+except Exception as e:
+    logger.warning(f"⚠️ Disk cache unavailable at {DISK_CACHE_DIR}, persistence disabled: {e}")
+    _disk_cache = None
+
+def disk_cache_store(namespace: str, key: str, data: Any, timestamp: float, ttl: float):
+    """Persist one cache entry (payload + its cache timestamp) for warm restarts"""
+    if _disk_cache is None:
+        return
+    try:
+        blob = cache_dumps({'v': DISK_CACHE_VERSION, 'timestamp': timestamp, 'data': data})
+        _disk_cache.set(f"{namespace}:{key}", blob, expire=ttl)
+    except Exception as e:
+        logger.debug(f"Disk cache write failed for {namespace}:{key}: {e}")
+
+def disk_cache_load(namespace: str, key: str) -> Optional[dict]:
+    """Load a persisted entry as {'data', 'timestamp'} (None if missing, expired or from another version)"""
+    if _disk_cache is None:
+        return None
+    try:
+        blob = _disk_cache.get(f"{namespace}:{key}")
+        if blob is None:
+            return None
+        entry = orjson.loads(blob)
+        if entry.get('v') != DISK_CACHE_VERSION:
+            return None
+        return {'data': entry['data'], 'timestamp': entry['timestamp']}
+    except Exception as e:
+        logger.debug(f"Disk cache read failed for {namespace}:{key}: {e}")
+        return None
+
 # Cache for index charts (reduced to 5 min) - key format: "{symbol}_{period}"
 _index_chart_cache = {'cache_duration': 300}
 
@@ -577,26 +874,140 @@ MARKET_CAP_MAPPING = {
     'SPY': 500e9, 'QQQ': 200e9, 'JETS': 5e9
 }
 
+# PERFORMANCE FIX: Static mappings frozen at import; symbols (sorted) and market caps packed into
+# parallel arrays for the vectorized market-cap screen
+STOCK_SECTOR_MAPPING = MappingProxyType(STOCK_SECTOR_MAPPING)
+MARKET_CAP_MAPPING = MappingProxyType(MARKET_CAP_MAPPING)
+SYMBOL_ARR = np.array(sorted(set(STOCK_SECTOR_MAPPING) | set(MARKET_CAP_MAPPING)))
+MCAP_ARR = np.array([MARKET_CAP_MAPPING.get(sym, 0.0) for sym in SYMBOL_ARR.tolist()], dtype=np.float64)
+
+# PERFORMANCE FIX: Read-only config serialized once at import, served as raw bytes
+_SYMBOLS_JSON = orjson.dumps(STOCK_SYMBOLS)
+_SECTORS_JSON = orjson.dumps(dict(STOCK_SECTOR_MAPPING))
+_INDICES_JSON = orjson.dumps(COMPREHENSIVE_INDICES)
+
+def top_n_indices(values, n: int, largest: bool = True) -> np.ndarray:
+    """
+    PERFORMANCE FIX: Indices of the n largest (or smallest) values, best first.
+    O(N) np.argpartition selection, then only the n winners are sorted.
+    """
+    keys = -np.asarray(values, dtype=np.float64) if largest else np.asarray(values, dtype=np.float64)
+    n = min(n, keys.size)
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(keys, n - 1)[:n] if n < keys.size else np.arange(keys.size)
+    return top[np.argsort(keys[top], kind='stable')]
+
+def top_symbols_by_market_cap(n: int, universe: Optional[List[str]] = None) -> List[str]:
+    """Top-n tickers by static market cap (argpartition, optionally restricted to a universe)"""
+    caps = MCAP_ARR if universe is None else np.where(np.isin(SYMBOL_ARR, universe), MCAP_ARR, -np.inf)
+    top = top_n_indices(caps, min(n, int(np.isfinite(caps).sum())))
+    return SYMBOL_ARR[top].tolist()
+
 
 # Cache functions
+CACHE_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+EMPTY_JSON_PAYLOADS = frozenset((b'null', b'{}', b'[]', b'""', b'false', b'0'))
+
+def cache_dumps(data: Any) -> bytes:
+    """PERFORMANCE FIX: orjson encoding for cache payloads (C-level, handles numpy natively)"""
+    return orjson.dumps(data, default=str, option=CACHE_JSON_OPTIONS)
+
+# PERFORMANCE FIX: Redis payloads above ZSTD_MIN_BYTES are stored zstd-compressed (JSON shrinks ~4-8x at
+# level 3), cutting Redis memory and transfer for heatmap/chart blobs. Small payloads stay plain JSON, and
+# reads sniff the zstd frame magic so entries written before this change still load.
+ZSTD_MIN_BYTES = 4096
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# Only used from the event loop thread (the async Redis helpers), so sharing one (de)compressor is safe
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+_zstd_decompressor = zstandard.ZstdDecompressor()
+
+def redis_pack(data: Any) -> bytes:
+    """Encode a payload for Redis: orjson bytes, zstd-compressed when large"""
+    blob = cache_dumps(data)
+    return _zstd_compressor.compress(blob) if len(blob) >= ZSTD_MIN_BYTES else blob
+
+def redis_unpack(raw: bytes) -> bytes:
+    """Redis value back to JSON bytes (decompressing zstd frames)"""
+    return _zstd_decompressor.decompress(raw) if raw[:4] == ZSTD_MAGIC else raw
+
+def _json_default(obj: Any):
+    """orjson fallback for the few pandas scalars it can't encode natively"""
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def orjson_response(data: Any, status_code: int = 200) -> Response:
+    """
+    PERFORMANCE FIX: Serialize straight to bytes with orjson - numpy scalars/arrays encode natively
+    and NaN/Inf become null, so no recursive clean_data_for_json pass is needed first
+    """
+    return Response(
+        content=orjson.dumps(data, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
 async def get_cache(key: str):
     """Get data from cache (Redis or in-memory fallback)"""
     if redis_client:
         try:
-            cached = redis_client.get(key)
+            cached = await redis_client.get(key)
             if cached:
-                return json.loads(cached)
+                return orjson.loads(redis_unpack(cached))
         except:
             pass
 
     # Fallback to in-memory cache
-    if key in _memory_cache:
-        data, expiration = _memory_cache[key]
-        if time.time() < expiration:
+    for bucket in _memory_cache.values():
+        data = bucket.get(key)
+        if data is not None:
             return data
-        else:
-            # Expired, remove from cache
-            del _memory_cache[key]
+
+    return None
+
+async def mget_cache(keys: List[str]) -> List[Any]:
+    """Get many keys in one Redis MGET round-trip (None for misses), in-memory fallback otherwise"""
+    if redis_client and keys:
+        try:
+            return [orjson.loads(redis_unpack(raw)) if raw else None for raw in await redis_client.mget(keys)]
+        except:
+            pass
+
+    results = []
+    for key in keys:
+        data = None
+        for bucket in _memory_cache.values():
+            data = bucket.get(key)
+            if data is not None:
+                break
+        results.append(data)
+    return results
+
+async def get_cache_response(key: str) -> Optional[Response]:
+    """
+    PERFORMANCE FIX: Cache hit as a ready-to-send response. Redis holds the payload already encoded (and
+    NaN-cleaned) by orjson, so those bytes go out as-is (after zstd decompression) - no JSON decode, jsonable_encoder walk or re-encode.
+    Empty payloads count as a miss, like the `if cached:` checks this replaces.
+    """
+    if redis_client:
+        try:
+            raw = await redis_client.get(key)
+            if raw:
+                raw = redis_unpack(raw)
+            if raw and raw not in EMPTY_JSON_PAYLOADS:
+                return Response(content=raw, media_type="application/json")
+        except:
+            pass
+
+    # Fallback to in-memory cache
+    for bucket in _memory_cache.values():
+        data = bucket.get(key)
+        if data:
+            return orjson_response(data)
 
     return None
 
@@ -604,36 +1015,195 @@ async def set_cache(key: str, data: Any, ttl_seconds: int = 300):
     """Set data in cache (Redis or in-memory fallback)"""
     if redis_client:
         try:
-            redis_client.setex(key, ttl_seconds, json.dumps(data, default=str))
+            await redis_client.setex(key, ttl_seconds, redis_pack(data))
             return
         except:
             pass
 
-    # Fallback to in-memory cache
-    expiration = time.time() + ttl_seconds
-    _memory_cache[key] = (data, expiration)
+    # Fallback to in-memory cache (drop any copy held under a different TTL)
+    for bucket_ttl, bucket in _memory_cache.items():
+        if bucket_ttl != ttl_seconds:
+            bucket.pop(key, None)
+    _memory_cache_bucket(ttl_seconds)[key] = data
     logger.info(f"💾 Cached {key} in memory (TTL: {ttl_seconds}s)")
 
+async def set_cache_many(items: Dict[str, Any], ttl_seconds: int = 300):
+    """Set several cache keys in one Redis round-trip (pipeline), in-memory fallback otherwise"""
+    if redis_client:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, data in items.items():
+                    pipe.setex(key, ttl_seconds, redis_pack(data))
+                await pipe.execute()
+            return
+        except:
+            pass
+
+    for key, data in items.items():
+        await set_cache(key, data, ttl_seconds)
+
+# PERFORMANCE FIX: Stale-while-revalidate - payloads live SWR_HARD_TTL_MULTIPLIER x TTL and a companion
+# "<key>:fresh" marker expires at TTL. Once the marker is gone the last-good payload is still served
+# immediately while one background task rebuilds it, so no request waits on a cold fetch at expiry and
+# a failing Yahoo refresh keeps serving the previous value until the hard expiry.
+SWR_HARD_TTL_MULTIPLIER = 2
+_swr_refreshing: Dict[str, asyncio.Task] = {}
+
+def _swr_fresh_key(key: str) -> str:
+    return f"{key}:fresh"
+
+async def get_cache_swr_response(key: str) -> Tuple[Optional[Response], bool]:
+    """Cached payload as a response plus whether it is still fresh - one MGET round-trip on Redis"""
+    if redis_client:
+        try:
+            raw, fresh = await redis_client.mget(key, _swr_fresh_key(key))
+            if raw:
+                raw = redis_unpack(raw)
+            if raw and raw not in EMPTY_JSON_PAYLOADS:
+                return Response(content=raw, media_type="application/json"), fresh is not None
+        except:
+            pass
+
+    # Fallback to in-memory cache
+    fresh_key = _swr_fresh_key(key)
+    for bucket in _memory_cache.values():
+        data = bucket.get(key)
+        if data:
+            return orjson_response(data), any(fresh_key in b for b in _memory_cache.values())
+
+    return None, False
+
+async def set_cache_swr(key: str, data: Any, ttl_seconds: int):
+    """Store a payload for SWR serving: data kept for the hard TTL, freshness marker for ttl_seconds"""
+    hard_ttl = ttl_seconds * SWR_HARD_TTL_MULTIPLIER
+    if redis_client:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(key, hard_ttl, redis_pack(data))
+                pipe.setex(_swr_fresh_key(key), ttl_seconds, b'1')
+                await pipe.execute()
+            return
+        except:
+            pass
+
+    await set_cache(key, data, hard_ttl)
+    await set_cache(_swr_fresh_key(key), True, ttl_seconds)
+
+async def _swr_refresh(key: str, ttl_seconds: int, builder):
+    """Background rebuild of a stale entry; on failure the last-good payload keeps being served"""
+    try:
+        await set_cache_swr(key, await builder(), ttl_seconds)
+        logger.info(f"🔄 Refreshed stale cache entry {key} in background")
+    except Exception as e:
+        logger.warning(f"⚠️ Background refresh failed for {key}, serving last-good data: {e}")
+    finally:
+        _swr_refreshing.pop(key, None)
+
+async def cached_swr(key: str, ttl_seconds: int, builder):
+    """
+    Serve `key` with stale-while-revalidate: fresh hits return as-is, stale hits return immediately and
+    schedule a single background rebuild, misses await builder() and cache its result
+    """
+    cached, fresh = await get_cache_swr_response(key)
+    if cached is not None:
+        if not fresh and key not in _swr_refreshing:
+            _swr_refreshing[key] = asyncio.create_task(_swr_refresh(key, ttl_seconds, builder))
+        return cached
+
+    result = await builder()
+    await set_cache_swr(key, result, ttl_seconds)
+    # Encoded directly - skips FastAPI's jsonable_encoder walk over the (large) fresh payload
+    return orjson_response(result)
+
 # Utility functions
 def clean_yahoo_symbol(symbol: str) -> str:
     """Clean symbol for Yahoo Finance URLs"""
     return symbol.replace('.', '-')
 
 def map_xstock_to_symbol(xstock_symbol: str) -> Optional[str]:
-    """Map xStock symbol to real stock symbol"""
-    real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
-    if real_symbol:
-        return clean_yahoo_symbol(real_symbol)
-    return None
+    """Map xStock symbol to real stock symbol (Yahoo form, precomputed in STOCK_SYMBOLS_YF)"""
+    return STOCK_SYMBOLS_YF.get(xstock_symbol)
 
 # Core implementation functions - simplified approach based on yfinance best practices
+# PERFORMANCE FIX: Direct async Yahoo chart API for OHLCV - no blocking yfinance call on the event loop
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"}
+DAILY_OR_LONGER_INTERVALS = {'1d', '5d', '1wk', '1mo', '3mo'}
+_http_session: Optional[aiohttp.ClientSession] = None
+
+# PERFORMANCE FIX: Dedicated pool for blocking yfinance/Yahoo I/O - sized for network waits instead of the
+# default executor's min(32, cpu+4) threads, so concurrent endpoints don't queue behind each other
+YF_POOL_WORKERS = 64
+YF_POOL = ThreadPoolExecutor(max_workers=YF_POOL_WORKERS, thread_name_prefix="yf")
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Shared pooled aiohttp session (created lazily inside the running loop)"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            headers=YAHOO_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+        )
+    return _http_session
+
+async def _yahoo_chart(real_symbol: str, period: str, interval: str) -> Dict[str, np.ndarray]:
+    """
+    Fetch OHLCV from Yahoo's v8 chart endpoint straight into numpy arrays.
+    Prices are adjusted like yfinance's auto_adjust, daily+ bars are stamped at exchange midnight.
+    """
+    session = await get_http_session()
+    params = {"range": period, "interval": interval, "includePrePost": "false", "events": "div,splits"}
+    for attempt in range(YAHOO_429_MAX_RETRIES + 1):
+        await yahoo_chart_limiter.acquire()
+        async with session.get(YAHOO_CHART_URL.format(symbol=real_symbol), params=params) as resp:
+            if resp.status == 429 and attempt < YAHOO_429_MAX_RETRIES:
+                backoff = rate_limited_backoff(attempt)
+                logger.warning(f"⏳ Yahoo 429 for {real_symbol}, backing off {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                continue
+            resp.raise_for_status()
+            payload = orjson.loads(await resp.read())
+            break
+
+    chart = payload.get('chart') or {}
+    if chart.get('error') or not chart.get('result'):
+        raise ValueError(f"Yahoo chart error for {real_symbol}: {chart.get('error')}")
+
+    result = chart['result'][0]
+    timestamps = np.asarray(result.get('timestamp') or [], dtype=np.int64)
+    quote = result['indicators']['quote'][0]
+    o, h, l, c, v = (np.array(quote.get(k) or [], dtype=np.float64) for k in ('open', 'high', 'low', 'close', 'volume'))
+
+    adjclose = (result['indicators'].get('adjclose') or [{}])[0].get('adjclose')
+    if adjclose:
+        adj = np.array(adjclose, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = adj / c
+        o, h, l, c = o * ratio, h * ratio, l * ratio, adj
+
+    if interval in DAILY_OR_LONGER_INTERVALS:
+        gmtoffset = int(result.get('meta', {}).get('gmtoffset', 0))
+        timestamps = (timestamps + gmtoffset) // 86400 * 86400 - gmtoffset
+
+    valid = ~np.isnan(c)
+    return {
+        'timestamp': timestamps[valid],
+        'open': o[valid],
+        'high': h[valid],
+        'low': l[valid],
+        'close': c[valid],
+        'volume': np.nan_to_num(v[valid]).astype(np.int64)
+    }
+
+@coalesce_inflight
 async def fetch_realtime_data_impl(symbol: str, real_symbol: str):
     """Implementation function for fetching real-time data using yfinance correctly"""
     try:
         logger.info(f"Fetching real-time data for {real_symbol} (attempt {request_count + 1})")
 
         # Use yfinance the simple way - let it manage its own sessions
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
 
         # Get historical data for past few days to calculate changes
         hist = ticker.history(period="5d", interval="1d", timeout=30)
@@ -698,166 +1268,440 @@ async def fetch_realtime_data_impl(symbol: str, real_symbol: str):
         raise
 
 
+def points_from_arrays(times, vals, colors: bool = False) -> list:
+    """Build [{"time", "value"}] chart points from epoch-second and value arrays, skipping NaNs"""
+    vals = np.asarray(vals)
+    if vals.dtype == np.float32:
+        # Trim float32 -> float64 representation noise (101.23999786... -> 101.24)
+        vals = np.round(vals.astype(np.float64), 4)
+    vals = np.asarray(vals, dtype=np.float64)
+    mask = ~np.isnan(vals)
+    times = np.asarray(times)[mask].tolist()
+    vals = vals[mask]
+    if colors:
+        bar_colors = np.where(vals >= 0, "#26a69a", "#ef5350").tolist()
+        return [{"time": t, "value": v, "color": c} for t, v, c in zip(times, vals.tolist(), bar_colors)]
+    return [{"time": t, "value": v} for t, v in zip(times, vals.tolist())]
+
+def series_to_points(series: pd.Series, colors: bool = False) -> list:
+    """
+    PERFORMANCE FIX: Convert an indicator series to [{"time", "value"}] without a per-row pd.isna loop.
+    NaNs are dropped once and epoch seconds are taken from the index in one vectorized op.
+    """
+    return points_from_arrays(series.index.as_unit('ns').asi8 // 10**9, series.to_numpy(dtype=np.float64), colors)
+
+def nanlist(a: np.ndarray) -> list:
+    """Float array -> list of Python floats with NaN as None (JSON null), in one masked pass"""
+    o = a.astype(object)
+    o[np.isnan(a)] = None
+    return o.tolist()
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing moving average (NaN until the window is full)"""
+    if window > x.size:
+        return np.full(x.size, np.nan)
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_mean(x, window, min_count=window)
+    out = np.full(x.size, np.nan, dtype=np.result_type(x.dtype, np.float32))
+    out[window - 1:] = sliding_window_view(x, window).mean(axis=1)
+    return out
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample standard deviation (ddof=1, same as pandas rolling std)"""
+    if window > x.size:
+        return np.full(x.size, np.nan)
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_std(x, window, min_count=window, ddof=1)
+    out = np.full(x.size, np.nan)
+    out[window - 1:] = sliding_window_view(x, window).std(axis=1, ddof=1)
+    return out
+
+def max_drawdown_from_growth(cumulative: np.ndarray) -> float:
+    """
+    PERFORMANCE FIX: Deepest peak-to-trough drop of a cumulative growth curve (-0.25 == -25%) from one
+    np.fmax.accumulate running peak instead of pandas expanding().max() window machinery (NaNs skipped)
+    """
+    cumulative = np.asarray(cumulative, dtype=np.float64)
+    if not np.isfinite(cumulative).any():
+        return float('nan')
+    peak = np.fmax.accumulate(cumulative)
+    return float(np.nanmin(cumulative / peak - 1.0))
+
+@njit(cache=True, fastmath=True)
+def ewma(x, alpha, out):
+    """In-place EWMA recurrence s = alpha*x + (1-alpha)*s_prev (pandas ewm adjust=False)"""
+    s = x[0]
+    out[0] = s
+    for i in range(1, x.size):
+        s = alpha * x[i] + (1.0 - alpha) * s
+        out[i] = s
+
+@njit(cache=True, fastmath=True)
+def macd_kernel(close, fast_alpha, slow_alpha, signal_alpha, ema_fast, ema_slow, signal):
+    """Fast EMA, slow EMA and MACD signal line in a single pass (pandas ewm adjust=False recurrence)"""
+    ef = close[0]
+    es = close[0]
+    sg = ef - es
+    ema_fast[0] = ef
+    ema_slow[0] = es
+    signal[0] = sg
+    for i in range(1, close.size):
+        ef = fast_alpha * close[i] + (1.0 - fast_alpha) * ef
+        es = slow_alpha * close[i] + (1.0 - slow_alpha) * es
+        sg = signal_alpha * (ef - es) + (1.0 - signal_alpha) * sg
+        ema_fast[i] = ef
+        ema_slow[i] = es
+        signal[i] = sg
+
+@njit(cache=True)
+def bollinger_kernel(close, window):
+    """
+    Rolling mean and sample std (ddof=1) in one O(N) pass - sliding Welford update,
+    so large price levels don't cancel the way sum/sum-of-squares does. NaN until the window is full.
+    """
+    n = close.size
+    mid = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if window < 2 or n < window:
+        return mid, std
+    mean = 0.0
+    m2 = 0.0
+    for i in range(window):
+        delta = close[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (close[i] - mean)
+    mid[window - 1] = mean
+    std[window - 1] = np.sqrt(max(m2, 0.0) / (window - 1))
+    for i in range(window, n):
+        x_new = close[i]
+        x_old = close[i - window]
+        new_mean = mean + (x_new - x_old) / window
+        m2 += (x_new - x_old) * (x_new - new_mean + x_old - mean)
+        mean = new_mean
+        mid[i] = mean
+        std[i] = np.sqrt(max(m2, 0.0) / (window - 1))
+    return mid, std
+
+@njit(cache=True)
+def sliding_max(x, window):
+    """Trailing rolling max via a monotonic deque - O(N) regardless of window. NaN until the window is full."""
+    n = x.size
+    out = np.full(n, np.nan)
+    dq = np.empty(n, dtype=np.int64)  # head/tail only ever advance, so no wrap-around needed
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and x[dq[tail - 1]] <= x[i]:
+            tail -= 1
+        dq[tail] = i
+        tail += 1
+        if dq[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = x[dq[head]]
+    return out
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling max (pandas min_periods=window semantics); deque kernel when there are no gaps"""
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if window >= 1 and np.isfinite(x).all():
+        return sliding_max(x, window)
+    return pd.Series(x).rolling(window).max().to_numpy()
+
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling min - rolling_max on the negated series"""
+    return -rolling_max(-np.asarray(x, dtype=np.float64), window)
+
+def rolling_mean_std(close: np.ndarray, window: int):
+    """Trailing mean and sample std (pandas rolling semantics); fused Numba pass when there are no gaps"""
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    if window >= 2 and np.isfinite(close).all():
+        return bollinger_kernel(close, window)
+    roll = pd.Series(close).rolling(window)
+    return roll.mean().to_numpy(), roll.std().to_numpy()
+
+@njit(cache=True)
+def rsi_wilder(close, period):
+    """Wilder RSI in one O(N) pass: SMA seed over the first period, then alpha=1/period smoothing"""
+    n = close.size
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            d = close[i] - close[i - 1]
+            avg_gain = (avg_gain * (period - 1) + max(d, 0.0)) / period
+            avg_loss = (avg_loss * (period - 1) + max(-d, 0.0)) / period
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            out[i] = 100.0
+    return out
+
+@njit(cache=True)
+def rsi_last(close, period):
+    """Latest Wilder RSI only - same recurrence as rsi_wilder without allocating the series"""
+    n = close.size
+    if n <= period:
+        return np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+    for i in range(period + 1, n):
+        d = close[i] - close[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(d, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-d, 0.0)) / period
+    if avg_loss > 0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if avg_gain > 0:
+        return 100.0
+    return np.nan
+
+@njit(cache=True)
+def macd_last(close, fast_alpha, slow_alpha, signal_alpha):
+    """Latest (macd, signal, histogram) from the macd_kernel recurrence, no intermediate arrays"""
+    ef = close[0]
+    es = close[0]
+    sg = 0.0
+    for i in range(1, close.size):
+        ef = fast_alpha * close[i] + (1.0 - fast_alpha) * ef
+        es = slow_alpha * close[i] + (1.0 - slow_alpha) * es
+        sg = signal_alpha * (ef - es) + (1.0 - signal_alpha) * sg
+    return ef - es, sg, ef - es - sg
+
+@njit(cache=True)
+def compute_ma_bb(closes):
+    """
+    SMA20/50/200 plus 20-bar Bollinger mean/std (population) in one backward sweep.
+    Each SMA falls back to the full-history mean when there are fewer bars; bb_std is NaN below 20 bars.
+    """
+    n = closes.size
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+    total = 0.0
+    s20 = 0.0
+    s50 = 0.0
+    s200 = 0.0
+    for k in range(n):
+        v = closes[n - 1 - k]
+        total += v
+        if k < 20:
+            s20 += v
+        if k < 50:
+            s50 += v
+        if k < 200:
+            s200 += v
+    sma20 = s20 / 20 if n >= 20 else total / n
+    sma50 = s50 / 50 if n >= 50 else total / n
+    sma200 = s200 / 200 if n >= 200 else total / n
+
+    bb_std = np.nan
+    if n >= 20:
+        ss = 0.0
+        for k in range(n - 20, n):
+            d = closes[k] - sma20
+            ss += d * d
+        bb_std = np.sqrt(ss / 20)
+    return sma20, sma50, sma200, sma20, bb_std
+
+def rsi_from_close(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """RSI (Wilder smoothing) aligned to close; NaN closes are skipped and stay NaN"""
+    close = np.asarray(close, dtype=np.float64)
+    valid = np.isfinite(close)
+    if valid.all():
+        return rsi_wilder(np.ascontiguousarray(close), period)
+    out = np.full(close.size, np.nan)
+    out[valid] = rsi_wilder(np.ascontiguousarray(close[valid]), period)
+    return out
+
+def compute_all_technicals(close_np: np.ndarray, idx_ns: np.ndarray) -> dict:
+    """
+    PERFORMANCE FIX: Fused SMA/RSI/MACD/Bollinger computation over one Close array.
+    Rolling windows go through bottleneck, the three EMAs share one Numba loop and
+    Bollinger reuses sma20. Returns raw arrays plus epoch-second times.
+    """
+    close = np.asarray(close_np, dtype=np.float64)
+    valid = np.isfinite(close)
+    close = np.ascontiguousarray(close[valid])
+    n = close.size
+    out = {'time': np.asarray(idx_ns)[valid] // 10**9, 'length': n}
+    if n == 0:
+        return out
+
+    # Moving averages run on float32 (half the memory traffic; charts only need ~6 sig-figs).
+    # Std, RSI and the EMA recurrences stay float64 - they are sensitive to cancellation/drift.
+    close32 = close.astype(np.float32)
+    out['sma20'] = rolling_mean(close32, 20)
+    out['sma50'] = rolling_mean(close32, 50)
+    out['sma200'] = rolling_mean(close32, 200)
+    out['std20'] = rolling_std(close, 20)
+    out['bb_upper'] = (out['sma20'] + 2 * out['std20']).astype(np.float32)
+    out['bb_lower'] = (out['sma20'] - 2 * out['std20']).astype(np.float32)
+    out['rsi'] = rsi_from_close(close, 14)
+
+    ema12 = np.empty(n)
+    ema26 = np.empty(n)
+    signal = np.empty(n)
+    macd_kernel(close, 2.0 / 13, 2.0 / 27, 2.0 / 10, ema12, ema26, signal)
+    out['macd'] = ema12 - ema26
+    out['macd_signal'] = signal
+    out['macd_hist'] = out['macd'] - signal
+    return out
+
+def _close_arrays(data: pd.DataFrame):
+    """Close prices and ns timestamps as contiguous arrays"""
+    return data['Close'].to_numpy(dtype=np.float64), data.index.as_unit('ns').asi8
+
+def ohlcv_records(hist: pd.DataFrame) -> list:
+    """
+    PERFORMANCE FIX: [{time, open, high, low, close, volume}] candles via one to_dict('records') over typed
+    columns - no iterrows() row Series or per-row Timestamp.timestamp() calls
+    """
+    candles = hist[['Open', 'High', 'Low', 'Close']].astype(np.float64)
+    candles.columns = ['open', 'high', 'low', 'close']
+    candles.insert(0, 'time', hist.index.as_unit('ns').asi8 // 10**9)
+    candles['volume'] = hist['Volume'].fillna(0).astype(np.int64) if 'Volume' in hist.columns else 0
+    return candles.to_dict('records')
+
 def calculate_sma(data: pd.DataFrame, period: int) -> list:
     """Calculate Simple Moving Average"""
-    sma = data['Close'].rolling(window=period).mean()
-    result = []
-    for index, value in sma.items():
-        if not pd.isna(value):
-            result.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
-    return result
+    close, idx_ns = _close_arrays(data)
+    return points_from_arrays(idx_ns // 10**9, rolling_mean(close.astype(np.float32), period))
 
 def calculate_rsi(data: pd.DataFrame, period: int = 14) -> list:
     """Calculate RSI (Relative Strength Index) indicator"""
-    delta = data['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-
-    result = []
-    for index, value in rsi.items():
-        if not pd.isna(value):
-            result.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
-    return result
+    close, idx_ns = _close_arrays(data)
+    return points_from_arrays(idx_ns // 10**9, rsi_from_close(close, period))
 
 def calculate_macd(data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
     """Calculate MACD (Moving Average Convergence Divergence) indicator"""
-    exp1 = data['Close'].ewm(span=fast, adjust=False).mean()
-    exp2 = data['Close'].ewm(span=slow, adjust=False).mean()
-
-    macd_line = exp1 - exp2
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
-
-    macd_data = []
-    signal_data = []
-    histogram_data = []
-
-    for index, value in macd_line.items():
-        if not pd.isna(value):
-            macd_data.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
-
-    for index, value in signal_line.items():
-        if not pd.isna(value):
-            signal_data.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
-
-    for index, value in histogram.items():
-        if not pd.isna(value):
-            histogram_data.append({
-                "time": int(index.timestamp()),
-                "value": float(value),
-                "color": "#26a69a" if value >= 0 else "#ef5350"
-            })
+    close, idx_ns = _close_arrays(data)
+    valid = np.isfinite(close)
+    close = np.ascontiguousarray(close[valid])
+    times = (idx_ns // 10**9)[valid]
+    ema_fast = np.empty(close.size)
+    ema_slow = np.empty(close.size)
+    signal_line = np.empty(close.size)
+    if close.size:
+        ewma(close, 2.0 / (fast + 1), ema_fast)
+        ewma(close, 2.0 / (slow + 1), ema_slow)
+    macd_line = ema_fast - ema_slow
+    if close.size:
+        ewma(macd_line, 2.0 / (signal + 1), signal_line)
 
     return {
-        "macd": macd_data,
-        "signal": signal_data,
-        "histogram": histogram_data
+        "macd": points_from_arrays(times, macd_line),
+        "signal": points_from_arrays(times, signal_line),
+        "histogram": points_from_arrays(times, macd_line - signal_line, colors=True)
     }
 
 def calculate_bollinger_bands(data: pd.DataFrame, period: int = 20, std_dev: float = 2) -> dict:
     """Calculate Bollinger Bands indicator"""
-    sma = data['Close'].rolling(window=period).mean()
-    rolling_std = data['Close'].rolling(window=period).std()
-
-    upper_band = sma + (rolling_std * std_dev)
-    lower_band = sma - (rolling_std * std_dev)
-
-    upper_data = []
-    middle_data = []
-    lower_data = []
-
-    for index, value in upper_band.items():
-        if not pd.isna(value):
-            upper_data.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
-
-    for index, value in sma.items():
-        if not pd.isna(value):
-            middle_data.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
-
-    for index, value in lower_band.items():
-        if not pd.isna(value):
-            lower_data.append({
-                "time": int(index.timestamp()),
-                "value": float(value)
-            })
+    close, idx_ns = _close_arrays(data)
+    times = idx_ns // 10**9
+    sma = rolling_mean(close, period)
+    band = rolling_std(close, period) * std_dev
 
     return {
-        "upper": upper_data,
-        "middle": middle_data,
-        "lower": lower_data
+        "upper": points_from_arrays(times, sma + band),
+        "middle": points_from_arrays(times, sma),
+        "lower": points_from_arrays(times, sma - band)
     }
 
 def calculate_technicals(hist: pd.DataFrame) -> dict:
     """Calculate technical indicators from historical data"""
     technicals = {}
+    ind = compute_all_technicals(*_close_arrays(hist))
+    times = ind['time']
 
     # Calculate SMAs (20, 50, 200 days)
     if len(hist) >= 20:
-        technicals['sma20'] = calculate_sma(hist, 20)
+        technicals['sma20'] = points_from_arrays(times, ind['sma20'])
 
     if len(hist) >= 50:
-        technicals['sma50'] = calculate_sma(hist, 50)
+        technicals['sma50'] = points_from_arrays(times, ind['sma50'])
 
     if len(hist) >= 200:
-        technicals['sma200'] = calculate_sma(hist, 200)
+        technicals['sma200'] = points_from_arrays(times, ind['sma200'])
 
     # Calculate RSI (14 periods)
     if len(hist) >= 15:
-        technicals['rsi'] = calculate_rsi(hist, 14)
+        technicals['rsi'] = points_from_arrays(times, ind['rsi'])
 
     # Calculate MACD (12, 26, 9)
     if len(hist) >= 26:
-        technicals['macd'] = calculate_macd(hist, 12, 26, 9)
+        technicals['macd'] = {
+            "macd": points_from_arrays(times, ind['macd']),
+            "signal": points_from_arrays(times, ind['macd_signal']),
+            "histogram": points_from_arrays(times, ind['macd_hist'], colors=True)
+        }
 
     # Calculate Bollinger Bands (20, 2)
     if len(hist) >= 20:
-        technicals['bollinger'] = calculate_bollinger_bands(hist, 20, 2)
+        technicals['bollinger'] = {
+            "upper": points_from_arrays(times, ind['bb_upper']),
+            "middle": points_from_arrays(times, ind['sma20']),
+            "lower": points_from_arrays(times, ind['bb_lower'])
+        }
 
     return technicals
 
+@coalesce_inflight
 async def fetch_historical_data_impl(symbol: str, real_symbol: str, period: str = "1mo", interval: str = "1d"):
     """Implementation function for fetching historical data"""
     try:
         logger.info(f"Fetching historical data for {real_symbol}: period={period}, interval={interval}")
 
-        ticker = yf.Ticker(real_symbol)
-        hist = ticker.history(period=period, interval=interval, timeout=30)
+        try:
+            bars = await _yahoo_chart(real_symbol, period, interval)
+            if bars['close'].size == 0:
+                raise ValueError(f"No historical data available for {real_symbol}")
+            timestamps = (bars['timestamp'] * 1000).tolist()
+            opens = bars['open'].tolist()
+            highs = bars['high'].tolist()
+            lows = bars['low'].tolist()
+            closes = bars['close'].tolist()
+            volumes = bars['volume'].tolist()
+        except Exception as chart_err:
+            # Fallback: yfinance (off the event loop)
+            logger.warning(f"Yahoo chart API failed for {real_symbol} ({chart_err}), falling back to yfinance")
+            ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
+            loop = asyncio.get_running_loop()
+            hist = await loop.run_in_executor(YF_POOL, lambda: ticker.history(period=period, interval=interval, timeout=30))
 
-        if hist.empty:
-            raise ValueError(f"No historical data available for {real_symbol}")
-
-        data = []
-        for index, row in hist.iterrows():
-            data.append({
-                "symbol": symbol,
-                "timestamp": int(index.timestamp() * 1000),
-                "open": float(row["Open"]),
-                "high": float(row["High"]),
-                "low": float(row["Low"]),
-                "close": float(row["Close"]),
-                "volume": int(row["Volume"])
-            })
+            if hist.empty:
+                raise ValueError(f"No historical data available for {real_symbol}")
+
+            # PERFORMANCE FIX: Bulk column extraction instead of iterrows (no per-row Series)
+            timestamps = (hist.index.as_unit('ns').asi8 // 10**6).tolist()
+            opens = hist["Open"].to_numpy(dtype=np.float64).tolist()
+            highs = hist["High"].to_numpy(dtype=np.float64).tolist()
+            lows = hist["Low"].to_numpy(dtype=np.float64).tolist()
+            closes = hist["Close"].to_numpy(dtype=np.float64).tolist()
+            volumes = hist["Volume"].to_numpy(dtype=np.int64).tolist()
+        data = [
+            {"symbol": symbol, "timestamp": ts, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for ts, o, h, l, c, v in zip(timestamps, opens, highs, lows, closes, volumes)
+        ]
 
         result = {
             "symbol": symbol,
@@ -874,28 +1718,237 @@ async def fetch_historical_data_impl(symbol: str, real_symbol: str, period: str
         logger.error(f"Error fetching historical data for {real_symbol}: {e}")
         raise
 
+# PERFORMANCE FIX: Batched Yahoo quote endpoints - one v7 quote request per 20 symbols instead of a full
+# ticker.info (quoteSummary + quote round-trips) per symbol. Requests go through yfinance's YfData so the
+# shared session's cookie + crumb are attached.
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+YAHOO_QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
+YAHOO_QUOTE_CHUNK_SIZE = 20
+QUOTE_CACHE_TTL = 60  # Per-symbol quote cache ("quote:<SYM>") shared by every endpoint using fetch_quotes_batched
+FINANCIAL_CACHE_TTL = 1800  # Per-symbol financialData cache ("fin:<SYM>") - analyst targets move slowly
+KEY_STATISTICS_CACHE_TTL = 86400  # Per-symbol defaultKeyStatistics cache ("keystats:<SYM>") - beta is a multi-year regression
+
+def _fetch_quote_chunk(real_symbols: Tuple[str, ...]) -> Dict[str, dict]:
+    """One v7 quote request for up to YAHOO_QUOTE_CHUNK_SIZE symbols -> {symbol: raw quote}"""
+    yahoo_info_limiter.acquire_blocking()
+    payload = YfData(session=SHARED_YF_SESSION).get_raw_json(
+        YAHOO_QUOTE_URL, params={"symbols": ",".join(real_symbols), "formatted": "false"}
+    )
+    results = (payload.get('quoteResponse') or {}).get('result') or []
+    return {quote['symbol']: quote for quote in results if quote.get('symbol')}
+
+@coalesce_inflight
+async def fetch_quote_chunk(real_symbols: Tuple[str, ...]) -> Dict[str, dict]:
+    """v7 quote chunk off the event loop; heatmap/unusual-volume/analyst misses for the same chunk share one request"""
+    return await asyncio.get_running_loop().run_in_executor(YF_POOL, _fetch_quote_chunk, real_symbols)
+
+async def fetch_quotes_batched(real_symbols: List[str]) -> Dict[str, dict]:
+    """
+    v7 quotes for any number of symbols. Per-symbol cache entries are read with one MGET; only the misses
+    are fetched (chunks of 20, concurrently; failed chunks are skipped) and written back in one pipeline.
+    """
+    cached = await mget_cache([f"quote:{sym}" for sym in real_symbols])
+    quotes: Dict[str, dict] = {sym: quote for sym, quote in zip(real_symbols, cached) if quote}
+    missing = [sym for sym in real_symbols if sym not in quotes]
+    if not missing:
+        return quotes
+
+    # Tuples so identical chunks hash to the same in-flight key
+    chunks = [tuple(missing[i:i + YAHOO_QUOTE_CHUNK_SIZE]) for i in range(0, len(missing), YAHOO_QUOTE_CHUNK_SIZE)]
+    results = await asyncio.gather(*(fetch_quote_chunk(chunk) for chunk in chunks), return_exceptions=True)
+    fresh: Dict[str, dict] = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            logger.warning(f"⚠️ Quote batch failed for {len(chunk)} symbols ({chunk[0]}...): {result}")
+            continue
+        fresh.update(result)
+
+    if fresh:
+        await set_cache_many({f"quote:{sym}": quote for sym, quote in fresh.items()}, ttl_seconds=QUOTE_CACHE_TTL)
+    quotes.update(fresh)
+    return quotes
+
+def _fetch_quote_summary_module(real_symbol: str, module: str) -> dict:
+    """One quoteSummary module for one symbol (e.g. financialData, defaultKeyStatistics) - one light request"""
+    yahoo_info_limiter.acquire_blocking()
+    payload = YfData(session=SHARED_YF_SESSION).get_raw_json(
+        YAHOO_QUOTE_SUMMARY_URL.format(symbol=real_symbol),
+        params={"modules": module, "formatted": "false", "corsDomain": "finance.yahoo.com", "symbol": real_symbol}
+    )
+    result = (payload.get('quoteSummary') or {}).get('result') or [{}]
+    return result[0].get(module) or {}
+
+@coalesce_inflight
+async def fetch_quote_summary_module(real_symbol: str, module: str) -> dict:
+    """quoteSummary module off the event loop, coalesced per (symbol, module)"""
+    return await asyncio.get_running_loop().run_in_executor(YF_POOL, _fetch_quote_summary_module, real_symbol, module)
+
+async def fetch_quote_summary_batched(real_symbols: List[str], module: str, cache_prefix: str, ttl_seconds: int) -> Dict[str, dict]:
+    """
+    One quoteSummary module for many symbols through a per-symbol "<cache_prefix>:<SYM>" cache: one MGET for
+    all keys, only the misses go to Yahoo (bounded concurrency), fresh entries are written back in one pipeline.
+    Symbols whose fetch fails are left out, so one bad symbol never invalidates the rest; an empty
+    module ({}) is a valid result and is cached like any other.
+    """
+    cached = await mget_cache([f"{cache_prefix}:{sym}" for sym in real_symbols])
+    modules: Dict[str, dict] = {sym: data for sym, data in zip(real_symbols, cached) if data is not None}
+    missing = [sym for sym in real_symbols if sym not in modules]
+    if not missing:
+        return modules
+
+    results = await gather_bounded((fetch_quote_summary_module(sym, module) for sym in missing), return_exceptions=True)
+    fresh: Dict[str, dict] = {}
+    for sym, result in zip(missing, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Could not fetch {module} for {sym}: {result}")
+        else:
+            fresh[sym] = result
+
+    if fresh:
+        await set_cache_many({f"{cache_prefix}:{sym}": data for sym, data in fresh.items()}, ttl_seconds=ttl_seconds)
+    modules.update(fresh)
+    return modules
+
+async def fetch_financial_data_batched(real_symbols: List[str]) -> Dict[str, dict]:
+    """financialData (analyst targets/recommendation) for many symbols via the "fin:<SYM>" cache"""
+    return await fetch_quote_summary_batched(real_symbols, "financialData", "fin", FINANCIAL_CACHE_TTL)
+
+async def fetch_key_statistics_batched(real_symbols: List[str]) -> Dict[str, dict]:
+    """defaultKeyStatistics (beta - absent from v7 quotes) for many symbols via the "keystats:<SYM>" cache"""
+    return await fetch_quote_summary_batched(real_symbols, "defaultKeyStatistics", "keystats", KEY_STATISTICS_CACHE_TTL)
+
+def xstock_real_symbols(xstock_symbols: List[str]) -> Dict[str, str]:
+    """xStock symbol -> Yahoo ticker (dots as dashes), dropping unmapped symbols"""
+    return {x: STOCK_SYMBOLS_YF[x] for x in xstock_symbols if STOCK_SYMBOLS_YF.get(x)}
+
+YF_DOWNLOAD_CHUNK_SIZE = 20  # Symbols per bulk yf.download request (keeps Yahoo URLs short)
+BATCH_FETCH_CONCURRENCY = 8  # Concurrent single-symbol fallbacks (stays under Yahoo's rate)
+
+def _download_quotes_chunk(real_symbols: List[str]) -> pd.DataFrame:
+    """Bulk 5-day daily history for up to YF_DOWNLOAD_CHUNK_SIZE symbols in one request"""
+    return yf.download(
+        real_symbols,
+        period="5d",
+        interval="1d",
+        group_by='ticker',
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+        timeout=30,
+        session=SHARED_YF_SESSION
+    )
+
+def _quote_from_history(symbol: str, hist: pd.DataFrame, v7_quote: Optional[dict]) -> Optional[dict]:
+    """
+    Build the fetch_realtime_data_impl payload from a per-symbol slice of a bulk download. Market cap comes
+    from the symbol's v7 quote (marketCap, else sharesOutstanding x close); None when neither is available.
+    """
+    hist = hist.dropna(subset=['Close'])
+    if hist.empty:
+        return None
+
+    latest = hist.iloc[-1]
+    v7_quote = v7_quote or {}
+    if v7_quote.get('marketCap'):
+        market_cap = float(v7_quote['marketCap'])
+    elif v7_quote.get('sharesOutstanding'):
+        market_cap = float(latest['Close']) * float(v7_quote['sharesOutstanding'])
+    else:
+        return None
+    price_change = 0.0
+    price_change_percent = 0.0
+    if len(hist) >= 2:
+        previous_close = float(hist['Close'].iloc[-2])
+        price_change = float(latest['Close']) - previous_close
+        price_change_percent = (price_change / previous_close) * 100 if previous_close != 0 else 0
+
+    volume = latest.get('Volume', 0)
+    current_timestamp = int(time.time() * 1000)
+    return {
+        "symbol": symbol,
+        "price": float(latest['Close']),
+        "change": price_change,
+        "changePercent": price_change_percent,
+        "volume": int(volume) if pd.notna(volume) else 0,
+        "marketCap": market_cap,
+        "timestamp": current_timestamp,
+        "lastUpdate": current_timestamp
+    }
+
 async def fetch_batch_realtime_impl(xstock_symbols: List[str]):
-    """Implementation function for fetching batch real-time data"""
-    results = []
+    """
+    Implementation function for fetching batch real-time data
 
+    PERFORMANCE FIX: One bulk yf.download per chunk of <=20 symbols (chunks run concurrently)
+    instead of a rate-limited Ticker round-trip per symbol. Market caps come from the batched
+    v7 quotes fetched alongside. Symbols missing from the bulk response, or without a market
+    cap in their v7 quote, fall back to the single-symbol path.
+    """
+    # Map all xStocks up-front and de-dupe the real symbols
+    xstocks_by_real: Dict[str, List[str]] = {}
     for xstock_symbol in xstock_symbols:
         real_symbol = map_xstock_to_symbol(xstock_symbol)
         if not real_symbol:
             logger.warning(f"No mapping found for {xstock_symbol}")
             continue
+        xstocks_by_real.setdefault(real_symbol, []).append(xstock_symbol)
+
+    real_symbols = list(xstocks_by_real)
+    chunks = [real_symbols[i:i + YF_DOWNLOAD_CHUNK_SIZE] for i in range(0, len(real_symbols), YF_DOWNLOAD_CHUNK_SIZE)]
+
+    loop = asyncio.get_running_loop()
+    v7_quotes, *frames = await asyncio.gather(
+        fetch_quotes_batched(real_symbols),
+        *[loop.run_in_executor(YF_POOL, _download_quotes_chunk, chunk) for chunk in chunks],
+        return_exceptions=True
+    )
+    if isinstance(v7_quotes, Exception):
+        logger.warning(f"v7 quotes failed, market caps fall back to the single-symbol path: {v7_quotes}")
+        v7_quotes = {}
+
+    quotes: Dict[str, dict] = {}
+    for chunk, frame in zip(chunks, frames):
+        if isinstance(frame, Exception) or frame is None or frame.empty:
+            logger.warning(f"Bulk download failed for {len(chunk)} symbols: {frame if isinstance(frame, Exception) else 'empty'}")
+            continue
+        available = set(frame.columns.get_level_values(0)) if isinstance(frame.columns, pd.MultiIndex) else set()
+        for real_symbol in chunk:
+            if isinstance(frame.columns, pd.MultiIndex):
+                if real_symbol not in available:
+                    continue
+                hist = frame[real_symbol]
+            else:
+                hist = frame
+            for xstock_symbol in xstocks_by_real[real_symbol]:
+                quote = _quote_from_history(xstock_symbol, hist, v7_quotes.get(real_symbol))
+                if quote:
+                    quotes[xstock_symbol] = quote
+
+    logger.info(f"📦 Bulk realtime: {len(quotes)}/{len(xstock_symbols)} symbols from {len(chunks)} download(s)")
+
+    # Fallback: single-symbol path for anything the bulk download didn't return,
+    # run concurrently (Semaphore-guarded) instead of one await at a time
+    semaphore = asyncio.Semaphore(BATCH_FETCH_CONCURRENCY)
+
+    async def _fetch_one(xstock_symbol: str, real_symbol: str):
+        if xstock_symbol in quotes:
+            return quotes[xstock_symbol]
+        async with semaphore:
+            try:
+                return await fetch_with_retry(fetch_realtime_data_impl, xstock_symbol, real_symbol)
+            except Exception as e:
+                logger.error(f"Failed to fetch data for {xstock_symbol}: {e}")
+                return {
+                    "symbol": xstock_symbol,
+                    "error": str(e),
+                    "timestamp": int(time.time() * 1000)
+                }
 
-        try:
-            data = await fetch_with_retry(fetch_realtime_data_impl, xstock_symbol, real_symbol)
-            results.append(data)
-        except Exception as e:
-            logger.error(f"Failed to fetch data for {xstock_symbol}: {e}")
-            results.append({
-                "symbol": xstock_symbol,
-                "error": str(e),
-                "timestamp": int(time.time() * 1000)
-            })
-
-    return results
+    return await asyncio.gather(*[
+        _fetch_one(xstock_symbol, real_symbol)
+        for real_symbol, xstocks in xstocks_by_real.items()
+        for xstock_symbol in xstocks
+    ])
 
 # API Endpoints
 
@@ -905,12 +1958,17 @@ async def fetch_batch_realtime_impl(xstock_symbols: List[str]):
 
 def safe_float(value, default=0.0):
     """Convert value to JSON-safe float, replacing NaN/inf with default"""
-    if pd.isna(value) or np.isnan(value) or np.isinf(value):
-        return default
+    # PERFORMANCE FIX: one float() + math.isfinite instead of pd.isna/np.isnan/np.isinf dispatches;
+    # None, pd.NA and non-numeric strings land in the except branch
     try:
-        return float(value)
+        f = float(value)
     except (ValueError, TypeError):
         return default
+    return f if math.isfinite(f) else default
+
+def _fopt(value, scale: float = 1.0) -> Optional[float]:
+    """Optional numeric field: float(value) * scale, or None when missing/zero - one lookup per field"""
+    return float(value) * scale if value else None
 
 def clean_data_for_json(data):
     """Recursively clean data structure for JSON serialization"""
@@ -918,6 +1976,11 @@ def clean_data_for_json(data):
         return {k: clean_data_for_json(v) for k, v in data.items()}
     elif isinstance(data, list):
         return [clean_data_for_json(item) for item in data]
+    elif isinstance(data, str) or data is None:
+        return data
+    elif type(data) is float:
+        # Fast path: plain floats (the bulk of pre-cleaned payloads) skip the pandas/numpy scalar checks
+        return data if math.isfinite(data) else 0.0
     elif isinstance(data, (np.floating, float)):
         return safe_float(data)
     elif isinstance(data, (np.integer, int)):
@@ -927,33 +1990,196 @@ def clean_data_for_json(data):
     else:
         return data
 
-def load_xstock_symbols():
-    """Load all xStock symbols from xstock_mappings.json"""
-    try:
-        with open('xstock_mappings.json', 'r') as f:
-            mappings_data = json.load(f)
+XSTOCK_MAPPINGS_PATH = 'xstock_mappings.json'
+
+@functools.lru_cache(maxsize=4)
+def _load_xstock_symbols_cached(mtime: float) -> tuple:
+    """Parse xstock_mappings.json once per file version (keyed by mtime)"""
+    with open(XSTOCK_MAPPINGS_PATH, 'r') as f:
+        mappings_data = json.load(f)
 
-        symbols = list(mappings_data['xstock_to_ticker'].values())
+    symbols = tuple(mappings_data['xstock_to_ticker'].values())
+    logger.info(f"📊 Loaded {len(symbols)} xStock symbols from xstock_mappings.json")
+    return symbols
 
-        logger.info(f"📊 Loaded {len(symbols)} xStock symbols from xstock_mappings.json")
-        return symbols
+def load_xstock_symbols():
+    """Load all xStock symbols from xstock_mappings.json (re-read only when the file changes)"""
+    try:
+        return list(_load_xstock_symbols_cached(os.path.getmtime(XSTOCK_MAPPINGS_PATH)))
     except Exception as e:
         logger.error(f"❌ Failed to load xstock_mappings.json: {e}")
         return []
 
-def get_comprehensive_stocks_data(period='1d'):
-    """Get REAL comprehensive data for all 63 xStock symbols - OPTIMIZED WITH PARALLEL FETCHING"""
+def compute_technicals_matrix(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Latest RSI(14), MACD(12,26), signal(9) and annualized volatility for every column of a
+    (dates x symbols) close matrix at once - same formulas as ta's RSIIndicator/MACD.
+    Returns one row per symbol.
+    """
+    delta = closes.diff()
+    gains = delta.clip(lower=0).ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    losses = (-delta.clip(upper=0)).ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    rsi = 100 - 100 / (1 + gains / losses)
+
+    ema12 = closes.ewm(span=12, adjust=False).mean()
+    ema26 = closes.ewm(span=26, adjust=False).mean()
+    macd = ema12 - ema26
+    signal = macd.ewm(span=9, adjust=False).mean()
+
+    volatility = closes.pct_change(fill_method=None).std() * np.sqrt(252) * 100  # Annualized volatility %
+
+    return pd.DataFrame({
+        'rsi': rsi.ffill().iloc[-1],
+        'macd': macd.ffill().iloc[-1],
+        'signal': signal.ffill().iloc[-1],
+        'volatility': volatility
+    })
+
+# History window per dashboard period (enough for RSI/MACD plus the period's price comparison)
+STOCK_HIST_PERIOD = {
+    '1d': '2mo',   # Reduced from 3mo
+    '1w': '2mo',   # Reduced from 3mo
+    '1m': '3mo',   # Reduced from 6mo
+    '3m': '4mo',   # Reduced from 1y
+    'ytd': '6mo',  # Reduced from 1y
+    '1y': '6mo',   # Reduced from 2y - still enough for comparison
+}
+
+STOCK_FETCH_WORKERS = 32  # Enough threads to keep yahoo_info_limiter's budget busy
+
+# ticker.info fields read by fetch_single_stock, unpacked positionally in one map(info.get, ...) pass
+STOCK_INFO_KEYS = (
+    'longName', 'marketCap', 'averageVolume', 'fiftyTwoWeekHigh', 'fiftyTwoWeekLow', 'trailingPE', 'forwardPE',
+    'priceToBook', 'trailingEps', 'beta', 'dividendYield', 'revenueGrowth', 'earningsGrowth',
+    'returnOnEquity', 'profitMargins', 'debtToEquity', 'targetMeanPrice', 'targetHighPrice', 'targetLowPrice',
+    'numberOfAnalystOpinions', 'recommendationKey', 'recommendationMean', 'shortPercentOfFloat', 'heldPercentInsiders',
+    'heldPercentInstitutions',
+)
+
+# Numeric stock fields cleaned together (NaN/Inf -> 0.0) in a single vectorized pass
+STOCK_FLOAT_FIELDS = (
+    'change', 'changePercent', 'volume', 'marketCap', 'avgVolume', 'volumeRatio',
+    'dayHigh', 'dayLow', 'week52High', 'week52Low',
+    'peRatio', 'pbRatio', 'eps', 'beta', 'dividendYield', 'revenueGrowth', 'epsGrowth',
+    'roe', 'profitMargin', 'debtToEquity',
+    'targetMeanPrice', 'targetHighPrice', 'targetLowPrice', 'numberOfAnalystOpinions',
+    'analystRating', 'shortInterest', 'insiderOwnership', 'institutionalOwnership',
+)
+STOCK_FLOAT_INDEX = MappingProxyType({field: i for i, field in enumerate(STOCK_FLOAT_FIELDS)})
+
+# Stock payload key order; STOCK_FLOAT_FIELDS come from the cleaned array, the rest are keyword arguments
+STOCK_ROW_FIELDS = (
+    'symbol', 'name', 'price', 'change', 'changePercent', 'volume', 'marketCap', 'sector', 'avgVolume',
+    'volumeRatio', 'dayHigh', 'dayLow', 'week52High', 'week52Low',
+    'peRatio', 'pbRatio', 'eps', 'beta', 'dividendYield', 'revenueGrowth', 'epsGrowth', 'roe',
+    'profitMargin', 'debtToEquity',
+    'rsi', 'macdSignal', 'volatility',
+    'targetMeanPrice', 'targetHighPrice', 'targetLowPrice', 'numberOfAnalystOpinions', 'recommendationKey',
+    'analystRating', 'earningsSurprise', 'shortInterest', 'insiderOwnership', 'institutionalOwnership',
+    'performanceScore', 'optionsVolume', 'putCallRatio', 'optionsOpenInterest', 'weight', 'lastUpdated',
+)
+
+def _compile_stock_row_builder():
+    """
+    PERFORMANCE FIX: Generate build_stock_row(f, **scalars) at import - one dict display with every
+    key in STOCK_ROW_FIELDS order, float fields read positionally from the cleaned list f
+    """
+    params = [field for field in STOCK_ROW_FIELDS if field not in STOCK_FLOAT_INDEX]
+    items = ', '.join(
+        f"{field!r}: f[{STOCK_FLOAT_INDEX[field]}]" if field in STOCK_FLOAT_INDEX else f"{field!r}: {field}"
+        for field in STOCK_ROW_FIELDS
+    )
+    src = f"def build_stock_row(f, *, {', '.join(params)}):\n    return {{{items}}}\n"
+    namespace = {}
+    exec(compile(src, '<build_stock_row>', 'exec'), namespace)
+    return namespace['build_stock_row']
+
+build_stock_row = _compile_stock_row_builder()
+
+# PERFORMANCE FIX: Stale-while-revalidate for _stock_data_cache - past the soft TTL the stale payload is
+# served immediately while one background thread refreshes it; cache timestamps get +/-60s of jitter so
+# periods don't all expire together. One lock per period keeps a single refresh in flight.
+STOCK_CACHE_SOFT_TTL_RATIO = 0.7
+STOCK_CACHE_TTL_JITTER = 60
+_stock_refresh_locks = defaultdict(threading.Lock)
+
+def _stock_cache_key(period_key, include_earnings=True, include_options=False):
+    """Cache slot for one period + detail level (the default detail level keeps the bare period key)"""
+    if include_earnings and not include_options:
+        return period_key
+    return f"{period_key}:{'earnings' if include_earnings else 'lite'}{'+options' if include_options else ''}"
+
+def stocks_frame(stocks_data) -> pd.DataFrame:
+    """Columnar (SoA) view of a stock payload - the frame cached alongside it, else built on the spot"""
+    # Snapshot: executor threads add slots (disk hydration, new detail levels) while this scans
+    for entry in list(_stock_data_cache.values()):
+        if entry.get('data') is stocks_data and entry.get('frame') is not None:
+            return entry['frame']
+    return pd.DataFrame.from_records(stocks_data)
+
+def _stock_cache_age(cache_key):
+    """Age in seconds of the cached payload for a cache slot (None if nothing cached, in memory or on disk)"""
+    entry = _stock_data_cache.get(cache_key)
+    if not entry or entry['data'] is None:
+        entry = disk_cache_load('stocks', cache_key)
+        if entry is None:
+            return None
+        entry['frame'] = pd.DataFrame.from_records(entry['data'])
+        _stock_data_cache[cache_key] = entry
+        logger.info(f"💽 Hydrated stock cache '{cache_key}' from disk")
+    return time.time() - entry['timestamp']
+
+def _background_stock_refresh(period, lock, include_earnings, include_options):
+    """Refresh one period's stock payload off the request path, then release its lock"""
+    try:
+        _fetch_comprehensive_stocks_data(period, period_cache_ttl(period.lower()), include_earnings, include_options)
+    finally:
+        lock.release()
+
+def get_comprehensive_stocks_data(period='1d', include_earnings=True, include_options=False):
+    """
+    Get REAL comprehensive data for all 63 xStock symbols - OPTIMIZED WITH PARALLEL FETCHING
+    include_earnings / include_options gate the extra per-ticker yfinance calls; aggregate views
+    (sectors, movers) that only read price/change skip them.
+    """
     # Normalize period for cache key
     period_key = period.lower()
+    cache_key = _stock_cache_key(period_key, include_earnings, include_options)
+    cache_duration = period_cache_ttl(period_key)
 
-    # Check cache first to prevent timeouts
-    current_time = time.time()
-    if (period_key in _stock_data_cache and
-        _stock_data_cache[period_key]['data'] is not None and
-        current_time - _stock_data_cache[period_key]['timestamp'] < _stock_data_cache['cache_duration']):
-        logger.info(f"🚀 Using cached stock data for period {period}")
-        return _stock_data_cache[period_key]['data']
+    # A fresh default payload is a superset of the lite one - reuse it instead of fetching
+    if not include_earnings and not include_options:
+        age = _stock_cache_age(period_key)
+        if age is not None and age < cache_duration:
+            logger.info(f"🚀 Using cached stock data for period {period}")
+            return _stock_data_cache[period_key]['data']
 
+    # Check cache first to prevent timeouts
+    age = _stock_cache_age(cache_key)
+    if age is not None and age < cache_duration:
+        if age >= cache_duration * STOCK_CACHE_SOFT_TTL_RATIO:
+            lock = _stock_refresh_locks[cache_key]
+            if lock.acquire(blocking=False):
+                logger.info(f"♻️ Serving stale stock data for period {period}, refreshing in background")
+                threading.Thread(
+                    target=_background_stock_refresh,
+                    args=(period, lock, include_earnings, include_options),
+                    daemon=True
+                ).start()
+        else:
+            logger.info(f"🚀 Using cached stock data for period {period}")
+        return _stock_data_cache[cache_key]['data']
+
+    # Cold/expired: one caller fetches, concurrent callers wait and reuse its result
+    with _stock_refresh_locks[cache_key]:
+        age = _stock_cache_age(cache_key)
+        if age is not None and age < cache_duration:
+            logger.info(f"🚀 Using cached stock data for period {period}")
+            return _stock_data_cache[cache_key]['data']
+        return _fetch_comprehensive_stocks_data(period, cache_duration, include_earnings, include_options)
+
+def _fetch_comprehensive_stocks_data(period='1d', cache_duration=None, include_earnings=True, include_options=False):
+    """Fetch and cache the stock payload for one period / detail level (no cache check)"""
     symbols = load_xstock_symbols()
     if not symbols:
         logger.error("❌ No symbols loaded from tokens.json")
@@ -965,29 +2191,54 @@ def get_comprehensive_stocks_data(period='1d'):
         logger.info(f"🚀 Fetching REAL data for {len(symbols)} symbols in PARALLEL...")
         start_time = time.time()
 
+        # MEMORY OPTIMIZED: Fetch minimal history needed for technical indicators (RSI needs 14+ days, MACD needs 26+ days)
+        # Reduced from up to 2y to max 6mo to prevent OOM on t3.micro (1GB RAM)
+        hist_period = STOCK_HIST_PERIOD.get(period.lower(), "2mo")  # Default to 2 months (enough for indicators)
+
+        # PERFORMANCE FIX: One batched yf.download for every symbol's history instead of a
+        # Ticker.history round-trip per symbol; workers below only fetch .info / earnings
+        hist_all = None
+        try:
+            hist_all = yf.download(
+                symbols,
+                period=hist_period,
+                group_by='ticker',
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+                session=SHARED_YF_SESSION
+            )
+            logger.info(f"📦 Batched history download for {len(symbols)} symbols in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"⚠️ Batched history download failed, falling back to per-symbol history: {e}")
+
+        def history_for(symbol):
+            """Slice one symbol out of the batched download (None if it's missing)"""
+            if hist_all is None or hist_all.empty or not isinstance(hist_all.columns, pd.MultiIndex):
+                return None
+            if symbol not in hist_all.columns.get_level_values(0):
+                return None
+            return hist_all[symbol].dropna(subset=['Close'])
+
+        # PERFORMANCE FIX: RSI/MACD/volatility for every symbol in one vectorized sweep over the (T, N) close matrix
+        batch_technicals = pd.DataFrame()
+        if hist_all is not None and not hist_all.empty and isinstance(hist_all.columns, pd.MultiIndex):
+            try:
+                batch_technicals = compute_technicals_matrix(hist_all.xs('Close', axis=1, level=1))
+            except Exception as e:
+                logger.warning(f"⚠️ Vectorized TA failed, falling back to per-symbol TA: {e}")
+
         def fetch_single_stock(symbol):
             """Fetch a single stock's data in parallel - OPTIMIZED"""
             try:
-                ticker = yf.Ticker(symbol)
-
-                # MEMORY OPTIMIZED: Fetch minimal history needed for technical indicators (RSI needs 14+ days, MACD needs 26+ days)
-                # Reduced from up to 2y to max 6mo to prevent OOM on t3.micro (1GB RAM)
-                if period in ["1D", "1d"]:
-                    hist_period = "2mo"  # Reduced from 3mo
-                elif period in ["1W", "1w"]:
-                    hist_period = "2mo"  # Reduced from 3mo
-                elif period in ["1M", "1m"]:
-                    hist_period = "3mo"  # Reduced from 6mo
-                elif period in ["3M", "3m"]:
-                    hist_period = "4mo"  # Reduced from 1y
-                elif period in ["YTD", "ytd"]:
-                    hist_period = "6mo"  # Reduced from 1y
-                elif period in ["1Y", "1y"]:
-                    hist_period = "6mo"  # Reduced from 2y - still enough for comparison
-                else:
-                    hist_period = "2mo"  # Default to 2 months (enough for indicators)
-
-                hist = ticker.history(period=hist_period)
+                ticker = yf.Ticker(symbol, session=SHARED_YF_SESSION)
+
+                hist = history_for(symbol)
+                from_batch = hist is not None and not hist.empty
+                if not from_batch:
+                    yahoo_info_limiter.acquire_blocking()
+                    hist = ticker.history(period=hist_period)
+                yahoo_info_limiter.acquire_blocking()
                 info = ticker.info
 
                 if not hist.empty and len(hist) > 0:
@@ -999,65 +2250,81 @@ def get_comprehensive_stocks_data(period='1d'):
                     volatility = None
 
                     try:
+                        tech = batch_technicals.loc[symbol] if from_batch and symbol in batch_technicals.index else None
+                        macd_val = signal_val = None
+
                         if len(hist) >= 14:  # Need at least 14 periods for RSI
-                            rsi_indicator = RSIIndicator(close=hist['Close'], window=14)
-                            rsi_value = safe_float(rsi_indicator.rsi().iloc[-1])
+                            if tech is not None:
+                                rsi_value = safe_float(tech['rsi'])
+                            else:
+                                rsi_indicator = RSIIndicator(close=hist['Close'], window=14)
+                                rsi_value = safe_float(rsi_indicator.rsi().iloc[-1])
 
                         if len(hist) >= 26:  # Need at least 26 periods for MACD
-                            macd_indicator = MACD(close=hist['Close'])
-                            macd_line = macd_indicator.macd()
-                            signal_line = macd_indicator.macd_signal()
-
-                            if not macd_line.empty and not signal_line.empty:
-                                macd_val = safe_float(macd_line.iloc[-1])
-                                signal_val = safe_float(signal_line.iloc[-1])
-
-                                if macd_val and signal_val:
-                                    if macd_val > signal_val:
-                                        macd_signal = 'bullish'
-                                    elif macd_val < signal_val:
-                                        macd_signal = 'bearish'
+                            if tech is not None:
+                                macd_val = safe_float(tech['macd'])
+                                signal_val = safe_float(tech['signal'])
+                            else:
+                                macd_indicator = MACD(close=hist['Close'])
+                                macd_line = macd_indicator.macd()
+                                signal_line = macd_indicator.macd_signal()
+
+                                if not macd_line.empty and not signal_line.empty:
+                                    macd_val = safe_float(macd_line.iloc[-1])
+                                    signal_val = safe_float(signal_line.iloc[-1])
+
+                            if macd_val and signal_val:
+                                if macd_val > signal_val:
+                                    macd_signal = 'bullish'
+                                elif macd_val < signal_val:
+                                    macd_signal = 'bearish'
 
                         # Calculate volatility (standard deviation of returns)
                         if len(hist) >= 20:
-                            returns = hist['Close'].pct_change()
-                            volatility = safe_float(returns.std() * np.sqrt(252) * 100)  # Annualized volatility %
+                            if tech is not None:
+                                volatility = safe_float(tech['volatility'])
+                            else:
+                                returns = hist['Close'].pct_change()
+                                volatility = safe_float(returns.std() * np.sqrt(252) * 100)  # Annualized volatility %
                     except Exception as e:
                         logger.warning(f"⚠️ TA calculation failed for {symbol}: {e}")
 
-                    # Fetch Earnings Surprise from earnings_dates
+                    # Fetch Earnings Surprise from earnings_dates (skipped for aggregate views)
                     earnings_surprise = 0
-                    try:
-                        earnings_dates = ticker.get_earnings_dates(limit=4)  # Get last 4 quarters
-                        if earnings_dates is not None and not earnings_dates.empty and 'Surprise(%)' in earnings_dates.columns:
-                            # Get the most recent earnings surprise
-                            surprise_values = earnings_dates['Surprise(%)'].dropna()
-                            if not surprise_values.empty:
-                                earnings_surprise = safe_float(surprise_values.iloc[0])
-                    except Exception as e:
-                        logger.debug(f"⚠️ Earnings surprise not available for {symbol}: {e}")
+                    if include_earnings:
+                        try:
+                            yahoo_info_limiter.acquire_blocking()
+                            earnings_dates = ticker.get_earnings_dates(limit=4)  # Get last 4 quarters
+                            if earnings_dates is not None and not earnings_dates.empty and 'Surprise(%)' in earnings_dates.columns:
+                                # Get the most recent earnings surprise
+                                surprise_values = earnings_dates['Surprise(%)'].dropna()
+                                if not surprise_values.empty:
+                                    earnings_surprise = safe_float(surprise_values.iloc[0])
+                        except Exception as e:
+                            logger.debug(f"⚠️ Earnings surprise not available for {symbol}: {e}")
 
                     # Calculate Options Activity
-                    # PERFORMANCE FIX: Skip options for /all-xstocks to save 150MB+ memory
+                    # PERFORMANCE FIX: Options are opt-in (include_options) - skipped for /all-xstocks to save 150MB+ memory
                     # Options data still available via dedicated /api/options/* endpoints
                     options_volume = 0
                     put_call_ratio = 0
                     options_open_interest = 0
-                    # Commented out to reduce memory usage and API calls:
-                    # try:
-                    #     options_dates = ticker.options
-                    #     if options_dates and len(options_dates) > 0:
-                    #         nearest_expiry = options_dates[0]
-                    #         opt_chain = ticker.option_chain(nearest_expiry)
-                    #         calls_volume = opt_chain.calls['volume'].sum() if not opt_chain.calls.empty else 0
-                    #         puts_volume = opt_chain.puts['volume'].sum() if not opt_chain.puts.empty else 0
-                    #         calls_oi = opt_chain.calls['openInterest'].sum() if not opt_chain.calls.empty else 0
-                    #         puts_oi = opt_chain.puts['openInterest'].sum() if not opt_chain.puts.empty else 0
-                    #         options_volume = safe_float(calls_volume + puts_volume)
-                    #         options_open_interest = safe_float(calls_oi + puts_oi)
-                    #         put_call_ratio = safe_float(puts_volume / calls_volume if calls_volume > 0 else 0)
-                    # except Exception as e:
-                    #     logger.debug(f"⚠️ Options data not available for {symbol}: {e}")
+                    if include_options:
+                        try:
+                            yahoo_info_limiter.acquire_blocking()
+                            options_dates = ticker.options
+                            if options_dates and len(options_dates) > 0:
+                                nearest_expiry = options_dates[0]
+                                opt_chain = ticker.option_chain(nearest_expiry)
+                                calls_volume = opt_chain.calls['volume'].sum() if not opt_chain.calls.empty else 0
+                                puts_volume = opt_chain.puts['volume'].sum() if not opt_chain.puts.empty else 0
+                                calls_oi = opt_chain.calls['openInterest'].sum() if not opt_chain.calls.empty else 0
+                                puts_oi = opt_chain.puts['openInterest'].sum() if not opt_chain.puts.empty else 0
+                                options_volume = safe_float(calls_volume + puts_volume)
+                                options_open_interest = safe_float(calls_oi + puts_oi)
+                                put_call_ratio = safe_float(puts_volume / calls_volume if calls_volume > 0 else 0)
+                        except Exception as e:
+                            logger.debug(f"⚠️ Options data not available for {symbol}: {e}")
 
                     # Calculate percentage change based on selected time period
                     if period in ["1D", "1d"]:
@@ -1082,68 +2349,76 @@ def get_comprehensive_stocks_data(period='1d'):
                     change = current_price - prev_price
                     change_percent = (change / prev_price * 100) if prev_price != 0 else 0
 
-                    stock_data = {
-                        'symbol': f"{symbol}x",
-                        'name': info.get('longName', f"{symbol} Stock") or f"{symbol} Corporation",
-                        'price': current_price,
-                        'change': safe_float(change),
-                        'changePercent': safe_float(change_percent),
-                        'volume': safe_float(hist['Volume'].iloc[-1] if 'Volume' in hist else 0),
-                        'marketCap': MARKET_CAP_MAPPING.get(symbol, safe_float(info.get('marketCap', 1e9))),
-                        'sector': STOCK_SECTOR_MAPPING.get(symbol, 'Other'),
-                        'avgVolume': safe_float(info.get('averageVolume', 1000000)),
-                        'volumeRatio': safe_float(hist['Volume'].iloc[-1] / info.get('averageVolume', 1000000) if info.get('averageVolume', 0) > 0 else 1.0),
-                        'dayHigh': safe_float(hist['High'].iloc[-1] if 'High' in hist else current_price),
-                        'dayLow': safe_float(hist['Low'].iloc[-1] if 'Low' in hist else current_price),
-                        'week52High': safe_float(info.get('fiftyTwoWeekHigh', current_price * 1.2)),
-                        'week52Low': safe_float(info.get('fiftyTwoWeekLow', current_price * 0.8)),
-
-                        # Fundamental metrics
-                        'peRatio': safe_float(info.get('trailingPE', info.get('forwardPE', 0))),
-                        'pbRatio': safe_float(info.get('priceToBook', 0)),
-                        'eps': safe_float(info.get('trailingEps', 0)),
-                        'beta': safe_float(info.get('beta', 1.0)),
-                        'dividendYield': safe_float(info.get('dividendYield', 0) if info.get('dividendYield') else 0),
-                        'revenueGrowth': safe_float(info.get('revenueGrowth', 0) if info.get('revenueGrowth') else 0),
-                        'epsGrowth': safe_float(info.get('earningsGrowth', 0) if info.get('earningsGrowth') else 0),
-                        'roe': safe_float(info.get('returnOnEquity', 0) if info.get('returnOnEquity') else 0),
-                        'profitMargin': safe_float(info.get('profitMargins', 0) if info.get('profitMargins') else 0),
-                        'debtToEquity': safe_float(info.get('debtToEquity', 0)),
-
-                        # Technical indicators (from TA library)
-                        'rsi': rsi_value,
-                        'macdSignal': macd_signal,
-                        'volatility': volatility or safe_float(info.get('beta', 1.0) * 20),  # Fallback to beta-based estimate
-
-                        # Quantitative metrics
-                        'targetMeanPrice': safe_float(info.get('targetMeanPrice', 0)),
-                        'targetHighPrice': safe_float(info.get('targetHighPrice', 0)),
-                        'targetLowPrice': safe_float(info.get('targetLowPrice', 0)),
-                        'numberOfAnalystOpinions': safe_float(info.get('numberOfAnalystOpinions', 0)),
-                        'recommendationKey': info.get('recommendationKey', 'hold'),
-                        'analystRating': safe_float(info.get('recommendationMean', 3.0)),  # 1=Strong Buy, 5=Strong Sell
-                        'earningsSurprise': earnings_surprise,  # From get_earnings_dates() Surprise(%) field
-                        'shortInterest': safe_float(info.get('shortPercentOfFloat', 0) if info.get('shortPercentOfFloat') else 0),
-                        'insiderOwnership': safe_float(info.get('heldPercentInsiders', 0) if info.get('heldPercentInsiders') else 0),
-                        'institutionalOwnership': safe_float(info.get('heldPercentInstitutions', 0) if info.get('heldPercentInstitutions') else 0),
-
-                        # Performance score (composite metric based on multiple factors)
-                        'performanceScore': safe_float(
-                            # Weighted average of: price change (40%), earnings growth (30%), ROE (20%), analyst rating (10%)
-                            (change_percent * 0.4) +
-                            (safe_float(info.get('earningsGrowth', 0) * 100 if info.get('earningsGrowth') else 0) * 0.3) +
-                            (safe_float(info.get('returnOnEquity', 0) * 100 if info.get('returnOnEquity') else 0) * 0.2) +
-                            ((6 - safe_float(info.get('recommendationMean', 3.0))) * 10 * 0.1)  # Invert and scale rating
-                        ),
-
-                        # Options Activity
-                        'optionsVolume': options_volume,
-                        'putCallRatio': put_call_ratio,
-                        'optionsOpenInterest': options_open_interest,
-
-                        'weight': 0.0,  # Will be calculated after sector grouping
-                        'lastUpdated': int(time.time() * 1000)
-                    }
+                    # PERFORMANCE FIX: Pull every info field in one map() pass instead of ~30 scattered .get() calls
+                    (long_name, info_market_cap, avg_volume, week52_high, week52_low, trailing_pe, forward_pe,
+                     price_to_book, trailing_eps, beta, dividend_yield, revenue_growth, earnings_growth,
+                     return_on_equity, profit_margins, debt_to_equity, target_mean, target_high, target_low,
+                     analyst_opinions, recommendation_key, recommendation_mean, short_float, insiders_pct,
+                     institutions_pct) = map(info.get, STOCK_INFO_KEYS)
+                    beta = 1.0 if beta is None else beta
+                    avg_volume = 1000000 if avg_volume is None else avg_volume
+                    last_volume = hist['Volume'].iloc[-1] if 'Volume' in hist else 0
+
+                    # PERFORMANCE FIX: Raw numeric values (STOCK_FLOAT_FIELDS order) are NaN/Inf-cleaned in one
+                    # np.nan_to_num pass instead of ~30 scalar safe_float calls, then laid into the row by the
+                    # generated build_stock_row in a single dict display
+                    f = np.nan_to_num(np.array([
+                        change,
+                        change_percent,
+                        last_volume,
+                        MARKET_CAP_MAPPING.get(symbol, 1e9 if info_market_cap is None else info_market_cap),
+                        avg_volume,
+                        last_volume / avg_volume if avg_volume > 0 else 1.0,
+                        hist['High'].iloc[-1] if 'High' in hist else current_price,
+                        hist['Low'].iloc[-1] if 'Low' in hist else current_price,
+                        current_price * 1.2 if week52_high is None else week52_high,
+                        current_price * 0.8 if week52_low is None else week52_low,
+                        (trailing_pe if trailing_pe is not None else forward_pe) or 0,
+                        price_to_book or 0,
+                        trailing_eps or 0,
+                        beta,
+                        dividend_yield or 0,
+                        revenue_growth or 0,
+                        earnings_growth or 0,
+                        return_on_equity or 0,
+                        profit_margins or 0,
+                        debt_to_equity or 0,
+                        target_mean or 0,
+                        target_high or 0,
+                        target_low or 0,
+                        analyst_opinions or 0,
+                        3.0 if recommendation_mean is None else recommendation_mean,  # 1=Strong Buy, 5=Strong Sell
+                        short_float or 0,
+                        insiders_pct or 0,
+                        institutions_pct or 0,
+                    ], dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0).tolist()
+
+                    # Weighted average of: price change (40%), earnings growth (30%), ROE (20%), analyst rating (10%)
+                    performance_score = safe_float(
+                        (f[STOCK_FLOAT_INDEX['changePercent']] * 0.4) +
+                        (f[STOCK_FLOAT_INDEX['epsGrowth']] * 100 * 0.3) +
+                        (f[STOCK_FLOAT_INDEX['roe']] * 100 * 0.2) +
+                        ((6 - f[STOCK_FLOAT_INDEX['analystRating']]) * 10 * 0.1)  # Invert and scale rating
+                    )
+
+                    stock_data = build_stock_row(
+                        f,
+                        symbol=f"{symbol}x",
+                        name=(f"{symbol} Stock" if long_name is None else long_name) or f"{symbol} Corporation",
+                        price=current_price,
+                        sector=STOCK_SECTOR_MAPPING.get(symbol, 'Other'),
+                        rsi=rsi_value,  # Technical indicators (from TA library)
+                        macdSignal=macd_signal,
+                        volatility=volatility or safe_float(beta * 20),  # Fallback to beta-based estimate
+                        recommendationKey=recommendation_key or 'hold',
+                        earningsSurprise=earnings_surprise,  # From get_earnings_dates() Surprise(%) field
+                        performanceScore=performance_score,
+                        optionsVolume=options_volume,
+                        putCallRatio=put_call_ratio,
+                        optionsOpenInterest=options_open_interest,
+                        weight=0.0,  # Will be calculated after sector grouping
+                        lastUpdated=int(time.time() * 1000)
+                    )
 
                     logger.info(f"✅ {symbol}: ${current_price:.2f} ({change_percent:+.2f}%)")
                     return stock_data
@@ -1155,9 +2430,9 @@ def get_comprehensive_stocks_data(period='1d'):
                 logger.error(f"❌ Failed {symbol}: {e}")
                 return None
 
-        # TRUE PARALLEL FETCHING with 15 workers (10-15x faster!)
+        # TRUE PARALLEL FETCHING - request rate is paced by yahoo_info_limiter, not by the worker count
         all_stocks_data = []
-        with ThreadPoolExecutor(max_workers=15) as executor:
+        with ThreadPoolExecutor(max_workers=STOCK_FETCH_WORKERS) as executor:
             future_to_symbol = {executor.submit(fetch_single_stock, symbol): symbol for symbol in symbols}
 
             for future in as_completed(future_to_symbol):
@@ -1170,13 +2445,19 @@ def get_comprehensive_stocks_data(period='1d'):
 
         # Cache the data for 1 hour (ULTRA AGGRESSIVE)
         period_key = period.lower()
+        cache_key = _stock_cache_key(period_key, include_earnings, include_options)
         # AUTO-INITIALIZE cache key if it doesn't exist (FIX: prevents cache misses)
-        if period_key not in _stock_data_cache:
-            _stock_data_cache[period_key] = {'data': None, 'timestamp': 0}
-
-        _stock_data_cache[period_key]['data'] = all_stocks_data
-        _stock_data_cache[period_key]['timestamp'] = time.time()
-        logger.info(f"💾 Cached stock data for period {period} for 1 hour")
+        if cache_key not in _stock_data_cache:
+            _stock_data_cache[cache_key] = {'data': None, 'timestamp': 0}
+
+        _stock_data_cache[cache_key]['data'] = all_stocks_data
+        # SoA copy built once per fetch - sectors/movers/pulse aggregate over columns instead of dicts
+        _stock_data_cache[cache_key]['frame'] = pd.DataFrame.from_records(all_stocks_data)
+        ttl = cache_duration or period_cache_ttl(period_key)
+        jitter = min(STOCK_CACHE_TTL_JITTER, 0.1 * ttl)  # keep short intraday TTLs from being jittered away
+        _stock_data_cache[cache_key]['timestamp'] = time.time() + random.uniform(-jitter, jitter)
+        disk_cache_store('stocks', cache_key, all_stocks_data, _stock_data_cache[cache_key]['timestamp'], ttl)
+        logger.info(f"💾 Cached stock data for period {period}")
 
         return all_stocks_data
 
@@ -1184,153 +2465,160 @@ def get_comprehensive_stocks_data(period='1d'):
         logger.error(f"❌ Critical error in get_comprehensive_stocks_data: {e}")
         return []
 
-def get_comprehensive_indices_data(period='1d'):
+# PERFORMANCE FIX: Index fan-out runs on the event loop over the pooled aiohttp session (no thread per index)
+INDEX_FETCH_CONCURRENCY = 32
+
+async def fetch_single_index(index_info, window_bars, window_start, semaphore):
+    """Fetch a single index straight from the Yahoo chart endpoint - OPTIMIZED without chart generation"""
+    symbol = index_info['symbol']
+    try:
+        async with semaphore:
+            # FIX: 1y data for SMA50 and SMA200 calculations (need 200+ days)
+            # PERFORMANCE FIX: the period window is sliced from this same 1y series - one round-trip per index
+            hist_1y = await _yahoo_chart(symbol, '1y', '1d')
+
+        closes = hist_1y['close']
+        if len(closes) == 0:
+            logger.warning(f"⚠️ No data for {symbol}")
+            return None
+
+        if window_start is not None:
+            period_closes = closes[hist_1y['timestamp'] >= window_start]
+        else:
+            period_closes = closes[-window_bars:] if window_bars else closes
+        if len(period_closes) == 0:
+            period_closes = closes
+
+        current_price = safe_float(period_closes[-1])
+        prev_price = safe_float(period_closes[-2] if len(period_closes) > 1 else current_price)
+        change = current_price - prev_price
+        change_percent = (change / prev_price * 100) if prev_price != 0 else 0
+
+        logger.debug(f"📊 {symbol}: Fetched {len(closes)} days for SMA calculations")
+
+        # Technical indicators using TA library (consistent with stocks)
+        rsi_value = 50.0
+        macd_line = 0.0
+        signal_line = 0.0
+
+        try:
+            # Convert to pandas Series for TA library
+            close_series = pd.Series(closes)
+
+            # RSI using TA library
+            if len(close_series) >= 14:
+                rsi_indicator = RSIIndicator(close=close_series, window=14)
+                rsi_value = safe_float(rsi_indicator.rsi().iloc[-1])
+
+            # MACD using TA library
+            if len(close_series) >= 26:
+                macd_indicator = MACD(close=close_series)
+                macd_line = safe_float(macd_indicator.macd().iloc[-1])
+                signal_line = safe_float(macd_indicator.macd_signal().iloc[-1])
+        except Exception as e:
+            logger.warning(f"⚠️ TA calculation failed for {symbol}: {e}")
+
+        # PERFORMANCE FIX: Moving averages + Bollinger Bands (from 1y historical data) in one compiled pass
+        sma20, sma50, sma200, bb_mean, bb_std = compute_ma_bb(np.ascontiguousarray(closes, dtype=np.float64))
+        sma20, sma50, sma200 = safe_float(sma20), safe_float(sma50), safe_float(sma200)
+        logger.debug(f"📈 {symbol}: SMA20={sma20:.2f}, SMA50={sma50:.2f}, SMA200={sma200:.2f}")
+
+        if len(closes) >= 20:
+            bb_upper = bb_mean + (2 * bb_std)
+            bb_lower = bb_mean - (2 * bb_std)
+        else:
+            bb_mean = current_price
+            bb_upper = current_price * 1.02
+            bb_lower = current_price * 0.98
+
+        # Market cap only needs yfinance's quoteSummary when the static mapping has no entry
+        market_cap = MARKET_CAP_MAPPING.get(symbol)
+        if market_cap is None:
+            try:
+                info = await asyncio.get_running_loop().run_in_executor(YF_POOL, lambda: yf.Ticker(symbol, session=SHARED_YF_SESSION).info)
+                market_cap = safe_float(info.get('marketCap', 1e12))
+            except Exception:
+                market_cap = 1e12
+
+        index_data = {
+            'symbol': symbol,
+            'name': index_info['name'],
+            'category': index_info['category'],
+            'price': current_price,
+            'change': safe_float(change),
+            'changePercent': safe_float(change_percent),
+            'volume': safe_float(hist_1y['volume'][-1]),
+            'marketCap': market_cap,
+            'technical': {
+                'rsi': rsi_value,
+                'macd': {
+                    'macd': safe_float(macd_line),
+                    'signal': safe_float(signal_line),
+                    'histogram': safe_float(macd_line - signal_line)
+                },
+                'sma20': sma20,
+                'sma50': sma50,
+                'sma200': sma200,
+                'bollinger': {
+                    'upper': safe_float(bb_upper),
+                    'middle': safe_float(bb_mean),
+                    'lower': safe_float(bb_lower)
+                }
+            },
+            'lastUpdated': int(time.time() * 1000)
+        }
+
+        logger.info(f"✅ {symbol}: {current_price:.2f} ({change_percent:+.2f}%)")
+        return index_data
+
+    except Exception as e:
+        logger.error(f"❌ Failed {symbol}: {e}")
+        return None
+
+async def get_comprehensive_indices_data(period='1d'):
     """Get REAL data for all 21 indices - OPTIMIZED: NO CHART DATA (use separate endpoint)"""
     # Check cache first - use period-specific cache key
     period_key = f"{period.lower()}"
     current_time = time.time()
 
-    # Initialize cache key if it doesn't exist
+    # Initialize cache key if it doesn't exist (warm restarts pick up the persisted copy)
     if period_key not in _indices_data_cache:
-        _indices_data_cache[period_key] = {'data': None, 'timestamp': 0, 'cache_duration': 300}
+        _indices_data_cache[period_key] = disk_cache_load('indices', period_key) or {'data': None, 'timestamp': 0}
 
     cache_entry = _indices_data_cache[period_key]
     if (cache_entry['data'] is not None and
-        current_time - cache_entry['timestamp'] < cache_entry['cache_duration']):
+        current_time - cache_entry['timestamp'] < period_cache_ttl(period_key)):
         logger.info(f"🚀 Using cached indices data for period {period}")
         return cache_entry['data']
 
     try:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         logger.info(f"📈 Fetching {len(COMPREHENSIVE_INDICES)} indices in PARALLEL for period {period}...")
         start_time = time.time()
 
-        # Map period to yfinance period
-        period_map = {
-            "1d": "5d",    # Need a few days for indicators
-            "1w": "1mo",   # Need month for weekly view
-            "1mo": "3mo",  # Need 3 months for monthly view
-            "3mo": "6mo",
-            "ytd": "ytd",
-            "1y": "1y"
+        # Map period to trailing daily bars of the 1y series (same windows as the old 5d/1mo/3mo/6mo ranges)
+        period_bars = {
+            "1d": 5,      # Need a few days for indicators
+            "1w": 21,     # Need month for weekly view
+            "1mo": 63,    # Need 3 months for monthly view
+            "3mo": 126,
+            "ytd": None,  # Sliced by Jan 1 below
+            "1y": None
         }
-        yf_period = period_map.get(period.lower(), "5d")
-
-        def fetch_single_index(index_info):
-            """Fetch a single index - OPTIMIZED without chart generation"""
-            try:
-                ticker = yf.Ticker(index_info['symbol'])
-                hist = ticker.history(period=yf_period)  # Use period parameter
-                info = ticker.info
-
-                if not hist.empty and len(hist) > 0:
-                    current_price = safe_float(hist['Close'].iloc[-1])
-                    prev_price = safe_float(hist['Close'].iloc[-2] if len(hist) > 1 else current_price)
-                    change = current_price - prev_price
-                    change_percent = (change / prev_price * 100) if prev_price != 0 else 0
+        window_bars = period_bars.get(period.lower(), 5)
+        window_start = datetime(datetime.now().year, 1, 1).timestamp() if period.lower() == 'ytd' else None
 
-                    # FIX: Fetch 1y data for SMA50 and SMA200 calculations (need 200+ days)
-                    hist_1y = ticker.history(period='1y')  # Need 1y for SMA50 and SMA200
-                    closes = hist_1y['Close'].values if not hist_1y.empty else hist['Close'].values
-                    logger.debug(f"📊 {index_info['symbol']}: Fetched {len(closes)} days for SMA calculations")
-
-                    # Technical indicators using TA library (consistent with stocks)
-                    rsi_value = 50.0
-                    macd_line = 0.0
-                    signal_line = 0.0
-                    histogram = 0.0
-
-                    try:
-                        # Convert to pandas Series for TA library
-                        close_series = pd.Series(closes)
-
-                        # RSI using TA library
-                        if len(close_series) >= 14:
-                            rsi_indicator = RSIIndicator(close=close_series, window=14)
-                            rsi_value = safe_float(rsi_indicator.rsi().iloc[-1])
-
-                        # MACD using TA library
-                        if len(close_series) >= 26:
-                            macd_indicator = MACD(close=close_series)
-                            macd_line = safe_float(macd_indicator.macd().iloc[-1])
-                            signal_line = safe_float(macd_indicator.macd_signal().iloc[-1])
-                            histogram = macd_line - signal_line
-                    except Exception as e:
-                        logger.warning(f"⚠️ TA calculation failed for {index_info['symbol']}: {e}")
-
-                    # Moving averages (calculated from 1y historical data)
-                    sma20 = safe_float(np.mean(closes[-20:]) if len(closes) >= 20 else np.mean(closes))
-                    sma50 = safe_float(np.mean(closes[-50:]) if len(closes) >= 50 else np.mean(closes))
-                    sma200 = safe_float(np.mean(closes[-200:]) if len(closes) >= 200 else np.mean(closes))
-                    logger.debug(f"📈 {index_info['symbol']}: SMA20={sma20:.2f}, SMA50={sma50:.2f}, SMA200={sma200:.2f}")
-
-                    # Bollinger Bands
-                    if len(closes) >= 20:
-                        bb_period = closes[-20:]
-                        bb_mean = np.mean(bb_period)
-                        bb_std = np.std(bb_period)
-                        bb_upper = bb_mean + (2 * bb_std)
-                        bb_lower = bb_mean - (2 * bb_std)
-                    else:
-                        bb_mean = current_price
-                        bb_upper = current_price * 1.02
-                        bb_lower = current_price * 0.98
-
-                    index_data = {
-                        'symbol': index_info['symbol'],
-                        'name': index_info['name'],
-                        'category': index_info['category'],
-                        'price': current_price,
-                        'change': safe_float(change),
-                        'changePercent': safe_float(change_percent),
-                        'volume': safe_float(hist['Volume'].iloc[-1] if 'Volume' in hist else 0),
-                        'marketCap': MARKET_CAP_MAPPING.get(index_info['symbol'], safe_float(info.get('marketCap', 1e12))),
-                        'technical': {
-                            'rsi': rsi_value,
-                            'macd': {
-                                'macd': safe_float(macd_line),
-                                'signal': safe_float(signal_line),
-                                'histogram': safe_float(macd_line - signal_line)
-                            },
-                            'sma20': sma20,
-                            'sma50': sma50,
-                            'sma200': sma200,
-                            'bollinger': {
-                                'upper': safe_float(bb_upper),
-                                'middle': safe_float(bb_mean),
-                                'lower': safe_float(bb_lower)
-                            }
-                        },
-                        'lastUpdated': int(time.time() * 1000)
-                    }
-
-                    logger.info(f"✅ {index_info['symbol']}: {current_price:.2f} ({change_percent:+.2f}%)")
-                    return index_data
-                else:
-                    logger.warning(f"⚠️ No data for {index_info['symbol']}")
-                    return None
-
-            except Exception as e:
-                logger.error(f"❌ Failed {index_info['symbol']}: {e}")
-                return None
-
-        # PARALLEL FETCHING with 10 workers
-        indices_data = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_index = {executor.submit(fetch_single_index, idx): idx for idx in COMPREHENSIVE_INDICES}
-
-            for future in as_completed(future_to_index):
-                result = future.result()
-                if result:
-                    indices_data.append(result)
+        # PARALLEL FETCHING - asyncio.gather bounded by a semaphore instead of a 10-worker thread pool
+        semaphore = asyncio.Semaphore(INDEX_FETCH_CONCURRENCY)
+        results = await asyncio.gather(*(fetch_single_index(idx, window_bars, window_start, semaphore) for idx in COMPREHENSIVE_INDICES))
+        indices_data = [result for result in results if result]
 
         elapsed = time.time() - start_time
         logger.info(f"🎉 Fetched {len(indices_data)}/{len(COMPREHENSIVE_INDICES)} indices in {elapsed:.2f}s (PARALLEL, NO CHARTS)")
 
-        # Cache for 5 minutes (period-specific)
+        # Cache per period (TTL_BY_PERIOD, longer off-hours)
         _indices_data_cache[period_key]['data'] = indices_data
         _indices_data_cache[period_key]['timestamp'] = time.time()
+        disk_cache_store('indices', period_key, indices_data, _indices_data_cache[period_key]['timestamp'], period_cache_ttl(period_key))
         logger.info(f"💾 Cached indices data for period {period}")
 
         return indices_data
@@ -1339,56 +2627,55 @@ def get_comprehensive_indices_data(period='1d'):
         logger.error(f"❌ Critical error in get_comprehensive_indices_data: {e}")
         return []
 
-def get_comprehensive_sectors_data(period='1d'):
-    """Get REAL comprehensive sector analysis based on actual stock data"""
+def get_comprehensive_sectors_data(period='1d', stocks_data=None):
+    """Get REAL comprehensive sector analysis based on actual stock data (pass stocks_data to skip the fetch)"""
     try:
         logger.info(f"🏭 Building REAL sector analysis for period {period}... (FIX: Now uses period parameter)")
-        stocks_data = get_comprehensive_stocks_data(period)
+        if stocks_data is None:
+            stocks_data = get_comprehensive_stocks_data(period, include_earnings=False)
 
         if not stocks_data:
             logger.error("❌ No stocks data available for sector analysis")
             return []
 
-        # Group stocks by sector
-        sectors_dict = {}
-        for stock in stocks_data:
-            sector = stock['sector']
-            if sector not in sectors_dict:
-                sectors_dict[sector] = []
-            sectors_dict[sector].append(stock)
-
+        # PERFORMANCE FIX: One groupby over the cached columnar frame replaces the per-sector Python sum/max/min passes
+        df = stocks_frame(stocks_data)[['sector', 'marketCap', 'changePercent', 'volume']].reset_index(drop=True)
+        g = df.groupby('sector', sort=False)
+        agg = g.agg(
+            totalMarketCap=('marketCap', 'sum'),
+            avgChange=('changePercent', 'mean'),
+            totalVolume=('volume', 'sum'),
+            stockCount=('marketCap', 'size')
+        )
+        top_gainer_idx = g['changePercent'].idxmax()
+        top_loser_idx = g['changePercent'].idxmin()
+
+        # Calculate weight for each stock in its sector (equal weight when the sector has no market cap)
+        sector_cap = g['marketCap'].transform('sum').to_numpy()
+        sector_count = g['marketCap'].transform('size').to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weights = np.where(sector_cap > 0, df['marketCap'].to_numpy() / sector_cap, 1.0 / sector_count)
+        for stock, weight in zip(stocks_data, weights.tolist()):
+            stock['weight'] = safe_float(weight)
+
+        members = g.indices
         sectors_data = []
-        for sector_name, sector_stocks in sectors_dict.items():
-            if sector_stocks:
-                total_market_cap = sum(stock['marketCap'] for stock in sector_stocks)
-                avg_change = sum(stock['changePercent'] for stock in sector_stocks) / len(sector_stocks)
-                total_volume = sum(stock['volume'] for stock in sector_stocks)
-
-                # Calculate weight for each stock in the sector
-                for stock in sector_stocks:
-                    if total_market_cap > 0:
-                        stock['weight'] = safe_float(stock['marketCap'] / total_market_cap)
-                    else:
-                        stock['weight'] = safe_float(1.0 / len(sector_stocks))
-
-                # Find top gainer and loser in sector
-                top_gainer = max(sector_stocks, key=lambda x: x['changePercent'])
-                top_loser = min(sector_stocks, key=lambda x: x['changePercent'])
-
-                sector_data = {
-                    'name': sector_name,
-                    'stocks': sector_stocks,
-                    'totalMarketCap': safe_float(total_market_cap),
-                    'avgChange': safe_float(avg_change),
-                    'totalVolume': safe_float(total_volume),
-                    'topGainer': top_gainer,
-                    'topLoser': top_loser,
-                    'performance': safe_float(avg_change),
-                    'stockCount': len(sector_stocks)
-                }
+        for sector_name, row in zip(agg.index, agg.itertuples(index=False)):
+            avg_change = row.avgChange
+            sector_data = {
+                'name': sector_name,
+                'stocks': [stocks_data[i] for i in members[sector_name]],
+                'totalMarketCap': safe_float(row.totalMarketCap),
+                'avgChange': safe_float(avg_change),
+                'totalVolume': safe_float(row.totalVolume),
+                'topGainer': stocks_data[top_gainer_idx[sector_name]],
+                'topLoser': stocks_data[top_loser_idx[sector_name]],
+                'performance': safe_float(avg_change),
+                'stockCount': int(row.stockCount)
+            }
 
-                sectors_data.append(sector_data)
-                logger.info(f"✅ Sector {sector_name}: {len(sector_stocks)} stocks, avg change: {avg_change:.2f}%")
+            sectors_data.append(sector_data)
+            logger.info(f"✅ Sector {sector_name}: {sector_data['stockCount']} stocks, avg change: {avg_change:.2f}%")
 
         logger.info(f"🎉 Successfully processed {len(sectors_data)} REAL sectors with {len(stocks_data)} total stocks")
         return sectors_data
@@ -1397,26 +2684,26 @@ def get_comprehensive_sectors_data(period='1d'):
         logger.error(f"❌ Critical error in get_comprehensive_sectors_data: {e}")
         return []
 
-def get_market_movers_data(period='1d'):
-    """Get REAL market movers based on actual stock data"""
+def get_market_movers_data(period='1d', stocks_data=None):
+    """Get REAL market movers based on actual stock data (pass stocks_data to skip the fetch)"""
     try:
         logger.info(f"🎯 Computing REAL market movers for period {period}... (FIX: Now uses period parameter)")
-        stocks_data = get_comprehensive_stocks_data(period)
+        if stocks_data is None:
+            stocks_data = get_comprehensive_stocks_data(period, include_earnings=False)
 
         if not stocks_data:
             logger.error("❌ No stocks data available for market movers")
             return {'topGainers': [], 'topLosers': [], 'mostActive': []}
 
-        # Sort by change percentage
-        sorted_by_change = sorted(stocks_data, key=lambda x: x['changePercent'], reverse=True)
-
-        # Sort by volume
-        sorted_by_volume = sorted(stocks_data, key=lambda x: x['volume'], reverse=True)
+        # PERFORMANCE FIX: argpartition selection of the 10 winners per list instead of two full sorts
+        frame = stocks_frame(stocks_data)
+        changes = frame['changePercent'].to_numpy(dtype=np.float64)
+        volumes = frame['volume'].to_numpy(dtype=np.float64)
 
         movers = {
-            'topGainers': sorted_by_change[:10],
-            'topLosers': sorted_by_change[-10:],
-            'mostActive': sorted_by_volume[:10]
+            'topGainers': [stocks_data[i] for i in top_n_indices(changes, 10)],
+            'topLosers': [stocks_data[i] for i in top_n_indices(changes, 10, largest=False)[::-1]],  # worst last, as before
+            'mostActive': [stocks_data[i] for i in top_n_indices(volumes, 10)]
         }
 
         if movers['topGainers']:
@@ -1441,6 +2728,7 @@ async def health_check():
         "status": "healthy",
         "service": "xStocks Intel Microservice",
         "version": "2.0.0-BL-FRONTIER",
+        "cachedDedupe": inflight_stats['cached_dedupe'],
         "timestamp": int(time.time() * 1000)
     }
 
@@ -1455,6 +2743,21 @@ async def get_version():
         "timestamp": int(time.time() * 1000)
     }
 
+@app.get("/config/symbols")
+async def get_config_symbols():
+    """xStock -> ticker mapping (pre-serialized at startup)"""
+    return Response(content=_SYMBOLS_JSON, media_type="application/json")
+
+@app.get("/config/sectors")
+async def get_config_sectors():
+    """Ticker -> sector mapping (pre-serialized at startup)"""
+    return Response(content=_SECTORS_JSON, media_type="application/json")
+
+@app.get("/config/indices")
+async def get_config_indices():
+    """Tracked market indices (pre-serialized at startup)"""
+    return Response(content=_INDICES_JSON, media_type="application/json")
+
 @app.get("/warmup-status")
 async def get_warmup_status():
     """Get cache warmup progress status"""
@@ -1502,63 +2805,59 @@ async def get_batch_realtime_data_v2(symbols: str = Query(..., description="Comm
         # Check cache
         cache_key = f"batch_v2_{'_'.join(sorted(xstock_symbols))}"
         try:
-            cached = await get_cache(cache_key)
+            cached = await get_cache_response(cache_key)
             if cached:
                 logger.info(f"Batch cache HIT for {len(xstock_symbols)} symbols")
-                return JSONResponse(content=cached)
+                return cached
         except:
             pass  # Cache miss is fine
 
-        # Fetch all symbols in parallel for maximum performance
-        async def fetch_one_symbol(xstock_symbol: str):
-            """Fetch single symbol data in thread pool (yfinance is blocking)"""
-            try:
-                # Map xStock to real symbol
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
-                if not real_symbol:
-                    return {
-                        "symbol": xstock_symbol,
-                        "error": "Symbol not found",
-                        "timestamp": int(time.time() * 1000)
-                    }
-
-                # Fetch data in thread pool (yfinance blocks)
-                real_symbol_clean = real_symbol.replace('.', '-')
-
-                def fetch_blocking():
-                    ticker = yf.Ticker(real_symbol_clean)
-                    return ticker.info
-
-                # Run blocking call in thread pool
-                loop = asyncio.get_event_loop()
-                info = await loop.run_in_executor(None, fetch_blocking)
+        # PERFORMANCE FIX: one batched v7 quote request per 20 symbols instead of a full ticker.info
+        # (every quoteSummary module plus a quote call) per symbol
+        def symbol_row(xstock_symbol: str, quote: dict) -> dict:
+            """Batch entry for one symbol from its v7 quote"""
+            now_ms = int(time.time() * 1000)
+            return {
+                "symbol": xstock_symbol,
+                "name": quote.get('shortName') or xstock_symbol,
+                "sector": STOCK_SECTOR_MAPPING.get(quote.get('symbol'), 'Unknown'),
+                "price": float(quote.get('regularMarketPrice') or 0),
+                "change": float(quote.get('regularMarketChange') or 0),
+                "changePercent": float(quote.get('regularMarketChangePercent') or 0),
+                "volume": int(quote.get('regularMarketVolume') or 0),
+                "marketCap": float(quote.get('marketCap') or 0),
+                "timestamp": now_ms,
+                "lastUpdate": now_ms
+            }
 
-                return {
-                    "symbol": xstock_symbol,
-                    "name": info.get('shortName', xstock_symbol),
-                    "sector": info.get('sector', 'Unknown'),
-                    "price": float(info.get('currentPrice', 0) or info.get('regularMarketPrice', 0)),
-                    "change": float(info.get('regularMarketChange', 0)),
-                    "changePercent": float(info.get('regularMarketChangePercent', 0)),
-                    "volume": int(info.get('volume', 0)),
-                    "marketCap": float(info.get('marketCap', 0)),
-                    "timestamp": int(time.time() * 1000),
-                    "lastUpdate": int(time.time() * 1000)
-                }
-            except Exception as e:
-                logger.error(f"Error fetching {xstock_symbol}: {e}")
-                return {
-                    "symbol": xstock_symbol,
-                    "error": str(e),
-                    "timestamp": int(time.time() * 1000)
-                }
+        real_by_xstock = {sym: STOCK_SYMBOLS_YF.get(sym) for sym in xstock_symbols}
+        quotes = await fetch_quotes_batched(list(dict.fromkeys(r for r in real_by_xstock.values() if r)))
 
-        # Fetch all symbols in parallel
-        results = await asyncio.gather(*[fetch_one_symbol(sym) for sym in xstock_symbols])
+        results = []
+        for xstock_symbol, real_symbol in real_by_xstock.items():
+            quote = quotes.get(real_symbol) if real_symbol else None
+            if quote:
+                try:
+                    results.append(symbol_row(xstock_symbol, quote))
+                    continue
+                except Exception as e:
+                    logger.error(f"Error fetching {xstock_symbol}: {e}")
+                    error = str(e)
+            else:
+                error = "Symbol not found" if not real_symbol else f"No quote data for {real_symbol}"
+            results.append({
+                "symbol": xstock_symbol,
+                "error": error,
+                "timestamp": int(time.time() * 1000)
+            })
 
-        # Cache results
+        # Cache results - batch key plus per-symbol realtime keys in one pipelined write
         try:
-            await set_cache(cache_key, results, ttl_seconds=120)
+            cache_items = {cache_key: results}
+            for item in results:
+                if 'error' not in item:
+                    cache_items[f"realtime_{item['symbol']}"] = item
+            await set_cache_many(cache_items, ttl_seconds=120)
         except Exception as cache_err:
             logger.warning(f"Cache error: {cache_err}")
 
@@ -1568,7 +2867,7 @@ async def get_batch_realtime_data_v2(symbols: str = Query(..., description="Comm
         duration = (time.time() - start_time) * 1000
         logger.info(f"✅ Batch request completed: {len(results)} symbols in {duration:.0f}ms")
 
-        return JSONResponse(content=results)
+        return orjson_response(results)
 
 @app.get("/api/heatmap")
 async def get_heatmap_data(period: str = Query("1d", description="Time period: 1d, 1w, 1mo, 3mo, ytd, 1y")):
@@ -1578,91 +2877,127 @@ async def get_heatmap_data(period: str = Query("1d", description="Time period: 1
     """
     cache_key = f"heatmap_{period}"
 
-    # Try cache first (5 min TTL)
-    cached_data = await get_cache(cache_key)
-    if cached_data:
-        return cached_data
-
-    try:
+    # Cached with stale-while-revalidate (5 min TTL)
+    async def build_heatmap():
+        """Fetch and assemble the heatmap payload"""
         all_symbols = list(STOCK_SYMBOLS.keys())
 
-        # Map period to yfinance format
-        period_map = {
-            "1d": ("1d", "1d"),
-            "1w": ("5d", "5d"),
-            "1mo": ("1mo", "1mo"),
-            "3mo": ("3mo", "3mo"),
-            "ytd": ("ytd", "ytd"),
-            "1y": ("1y", "1y")
-        }
-        yf_period, _ = period_map.get(period, ("1d", "1d"))
+        def heatmap_row(xstock_symbol: str, real_symbol: str, quote: dict, key_stats: dict) -> dict:
+            """Heatmap entry for one stock from its v7 quote (+ defaultKeyStatistics for beta)"""
+            # ALWAYS use regularMarketChange for daily change (from yesterday's close to current price)
+            # This matches Google Finance, Yahoo Finance, and all other financial platforms
+            change_percent = float(quote.get('regularMarketChangePercent') or 0)
 
-        async def fetch_stock_heatmap_data(xstock_symbol: str):
-            """Fetch stock data for heatmap"""
+            # Volume ratio (current vs average)
+            current_volume = float(quote.get('regularMarketVolume') or 0)
+            avg_volume = float(quote.get('averageDailyVolume3Month') or 1)
+            volume_ratio = (current_volume / avg_volume) if avg_volume > 0 else 1.0
+
+            return {
+                'symbol': xstock_symbol,
+                'name': quote.get('longName') or quote.get('shortName') or xstock_symbol,
+                'price': float(quote.get('regularMarketPrice') or 0),
+                'change': float(quote.get('regularMarketChange') or 0),
+                'changePercent': change_percent,
+                'volume': int(current_volume),
+                'marketCap': float(quote.get('marketCap') or 0),
+                'sector': STOCK_SECTOR_MAPPING.get(real_symbol, 'Unknown'),
+                'pe': _fopt(quote.get('trailingPE')),
+                'forwardPE': _fopt(quote.get('forwardPE')),
+                'eps': _fopt(quote.get('epsTrailingTwelveMonths')),
+                'dividendYield': _fopt(quote.get('dividendYield'), 100),
+                'volumeRatio': float(volume_ratio),
+                'averageVolume': int(avg_volume),
+                'beta': _fopt(key_stats.get('beta'))
+            }
+
+        # Fetch all stocks with ~4 batched quote requests; beta comes from the (day-cached) key statistics
+        real_by_xstock = xstock_real_symbols(all_symbols)
+        real_symbols = list(real_by_xstock.values())
+        quotes, key_statistics = await asyncio.gather(
+            fetch_quotes_batched(real_symbols),
+            fetch_key_statistics_batched(real_symbols)
+        )
+        all_stock_data = []
+        for xstock_symbol, real_symbol in real_by_xstock.items():
+            quote = quotes.get(real_symbol)
+            if not quote:
+                continue
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
-                if not real_symbol:
-                    return None
+                all_stock_data.append(heatmap_row(xstock_symbol, real_symbol, quote, key_statistics.get(real_symbol) or {}))
+            except Exception as e:
+                logger.warning(f"Could not build heatmap data for {xstock_symbol}: {e}")
 
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    info = ticker.info
+        result = {
+            'stocks': all_stock_data,
+            'period': period,
+            'totalStocks': len(all_stock_data),
+            'timestamp': int(time.time() * 1000)
+        }
 
-                    # ALWAYS use regularMarketChange for daily change (from yesterday's close to current price)
-                    # This matches Google Finance, Yahoo Finance, and all other financial platforms
-                    change_percent = float(info.get('regularMarketChangePercent', 0))
+        return result
 
-                    # Volume ratio (current vs average)
-                    current_volume = float(info.get('volume', 0))
-                    avg_volume = float(info.get('averageVolume', 1))
-                    volume_ratio = (current_volume / avg_volume) if avg_volume > 0 else 1.0
+    try:
+        return await cached_swr(cache_key, 300, build_heatmap)
+    except Exception as e:
+        logger.error(f"Heatmap API error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch heatmap data: {str(e)}")
 
-                    return {
-                        'symbol': xstock_symbol,
-                        'name': info.get('longName', xstock_symbol),
-                        'price': float(info.get('currentPrice', 0) or info.get('regularMarketPrice', 0)),
-                        'change': float(info.get('regularMarketChange', 0)),
-                        'changePercent': float(change_percent),
-                        'volume': int(current_volume),
-                        'marketCap': float(info.get('marketCap', 0)),
-                        'sector': info.get('sector', 'Unknown'),
-                        'pe': float(info.get('trailingPE', 0)) if info.get('trailingPE') else None,
-                        'forwardPE': float(info.get('forwardPE', 0)) if info.get('forwardPE') else None,
-                        'eps': float(info.get('trailingEps', 0)) if info.get('trailingEps') else None,
-                        'dividendYield': float(info.get('dividendYield', 0) * 100) if info.get('dividendYield') else None,
-                        'volumeRatio': float(volume_ratio),
-                        'averageVolume': int(avg_volume),
-                        'beta': float(info.get('beta', 0)) if info.get('beta') else None
-                    }
+# /api/indices period -> yfinance history period (built once, not per index fetch)
+INDEX_PERIOD_MAP = MappingProxyType({"1d": "1d", "1w": "5d", "1mo": "1mo"})
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
-            except Exception as e:
-                logger.warning(f"Could not fetch heatmap data for {xstock_symbol}: {e}")
-                return None
+# PERFORMANCE FIX: Index technicals memoized per bar set - keyed by (symbol, interval, bar count, last bar
+# timestamp, last close) so back-to-back fetches returning the same bars skip the indicator math, while a
+# still-forming bar (same timestamp, new close) is recomputed. Filled from YF_POOL threads, hence the lock.
+_index_ta_memo: LRUCache = LRUCache(maxsize=256)
+_index_ta_memo_lock = threading.Lock()
+
+def index_technicals(hist: pd.DataFrame) -> dict:
+    """Latest RSI(14), MACD(12,26,9) and SMA20/50/200 for an index history frame"""
+    # Only the latest value of each indicator is shown, so compute scalars straight from one float64
+    # close array (Numba kernels, trailing-slice SMAs) instead of full RSI/MACD point lists and rolling()
+    technicals = {}
+    closes = hist['Close'].to_numpy(dtype=np.float64)
+    valid_closes = np.ascontiguousarray(closes[np.isfinite(closes)])
+
+    # RSI (14 periods)
+    if len(hist) >= 15:
+        rsi = rsi_last(valid_closes, 14)
+        if np.isfinite(rsi):
+            technicals['rsi'] = float(rsi)
+
+    # MACD
+    if len(hist) >= 26 and valid_closes.size:
+        macd, signal, histogram = macd_last(valid_closes, 2.0 / 13, 2.0 / 27, 2.0 / 10)
+        technicals['macd'] = {
+            'macd': float(macd),
+            'signal': float(signal),
+            'histogram': float(histogram)
+        }
 
-        # Fetch all stocks in parallel (batches of 10)
-        batch_size = 10
-        all_stock_data = []
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i+batch_size]
-            batch_results = await asyncio.gather(*[fetch_stock_heatmap_data(sym) for sym in batch])
-            all_stock_data.extend([r for r in batch_results if r is not None])
+    # Moving Averages (if enough data)
+    if len(hist) >= 20:
+        technicals['sma20'] = float(closes[-20:].mean())
 
-        result = {
-            'stocks': all_stock_data,
-            'period': period,
-            'totalStocks': len(all_stock_data),
-            'timestamp': int(time.time() * 1000)
-        }
+    if len(hist) >= 50:
+        technicals['sma50'] = float(closes[-50:].mean())
 
-        # Cache for 5 minutes
-        await set_cache(cache_key, result, ttl_seconds=300)
-        return result
+    if len(hist) >= 200:
+        technicals['sma200'] = float(closes[-200:].mean())
 
-    except Exception as e:
-        logger.error(f"Heatmap API error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch heatmap data: {str(e)}")
+    return technicals
+
+def index_technicals_cached(symbol: str, interval: str, hist: pd.DataFrame) -> dict:
+    """index_technicals memoized on the bar set's identity (see _index_ta_memo)"""
+    key = (symbol, interval, len(hist), int(hist.index[-1].value), float(hist['Close'].iloc[-1]))
+    with _index_ta_memo_lock:
+        technicals = _index_ta_memo.get(key)
+    if technicals is None:
+        technicals = index_technicals(hist)
+        with _index_ta_memo_lock:
+            _index_ta_memo[key] = technicals
+    # Callers get their own copy so the memoized dict is never mutated downstream
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in technicals.items()}
 
 @app.get("/api/indices")
 async def get_market_indices(period: str = Query("1d", description="Time period for charts: 1d, 1w, 1mo")):
@@ -1672,12 +3007,9 @@ async def get_market_indices(period: str = Query("1d", description="Time period
     """
     cache_key = f"indices_{period}"
 
-    # Try cache first (2 min TTL for real-time feel)
-    cached_data = await get_cache(cache_key)
-    if cached_data:
-        return cached_data
-
-    try:
+    # Cached with stale-while-revalidate (2 min TTL for real-time feel)
+    async def build_indices():
+        """Fetch and assemble the indices payload"""
         indices = {
             'sp500': '^GSPC',
             'nasdaq': '^IXIC',
@@ -1689,17 +3021,13 @@ async def get_market_indices(period: str = Query("1d", description="Time period
             """Fetch index data with technical indicators"""
             try:
                 def fetch():
-                    ticker = yf.Ticker(ticker_symbol)
+                    ticker = yf.Ticker(ticker_symbol, session=SHARED_YF_SESSION)
                     info = ticker.info
 
                     # Get historical data for period
-                    period_map = {
-                        "1d": "1d",
-                        "1w": "5d",
-                        "1mo": "1mo"
-                    }
-                    yf_period = period_map.get(period, "1d")
-                    hist = ticker.history(period=yf_period, interval="5m" if period == "1d" else "1d", timeout=10)
+                    yf_period = INDEX_PERIOD_MAP.get(period, "1d")
+                    interval = "5m" if period == "1d" else "1d"
+                    hist = ticker.history(period=yf_period, interval=interval, timeout=10)
 
                     if hist.empty or len(hist) < 2:
                         return None
@@ -1710,50 +3038,11 @@ async def get_market_indices(period: str = Query("1d", description="Time period
                     change = end_price - start_price
                     change_percent = (change / start_price) * 100
 
-                    # Calculate technical indicators
-                    technicals = {}
-
-                    # RSI (14 periods)
-                    if len(hist) >= 15:
-                        rsi_data = calculate_rsi(hist, 14)
-                        if rsi_data and len(rsi_data) > 0:
-                            technicals['rsi'] = rsi_data[-1]['value']
-
-                    # MACD
-                    if len(hist) >= 26:
-                        macd_data = calculate_macd(hist)
-                        if macd_data and 'histogram' in macd_data and len(macd_data['histogram']) > 0:
-                            technicals['macd'] = {
-                                'macd': macd_data['macd'][-1]['value'] if macd_data['macd'] else None,
-                                'signal': macd_data['signal'][-1]['value'] if macd_data['signal'] else None,
-                                'histogram': macd_data['histogram'][-1]['value']
-                            }
-
-                    # Moving Averages (if enough data)
-                    if len(hist) >= 20:
-                        sma20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-                        technicals['sma20'] = float(sma20)
-
-                    if len(hist) >= 50:
-                        sma50 = hist['Close'].rolling(window=50).mean().iloc[-1]
-                        technicals['sma50'] = float(sma50)
-
-                    if len(hist) >= 200:
-                        sma200 = hist['Close'].rolling(window=200).mean().iloc[-1]
-                        technicals['sma200'] = float(sma200)
+                    # Calculate technical indicators (memoized per identical bar set)
+                    technicals = index_technicals_cached(ticker_symbol, interval, hist)
 
                     # Chart data
-                    chart_data = [
-                        {
-                            'time': int(index.timestamp()),
-                            'open': float(row['Open']),
-                            'high': float(row['High']),
-                            'low': float(row['Low']),
-                            'close': float(row['Close']),
-                            'volume': int(row['Volume']) if 'Volume' in row else 0
-                        }
-                        for index, row in hist.iterrows()
-                    ]
+                    chart_data = ohlcv_records(hist)
 
                     return {
                         'key': index_key,
@@ -1767,8 +3056,8 @@ async def get_market_indices(period: str = Query("1d", description="Time period
                         'chart': chart_data
                     }
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch index data for {index_key}: {e}")
                 return None
@@ -1786,10 +3075,10 @@ async def get_market_indices(period: str = Query("1d", description="Time period
             'timestamp': int(time.time() * 1000)
         }
 
-        # Cache for 2 minutes
-        await set_cache(cache_key, result, ttl_seconds=120)
         return result
 
+    try:
+        return await cached_swr(cache_key, 120, build_indices)
     except Exception as e:
         logger.error(f"Indices API error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch indices data: {str(e)}")
@@ -1802,26 +3091,23 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
     """
     cache_key = f"market_news_{limit}"
 
-    # Try cache first (10 min TTL)
-    cached_data = await get_cache(cache_key)
-    if cached_data:
-        return cached_data
-
-    try:
+    # Cached with stale-while-revalidate (10 min TTL)
+    async def build_news():
+        """Fetch and assemble the market news payload"""
         # Get news from top 20 stocks by market cap
         top_symbols = ['AAPLx', 'MSFTx', 'GOOGLx', 'AMZNx', 'NVDAx', 'TSLAx', 'METAx', 'BRKBx', 'JPMx', 'V.x']
 
         async def fetch_stock_news(xstock_symbol: str):
             """Fetch news for a stock"""
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     logger.debug(f"No mapping found for {xstock_symbol}")
                     return []
 
                 def fetch():
                     try:
-                        ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                         news_list = []
 
                         # Try to fetch news using the news property
@@ -1867,7 +3153,6 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
                                     pub_date = content.get('pubDate')
                                     if pub_date:
                                         # Parse ISO format: "2025-10-03T14:56:00Z"
-                                        from datetime import datetime
                                         try:
                                             dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
                                             publish_time = int(dt.timestamp())
@@ -1889,7 +3174,8 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
                                         if not thumbnail_url and thumbnail.get('originalUrl'):
                                             thumbnail_url = thumbnail['originalUrl']
 
-                                    news_list.append({
+                                    # (title fingerprint, article) - dedupe later compares ints, not long titles
+                                    news_list.append((hash(title.strip().lower()), {
                                         "symbol": xstock_symbol,
                                         "title": title,
                                         "publisher": publisher,
@@ -1897,7 +3183,7 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
                                         "publishedDate": publish_time * 1000 if publish_time else int(time.time() * 1000),
                                         "type": content.get('contentType', content.get('type', 'STORY')),
                                         "thumbnail": thumbnail_url
-                                    })
+                                    }))
                                 except Exception as e:
                                     logger.warning(f"Error parsing article for {real_symbol}: {e}")
                                     continue
@@ -1909,8 +3195,8 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
                         logger.warning(f"Error fetching news for {real_symbol}: {e}")
                         return []
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch news for {xstock_symbol}: {e}")
                 return []
@@ -1918,23 +3204,16 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
         # Fetch news from all stocks in parallel
         results = await asyncio.gather(*[fetch_stock_news(sym) for sym in top_symbols])
 
-        # Flatten and sort by date
-        all_news = []
+        # Remove duplicates by title fingerprint, keeping the most recent copy of each story
+        latest_by_fp: Dict[int, dict] = {}
         for news_list in results:
-            all_news.extend(news_list)
-
-        # Sort by published date (most recent first)
-        all_news.sort(key=lambda x: x['publishedDate'] or 0, reverse=True)
+            for fp, article in news_list:
+                current = latest_by_fp.get(fp)
+                if current is None or (article['publishedDate'] or 0) > (current['publishedDate'] or 0):
+                    latest_by_fp[fp] = article
 
-        # Remove duplicates by title
-        seen_titles = set()
-        unique_news = []
-        for article in all_news:
-            if article['title'] not in seen_titles:
-                seen_titles.add(article['title'])
-                unique_news.append(article)
-                if len(unique_news) >= limit:
-                    break
+        # Most recent first - partial selection instead of sorting every article
+        unique_news = heapq.nlargest(limit, latest_by_fp.values(), key=lambda x: x['publishedDate'] or 0)
 
         result = {
             'success': True,
@@ -1943,10 +3222,10 @@ async def get_market_news(limit: int = Query(20, description="Number of news art
             'timestamp': int(time.time() * 1000)
         }
 
-        # Cache for 10 minutes
-        await set_cache(cache_key, result, ttl_seconds=600)
         return result
 
+    try:
+        return await cached_swr(cache_key, 600, build_news)
     except Exception as e:
         logger.error(f"Market news API error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch market news: {str(e)}")
@@ -1959,60 +3238,50 @@ async def get_unusual_volume():
     """
     cache_key = "unusual_volume"
 
-    # Try cache first (5 min TTL)
-    cached_data = await get_cache(cache_key)
-    if cached_data:
-        return cached_data
-
-    try:
+    # Cached with stale-while-revalidate (5 min TTL)
+    async def build_unusual_volume():
+        """Fetch and assemble the unusual-volume payload"""
         all_symbols = list(STOCK_SYMBOLS.keys())
 
-        async def check_volume(xstock_symbol: str):
-            """Check if stock has unusual volume"""
-            try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
-                if not real_symbol:
-                    return None
-
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    info = ticker.info
+        def check_volume(xstock_symbol: str, real_symbol: str, quote: dict):
+            """Unusual-volume entry from a v7 quote (None unless volume is 2x+ average)"""
+            current_volume = float(quote.get('regularMarketVolume') or 0)
+            avg_volume = float(quote.get('averageDailyVolume3Month') or 1)
 
-                    current_volume = float(info.get('volume', 0))
-                    avg_volume = float(info.get('averageVolume', 1))
+            if avg_volume == 0 or current_volume == 0:
+                return None
 
-                    if avg_volume == 0 or current_volume == 0:
-                        return None
+            volume_ratio = current_volume / avg_volume
 
-                    volume_ratio = current_volume / avg_volume
-
-                    # Only return if volume is 2x or more above average
-                    if volume_ratio >= 2.0:
-                        return {
-                            'symbol': xstock_symbol,
-                            'name': info.get('longName', xstock_symbol),
-                            'price': float(info.get('currentPrice', 0) or info.get('regularMarketPrice', 0)),
-                            'changePercent': float(info.get('regularMarketChangePercent', 0)),
-                            'volume': int(current_volume),
-                            'averageVolume': int(avg_volume),
-                            'volumeRatio': float(volume_ratio),
-                            'sector': info.get('sector', 'Unknown')
-                        }
-                    return None
+            # Only return if volume is 2x or more above average
+            if volume_ratio >= 2.0:
+                return {
+                    'symbol': xstock_symbol,
+                    'name': quote.get('longName') or quote.get('shortName') or xstock_symbol,
+                    'price': float(quote.get('regularMarketPrice') or 0),
+                    'changePercent': float(quote.get('regularMarketChangePercent') or 0),
+                    'volume': int(current_volume),
+                    'averageVolume': int(avg_volume),
+                    'volumeRatio': float(volume_ratio),
+                    'sector': STOCK_SECTOR_MAPPING.get(real_symbol, 'Unknown')
+                }
+            return None
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+        # Check all stocks with ~4 batched quote requests
+        real_by_xstock = xstock_real_symbols(all_symbols)
+        quotes = await fetch_quotes_batched(list(real_by_xstock.values()))
+        unusual_stocks = []
+        for xstock_symbol, real_symbol in real_by_xstock.items():
+            quote = quotes.get(real_symbol)
+            if not quote:
+                continue
+            try:
+                entry = check_volume(xstock_symbol, real_symbol, quote)
             except Exception as e:
                 logger.warning(f"Could not check volume for {xstock_symbol}: {e}")
-                return None
-
-        # Check all stocks in parallel (batches of 10)
-        batch_size = 10
-        unusual_stocks = []
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i+batch_size]
-            batch_results = await asyncio.gather(*[check_volume(sym) for sym in batch])
-            unusual_stocks.extend([r for r in batch_results if r is not None])
+                continue
+            if entry is not None:
+                unusual_stocks.append(entry)
 
         # Sort by volume ratio (highest first)
         unusual_stocks.sort(key=lambda x: x['volumeRatio'], reverse=True)
@@ -2024,14 +3293,24 @@ async def get_unusual_volume():
             'timestamp': int(time.time() * 1000)
         }
 
-        # Cache for 5 minutes
-        await set_cache(cache_key, result, ttl_seconds=300)
         return result
 
+    try:
+        return await cached_swr(cache_key, 300, build_unusual_volume)
     except Exception as e:
         logger.error(f"Unusual volume API error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to detect unusual volume: {str(e)}")
 
+# Yahoo recommendationKey -> rating-distribution bucket (camelCase for frontend); unknown/'none' keys are not counted
+RATING_BUCKETS = ('strongBuy', 'buy', 'hold', 'sell', 'strongSell')
+RATING_BUCKET = MappingProxyType({
+    'strong_buy': 'strongBuy', 'strongbuy': 'strongBuy',
+    'buy': 'buy', 'outperform': 'buy',
+    'hold': 'hold', 'neutral': 'hold',
+    'underperform': 'sell', 'sell': 'sell',
+    'strong_sell': 'strongSell', 'strongsell': 'strongSell',
+})
+
 @app.get("/api/market/analyst-summary")
 async def get_analyst_summary():
     """
@@ -2040,79 +3319,56 @@ async def get_analyst_summary():
     """
     cache_key = "analyst_summary"
 
-    # Try cache first (1 hour TTL)
-    cached_data = await get_cache(cache_key)
-    if cached_data:
-        return cached_data
-
-    try:
+    # Cached with stale-while-revalidate (1 hour TTL)
+    async def build_analyst_summary():
+        """Fetch and assemble the analyst summary payload"""
         # Use all available xStock symbols from STOCK_SYMBOLS
         all_symbols = list(STOCK_SYMBOLS.keys())
 
-        async def fetch_analyst_data(xstock_symbol: str):
-            """Fetch analyst recommendations for a stock"""
-            try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
-                if not real_symbol:
-                    return None
-
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    info = ticker.info
+        # Names/prices come from ~4 batched v7 quote requests; analyst fields need the financialData
+        # module, read per symbol through its own sub-cache so only stale/missing symbols hit Yahoo
+        real_by_xstock = xstock_real_symbols(all_symbols)
+        real_symbols = list(real_by_xstock.values())
+        quotes, financials = await asyncio.gather(
+            fetch_quotes_batched(real_symbols),
+            fetch_financial_data_batched(real_symbols)
+        )
 
-                    recommendation = info.get('recommendationKey', 'none')
-                    target_high = info.get('targetHighPrice')
-                    target_low = info.get('targetLowPrice')
-                    target_mean = info.get('targetMeanPrice')
-                    num_analysts = info.get('numberOfAnalystOpinions', 0)
+        def analyst_row(xstock_symbol: str, real_symbol: str, financial: dict) -> dict:
+            """Analyst recommendations for a stock from its financialData (+ v7 quote for name/price)"""
+            quote = quotes.get(real_symbol) or {}
 
-                    return {
-                        'symbol': xstock_symbol,
-                        'name': info.get('longName', xstock_symbol),
-                        'recommendation': recommendation,
-                        'targetMean': float(target_mean) if target_mean else None,
-                        'targetHigh': float(target_high) if target_high else None,
-                        'targetLow': float(target_low) if target_low else None,
-                        'numAnalysts': int(num_analysts),
-                        'currentPrice': float(info.get('currentPrice', 0) or info.get('regularMarketPrice', 0)),
-                        'sector': info.get('sector', 'Unknown')
-                    }
+            recommendation = financial.get('recommendationKey') or 'none'
+            target_high = financial.get('targetHighPrice')
+            target_low = financial.get('targetLowPrice')
+            target_mean = financial.get('targetMeanPrice')
+            num_analysts = financial.get('numberOfAnalystOpinions') or 0
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
-            except Exception as e:
-                logger.warning(f"Could not fetch analyst data for {xstock_symbol}: {e}")
-                return None
+            return {
+                'symbol': xstock_symbol,
+                'name': quote.get('longName') or quote.get('shortName') or xstock_symbol,
+                'recommendation': recommendation,
+                'targetMean': _fopt(target_mean),
+                'targetHigh': _fopt(target_high),
+                'targetLow': _fopt(target_low),
+                'numAnalysts': int(num_analysts),
+                'currentPrice': float(financial.get('currentPrice') or quote.get('regularMarketPrice') or 0),
+                'sector': STOCK_SECTOR_MAPPING.get(real_symbol, 'Unknown')
+            }
 
-        # Fetch analyst data in parallel (batches of 10)
-        batch_size = 10
         analyst_data = []
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i+batch_size]
-            batch_results = await asyncio.gather(*[fetch_analyst_data(sym) for sym in batch])
-            analyst_data.extend([r for r in batch_results if r is not None])
-
-        # Calculate rating distribution (camelCase for frontend)
-        rating_counts = {
-            'strongBuy': 0,
-            'buy': 0,
-            'hold': 0,
-            'sell': 0,
-            'strongSell': 0
-        }
+        for xstock_symbol, real_symbol in real_by_xstock.items():
+            financial = financials.get(real_symbol)
+            if financial is None:  # fetch failed - an empty financialData still counts as 'none'
+                continue
+            try:
+                analyst_data.append(analyst_row(xstock_symbol, real_symbol, financial))
+            except Exception as e:
+                logger.warning(f"Could not build analyst data for {xstock_symbol}: {e}")
 
-        for stock in analyst_data:
-            rating = stock['recommendation'].lower()
-            if 'strong_buy' in rating or rating == 'strongbuy':
-                rating_counts['strongBuy'] += 1
-            elif 'buy' in rating:
-                rating_counts['buy'] += 1
-            elif 'hold' in rating:
-                rating_counts['hold'] += 1
-            elif 'sell' in rating and 'strong' not in rating:
-                rating_counts['sell'] += 1
-            elif 'strong_sell' in rating or rating == 'strongsell':
-                rating_counts['strongSell'] += 1
+        # Calculate rating distribution (camelCase for frontend) - one exact-key lookup per stock
+        bucket_counts = Counter(RATING_BUCKET.get(stock['recommendation'].lower()) for stock in analyst_data)
+        rating_counts = {bucket: bucket_counts[bucket] for bucket in RATING_BUCKETS}
 
         # Find top rated stocks (highest upside potential)
         stocks_with_upside = []
@@ -2122,21 +3378,23 @@ async def get_analyst_summary():
                 stock['upside'] = float(upside)
                 stocks_with_upside.append(stock)
 
-        stocks_with_upside.sort(key=lambda x: x['upside'], reverse=True)
+        # Top 10 only - partial selection (same order as sorted(..., reverse=True)[:10]) instead of full sorts
+        top_rated = heapq.nlargest(10, stocks_with_upside, key=lambda x: x['upside'])
+        most_covered = heapq.nlargest(10, analyst_data, key=lambda x: x['numAnalysts'])
 
         result = {
             'success': True,
             'ratingDistribution': rating_counts,
             'totalStocksAnalyzed': len(analyst_data),  # Changed from 'totalAnalyzed'
-            'topRatedStocks': stocks_with_upside[:10],  # Changed from 'topRated'
-            'mostCoveredStocks': sorted(analyst_data, key=lambda x: x['numAnalysts'], reverse=True)[:10],  # Changed from 'mostCovered'
+            'topRatedStocks': top_rated,  # Changed from 'topRated'
+            'mostCoveredStocks': most_covered,  # Changed from 'mostCovered'
             'timestamp': int(time.time() * 1000)
         }
 
-        # Cache for 1 hour
-        await set_cache(cache_key, result, ttl_seconds=3600)
         return result
 
+    try:
+        return await cached_swr(cache_key, 3600, build_analyst_summary)
     except Exception as e:
         logger.error(f"Analyst summary API error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch analyst summary: {str(e)}")
@@ -2151,12 +3409,12 @@ async def get_index_chart_data(
     Returns OHLCV data with technical indicators for market indices
     Supports up to 20 years of historical data
     """
-    cache_key = f"index_chart_{symbol}_{timeframe}"
+    cache_key = f"index_chart_v2_{symbol}_{timeframe}"  # v2: columnar chartData
 
     # Try cache first (shorter TTL for intraday, longer for historical)
     is_intraday = timeframe.endswith('m') or timeframe.endswith('h')
     cache_ttl = 30 if is_intraday else 300  # 30s for intraday, 5 min for daily+
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         return cached_data
 
@@ -2188,104 +3446,66 @@ async def get_index_chart_data(
 
         # Fetch historical data
         def fetch_chart():
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=SHARED_YF_SESSION)
             hist = ticker.history(period=config["period"], interval=config["interval"], timeout=30)
 
             if hist.empty:
                 return None
 
             # Calculate technical indicators
-            closes = hist['Close'].values
-            volumes = hist['Volume'].values
-
-            # RSI
-            rsi_values = []
-            for i in range(len(closes)):
-                if i < 14:
-                    rsi_values.append(None)
-                else:
-                    window = closes[i-13:i+1]
-                    gains = sum([max(window[j] - window[j-1], 0) for j in range(1, len(window))])
-                    losses = sum([max(window[j-1] - window[j], 0) for j in range(1, len(window))])
-                    avg_gain = gains / 14
-                    avg_loss = losses / 14
-                    if avg_loss == 0:
-                        rsi_values.append(100)
-                    else:
-                        rs = avg_gain / avg_loss
-                        rsi = 100 - (100 / (1 + rs))
-                        rsi_values.append(float(rsi))
-
-            # MACD (12, 26, 9)
-            ema12 = pd.Series(closes).ewm(span=12, adjust=False).mean()
-            ema26 = pd.Series(closes).ewm(span=26, adjust=False).mean()
+            # PERFORMANCE FIX: Pull Close out of the frame once; every indicator below runs on
+            # these contiguous float64 arrays instead of re-materializing hist['Close'] per rolling
+            closes = hist['Close'].to_numpy(dtype=np.float64)
+            # Gaps forward-filled so a NaN close does not poison the EMA recurrences
+            close_ff = np.ascontiguousarray(hist['Close'].ffill().to_numpy(dtype=np.float64))
+
+            # MACD (12, 26, 9) - both EMAs and the signal line in one Numba pass
+            ema12 = np.empty(close_ff.size)
+            ema26 = np.empty(close_ff.size)
+            signal_line = np.empty(close_ff.size)
+            macd_kernel(close_ff, 2.0 / 13, 2.0 / 27, 2.0 / 10, ema12, ema26, signal_line)
             macd_line = ema12 - ema26
-            signal_line = macd_line.ewm(span=9, adjust=False).mean()
-            histogram = macd_line - signal_line
-
-            # SMAs (20, 50, 200 periods)
-            sma20 = hist['Close'].rolling(window=20).mean() if len(hist) >= 20 else pd.Series([None] * len(hist))
-            sma50 = hist['Close'].rolling(window=50).mean() if len(hist) >= 50 else pd.Series([None] * len(hist))
-            sma200 = hist['Close'].rolling(window=200).mean() if len(hist) >= 200 else pd.Series([None] * len(hist))
-
-            # Bollinger Bands (20-period, 2 std dev)
-            bb_middle = hist['Close'].rolling(window=20).mean()
-            bb_std = hist['Close'].rolling(window=20).std()
-            bb_upper = bb_middle + (bb_std * 2)
-            bb_lower = bb_middle - (bb_std * 2)
-
-            # Format chart data
-            chart_data = []
-            for i in range(len(hist)):
-                timestamp = int(hist.index[i].timestamp())
-
-                # Build MACD object with histogram
-                macd_obj = None
-                if i >= 26:  # MACD requires 26+ periods
-                    macd_val = float(macd_line.iloc[i]) if not pd.isna(macd_line.iloc[i]) else None
-                    signal_val = float(signal_line.iloc[i]) if not pd.isna(signal_line.iloc[i]) else None
-                    hist_val = float(histogram.iloc[i]) if not pd.isna(histogram.iloc[i]) else None
-
-                    if macd_val is not None and signal_val is not None and hist_val is not None:
-                        macd_obj = {
-                            'macd': macd_val,
-                            'signal': signal_val,
-                            'histogram': hist_val
-                        }
-
-                # Build Bollinger Bands object
-                bollinger_obj = None
-                if i >= 20:  # Bollinger requires 20+ periods
-                    bb_u = float(bb_upper.iloc[i]) if not pd.isna(bb_upper.iloc[i]) else None
-                    bb_m = float(bb_middle.iloc[i]) if not pd.isna(bb_middle.iloc[i]) else None
-                    bb_l = float(bb_lower.iloc[i]) if not pd.isna(bb_lower.iloc[i]) else None
-
-                    if bb_u is not None and bb_m is not None and bb_l is not None:
-                        bollinger_obj = {
-                            'upper': bb_u,
-                            'middle': bb_m,
-                            'lower': bb_l
-                        }
 
-                chart_data.append({
-                    'time': timestamp,
-                    'open': float(hist['Open'].iloc[i]),
-                    'high': float(hist['High'].iloc[i]),
-                    'low': float(hist['Low'].iloc[i]),
-                    'close': float(hist['Close'].iloc[i]),
-                    'volume': int(hist['Volume'].iloc[i]) if not pd.isna(hist['Volume'].iloc[i]) else 0,
-                    'rsi': rsi_values[i],
-                    'macd': macd_obj,
-                    'sma20': float(sma20.iloc[i]) if not pd.isna(sma20.iloc[i]) else None,
-                    'sma50': float(sma50.iloc[i]) if not pd.isna(sma50.iloc[i]) else None,
-                    'sma200': float(sma200.iloc[i]) if not pd.isna(sma200.iloc[i]) else None,
-                    'bollinger': bollinger_obj
-                })
+            # Bollinger Bands (20-period, 2 std dev) - mean and std fused into one pass;
+            # the middle band doubles as SMA20
+            bb_middle, bb_std = rolling_mean_std(close_ff, 20)
+
+            # PERFORMANCE FIX: Columnar payload - one list per field instead of a dict per bar.
+            # Warm-up rows are masked once per indicator and each float column goes NaN -> None
+            # through nanlist; time/volume stay int64 ndarrays that orjson writes natively.
+            pos = np.arange(len(hist))
+            macd_ready = pos >= 26  # MACD requires 26+ periods
+            bb_ready = pos >= 20  # Bollinger requires 20+ periods
+            macd_line = np.where(macd_ready, macd_line, np.nan)
+            signal_line = np.where(macd_ready, signal_line, np.nan)
+
+            chart_data = {
+                'time': hist.index.as_unit('ns').asi8 // 10**9,
+                'open': nanlist(hist['Open'].to_numpy(dtype=np.float64)),
+                'high': nanlist(hist['High'].to_numpy(dtype=np.float64)),
+                'low': nanlist(hist['Low'].to_numpy(dtype=np.float64)),
+                'close': nanlist(closes),
+                'volume': np.ascontiguousarray(hist['Volume'].fillna(0).to_numpy(dtype=np.int64)),
+                'rsi': nanlist(rsi_from_close(closes, 14)),  # RSI (14, Wilder) - one O(N) Numba pass
+                'macd': {
+                    'macd': nanlist(macd_line),
+                    'signal': nanlist(signal_line),
+                    'histogram': nanlist(macd_line - signal_line),
+                },
+                'sma20': nanlist(bb_middle),  # SMA20 is the Bollinger middle band
+                'sma50': nanlist(rolling_mean(close_ff, 50)),  # bottleneck move_mean when available
+                'sma200': nanlist(rolling_mean(close_ff, 200)),
+                'bollinger': {
+                    'upper': nanlist(np.where(bb_ready, bb_middle + bb_std * 2, np.nan)),
+                    'middle': nanlist(np.where(bb_ready, bb_middle, np.nan)),
+                    'lower': nanlist(np.where(bb_ready, bb_middle - bb_std * 2, np.nan)),
+                },
+            }
 
             return chart_data
 
-        loop = asyncio.get_event_loop()
-        chart_data = await loop.run_in_executor(None, fetch_chart)
+        loop = asyncio.get_running_loop()
+        chart_data = await loop.run_in_executor(YF_POOL, fetch_chart)
 
         if not chart_data:
             return {
@@ -2300,14 +3520,15 @@ async def get_index_chart_data(
             'timeframe': timeframe,
             'period': config['period'],
             'interval': config['interval'],
-            'chartData': chart_data,
-            'dataPoints': len(chart_data),
+            'chartData': chart_data,  # columnar: parallel arrays keyed by field
+            'dataPoints': len(chart_data['time']),
             'timestamp': int(time.time() * 1000)
         }
 
         # Cache with appropriate TTL
         await set_cache(cache_key, result, ttl_seconds=cache_ttl)
-        return result
+        # time/volume are int64 ndarrays - serialize with orjson directly (jsonable_encoder rejects ndarrays)
+        return orjson_response(result)
 
     except Exception as e:
         logger.error(f"Index chart API error for {symbol}: {e}")
@@ -2317,6 +3538,147 @@ async def get_index_chart_data(
             'chartData': []
         }
 
+# PERFORMANCE FIX: Daily price history memoized per (symbol, start, end) for an hour - backtests,
+# optimizations, Black-Litterman and risk-metrics reruns over the same window (users tweak views and
+# weights, not dates) reuse one Yahoo download instead of re-fetching. Concurrent misses for the same
+# key share one download via coalesce_inflight. Only read/written on the event loop (the fetch itself
+# runs in YF_POOL), so no lock is needed.
+DAILY_HISTORY_TTL = 3600
+_daily_hist_cache: TTLCache = TTLCache(maxsize=512, ttl=DAILY_HISTORY_TTL)
+
+@dataclass(frozen=True, slots=True)
+class OHLCV:
+    """
+    PERFORMANCE FIX: Lean daily bars - the yfinance DataFrame is reduced to six contiguous ndarrays
+    right after download, so cached histories don't pin block managers/attrs and the backtest
+    works on positional array lookups instead of pandas label alignment.
+    """
+    ts: np.ndarray  # datetime64[ns] bar dates, exchange-local (tz dropped), ascending
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_history(cls, hist: pd.DataFrame) -> 'OHLCV':
+        index = hist.index.tz_localize(None) if hist.index.tz is not None else hist.index
+        return cls(
+            ts=index.as_unit('ns').to_numpy(),
+            open=np.ascontiguousarray(hist['Open'].to_numpy(dtype=np.float64)),
+            high=np.ascontiguousarray(hist['High'].to_numpy(dtype=np.float64)),
+            low=np.ascontiguousarray(hist['Low'].to_numpy(dtype=np.float64)),
+            close=np.ascontiguousarray(hist['Close'].to_numpy(dtype=np.float64)),
+            volume=np.ascontiguousarray(hist['Volume'].fillna(0).to_numpy(dtype=np.int64)),
+        )
+
+    def __len__(self) -> int:
+        return self.ts.size
+
+    def close_series(self) -> pd.Series:
+        """Close prices as a date-indexed Series, for endpoints that align symbols with pandas"""
+        return pd.Series(self.close, index=pd.DatetimeIndex(self.ts))
+
+    def indexer(self, dates: np.ndarray) -> np.ndarray:
+        """Row of each date in these bars, -1 where missing (DatetimeIndex.get_indexer via searchsorted)"""
+        pos = np.minimum(np.searchsorted(self.ts, dates), self.ts.size - 1)
+        return np.where(self.ts[pos] == dates, pos, -1)
+
+@coalesce_inflight
+async def fetch_daily_history(real_symbol: str, start_date: str, end_date: str) -> Optional[OHLCV]:
+    """Full daily OHLCV history for a window (None when Yahoo has no bars); shared, read-only"""
+    key = (real_symbol, start_date, end_date)
+    hist = _daily_hist_cache.get(key)
+    if hist is not None:
+        return hist
+
+    def fetch():
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
+        hist = ticker.history(start=start_date, end=end_date, timeout=15)
+        if hist.empty:
+            logger.warning(f"⚠️ yfinance returned EMPTY data for {real_symbol}")
+            return None
+        # Return full OHLCV bars, not just Close!
+        return OHLCV.from_history(hist)
+
+    loop = asyncio.get_running_loop()
+    hist = await loop.run_in_executor(YF_POOL, fetch)
+    if hist is not None:
+        _daily_hist_cache[key] = hist
+    return hist
+
+# PERFORMANCE FIX: Strategy dispatch is one dict lookup before the simulation instead of an
+# elif chain. Each runner takes the prepared indicator matrices (bt) and returns
+# (kernel_out, trade_fields, trade_extra); trade_fields maps side -> indicator matrices
+# whose values are attached to each BUY/SELL trade record.
+def _bt_signals(bt: dict, buy_sig: np.ndarray, sell_sig: np.ndarray, trade_fields: dict):
+    """Run the per-symbol entry/exit kernel over boolean signal matrices"""
+    kernel_out = run_signal_strategy(bt['close_mat'], buy_sig, sell_sig, bt['start'], bt['position_size'], bt['cash'])
+    return kernel_out, trade_fields, {}
+
+def _bt_no_trades(bt: dict):
+    """Unknown strategy (or a pair with < 2 symbols): stay in cash"""
+    no_sig = np.zeros(bt['close_mat'].shape, dtype=np.bool_)
+    return _bt_signals(bt, no_sig, no_sig, {TRADE_BUY: {}, TRADE_SELL: {}})
+
+def _bt_mean_reversion(bt: dict):
+    # Buy when z-score < entry_threshold (oversold), sell when z-score > exit_threshold
+    z_mat = bt['z_mat']
+    return _bt_signals(bt, z_mat < bt['entry_threshold'], z_mat > bt['exit_threshold'],
+                       {TRADE_BUY: {'z_score': z_mat}, TRADE_SELL: {'z_score': z_mat}})
+
+def _bt_momentum(bt: dict):
+    kernel_out = run_momentum(bt['close_mat'], bt['momentum_mat'], bt['start'], bt['position_size'], bt['cash'])
+    return kernel_out, {TRADE_BUY: {'momentum': bt['momentum_mat']}, TRADE_SELL: {}}, {}
+
+def _bt_rsi(bt: dict):
+    # Buy when RSI < 30 (oversold), sell when RSI > 70 (overbought)
+    rsi_mat = bt['rsi_mat']
+    return _bt_signals(bt, rsi_mat < 30, rsi_mat > 70, {TRADE_BUY: {'rsi': rsi_mat}, TRADE_SELL: {'rsi': rsi_mat}})
+
+def _bt_bollinger(bt: dict):
+    # Buy at lower band (oversold), sell at upper band (overbought)
+    close_mat, upper, lower = bt['close_mat'], bt['bb_upper_mat'], bt['bb_lower_mat']
+    return _bt_signals(bt, close_mat <= lower, close_mat >= upper,
+                       {TRADE_BUY: {'lower_band': lower}, TRADE_SELL: {'upper_band': upper}})
+
+def _bt_ma_crossover(bt: dict):
+    short_ma, long_ma = bt['short_ma_mat'], bt['long_ma_mat']
+    nan_row = np.full((1, short_ma.shape[1]), np.nan)
+    prev_short_ma = np.vstack((nan_row, short_ma[:-1]))
+    prev_long_ma = np.vstack((nan_row, long_ma[:-1]))
+    # Golden cross buys, death cross sells
+    buy_sig = (prev_short_ma <= prev_long_ma) & (short_ma > long_ma)
+    sell_sig = (prev_short_ma >= prev_long_ma) & (short_ma < long_ma)
+    ma_fields = {'short_ma': short_ma, 'long_ma': long_ma}
+    return _bt_signals(bt, buy_sig, sell_sig, {TRADE_BUY: ma_fields, TRADE_SELL: ma_fields})
+
+def _bt_breakout(bt: dict):
+    # Breakout above resistance buys, breakdown below support exits
+    close_mat, high_max, low_min = bt['close_mat'], bt['high_max_mat'], bt['low_min_mat']
+    return _bt_signals(bt, close_mat > high_max, close_mat < low_min,
+                       {TRADE_BUY: {'breakout_level': high_max}, TRADE_SELL: {'breakdown_level': low_min}})
+
+def _bt_pairs_trading(bt: dict):
+    close_mat, z_ratio = bt['close_mat'], bt['z_ratio']
+    if close_mat.shape[1] < 2:
+        return _bt_no_trades(bt)
+    # Entry/exit masks over the whole z-score vector; the kernel only walks the position state
+    kernel_out = run_pairs_trading(close_mat, z_ratio < -2, z_ratio > 2, np.abs(z_ratio) < 0.5,
+                                   bt['start'], bt['position_size'], bt['cash'])
+    pair_z = np.broadcast_to(z_ratio[:, None], close_mat.shape)
+    return kernel_out, {TRADE_BUY: {'z_score': pair_z}, TRADE_SELL: {'z_score': pair_z}}, {'pair_trade': True}
+
+BACKTEST_STRATEGY_FNS = MappingProxyType({
+    'mean-reversion': _bt_mean_reversion,
+    'momentum': _bt_momentum,
+    'rsi': _bt_rsi,
+    'bollinger-bands': _bt_bollinger,
+    'ma-crossover': _bt_ma_crossover,
+    'breakout': _bt_breakout,
+    'pairs-trading': _bt_pairs_trading,
+})
+
 @app.post("/api/quant/backtest")
 async def backtest_strategy(request: dict):
     """
@@ -2359,24 +3721,13 @@ async def backtest_strategy(request: dict):
         # Fetch FULL OHLCV data (not just Close!) for real strategy calculations
         async def fetch_full_history(xstock_symbol: str):
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     logger.error(f"❌ Symbol '{xstock_symbol}' NOT FOUND in xStock mappings! Available symbols: {len(STOCK_SYMBOLS)}")
                     return None
 
                 logger.info(f"📊 Fetching data for {xstock_symbol} → {real_symbol}")
-
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    hist = ticker.history(start=start_date, end=end_date, timeout=15)
-                    if hist.empty:
-                        logger.warning(f"⚠️ yfinance returned EMPTY data for {real_symbol}")
-                        return None
-                    # Return full OHLCV dataframe, not just Close!
-                    return hist[['Open', 'High', 'Low', 'Close', 'Volume']]
-
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                return await fetch_daily_history(real_symbol, start_date, end_date)
             except Exception as e:
                 logger.warning(f"❌ Could not fetch history for {xstock_symbol}: {e}")
                 return None
@@ -2390,7 +3741,7 @@ async def backtest_strategy(request: dict):
         # Filter out None values and create dict of dataframes
         stock_data = {}
         for sym, hist_df in zip(symbols, hist_data_list):
-            if hist_df is not None and not hist_df.empty:
+            if hist_df is not None and len(hist_df) > 0:
                 stock_data[sym] = hist_df
                 logger.info(f"✅ Fetched {len(hist_df)} days of data for {sym}")
             else:
@@ -2402,478 +3753,200 @@ async def backtest_strategy(request: dict):
             logger.error(f"❌ CRITICAL: No valid historical data found for ANY symbols: {symbols}")
             raise HTTPException(status_code=400, detail="No valid historical data found")
 
-        # Align all dataframes to same dates
-        common_dates = None
-        for df in stock_data.values():
-            if common_dates is None:
-                common_dates = set(df.index)
-            else:
-                common_dates = common_dates.intersection(set(df.index))
+        # Align all symbols to same dates
+        # PERFORMANCE FIX: np.intersect1d over the datetime64 bar arrays - sorted, unique, C-level
+        bars_list = list(stock_data.values())
+        common_ts = bars_list[0].ts
+        for bars in bars_list[1:]:
+            common_ts = np.intersect1d(common_ts, bars.ts)
+        common_ts = np.unique(common_ts)
 
-        if not common_dates or len(common_dates) < 50:
+        if len(common_ts) < 50:
             raise HTTPException(status_code=400, detail="Insufficient overlapping historical data")
 
-        # Sort dates for chronological processing
-        sorted_dates = sorted(common_dates)
+        # Chronological DatetimeIndex for trade dates and the result series
+        sorted_dates = pd.DatetimeIndex(common_ts)
 
         # ========== REAL STRATEGY IMPLEMENTATION - NO MOCKS! ==========
         # Initialize tracking arrays
         portfolio_value_series = []
         benchmark_value_series = []
         cash = initial_capital
-        positions = {sym: 0 for sym in stock_data.keys()}  # shares held
         portfolio_values = []
         trade_log = []
 
+        # PERFORMANCE FIX: Struct-of-arrays layout - one (bars x symbols) Close matrix aligned on
+        # sorted_dates and an int64 share vector, indexed by (bar i, symbol k). Replaces
+        # thousands of stock_data[sym].loc[date, 'Close'] label lookups and dict membership tests.
+        sym_list = list(stock_data.keys())
+        n_bars, n_syms = len(sorted_dates), len(sym_list)
+        bar_pos = [stock_data[sym].indexer(common_ts) for sym in sym_list]  # every common date exists in each symbol
+        close_mat = np.empty((n_bars, n_syms))
+        for k, sym in enumerate(sym_list):
+            close_mat[:, k] = stock_data[sym].close[bar_pos[k]]
+        positions = np.zeros(n_syms, dtype=np.int64)  # shares held
+
         # Track benchmark buy-and-hold performance
-        if benchmark_data is not None and not benchmark_data.empty:
-            benchmark_start_price = benchmark_data.loc[sorted_dates[0], 'Close'] if sorted_dates[0] in benchmark_data.index else None
+        if benchmark_data is not None and len(benchmark_data) > 0:
+            benchmark_pos = benchmark_data.indexer(common_ts)
+            benchmark_start_price = benchmark_data.close[benchmark_pos[0]] if benchmark_pos[0] >= 0 else None
             if benchmark_start_price and benchmark_start_price > 0:
                 benchmark_shares = initial_capital / benchmark_start_price
         else:
             benchmark_shares = 0
 
-        logger.info(f"Running {strategy} strategy backtest on {len(stock_data)} symbols from {start_date} to {end_date} | Benchmark: {benchmark_symbol}")
+        # Benchmark equity curve is strategy-independent: one gather instead of a per-bar lookup
+        if benchmark_data is not None:
+            in_benchmark = benchmark_pos >= 0
+            benchmark_close = np.where(in_benchmark, benchmark_data.close[benchmark_pos], np.nan)
+            if in_benchmark.any():
+                benchmark_value_series = np.where(in_benchmark, benchmark_shares * benchmark_close, initial_capital).tolist()
+            else:
+                benchmark_value_series = [initial_capital] * len(sorted_dates)
+        else:
+            benchmark_value_series = [initial_capital] * len(sorted_dates)
 
-        # ========== STRATEGY EXECUTION LOOP - 8 REAL STRATEGIES ==========
+        logger.info(f"Running {strategy} strategy backtest on {len(stock_data)} symbols from {start_date} to {end_date} | Benchmark: {benchmark_symbol}")
 
-        for i, current_date in enumerate(sorted_dates):
-            # Skip warmup period for indicators
-            if i < lookback_period:
-                # Just track portfolio value during warmup
-                current_value = cash
-                for sym in positions:
-                    if current_date in stock_data[sym].index:
-                        current_price = stock_data[sym].loc[current_date, 'Close']
-                        current_value += positions[sym] * current_price
-                portfolio_values.append(current_value)
-
-                # Track benchmark
-                if benchmark_data is not None and current_date in benchmark_data.index:
-                    benchmark_price = benchmark_data.loc[current_date, 'Close']
-                    benchmark_value = benchmark_shares * benchmark_price
-                    benchmark_value_series.append(benchmark_value)
+        # PERFORMANCE FIX: Roll each strategy's indicators ONCE per symbol (O(N)) instead of
+        # re-slicing .loc[:date].tail(lookback) and reducing it on every bar (O(N*L)).
+        # Indicators run on each symbol's own index (exactly what the old slices saw) and
+        # are then gathered onto sorted_dates, so the day loop indexes them by bar number i.
+        z_mat = np.full((n_bars, n_syms), np.nan)
+        bb_upper_mat = np.full((n_bars, n_syms), np.nan)
+        bb_lower_mat = np.full((n_bars, n_syms), np.nan)
+        momentum_mat = np.full((n_bars, n_syms), np.nan)
+        rsi_mat = np.full((n_bars, n_syms), np.nan)
+        high_max_mat = np.full((n_bars, n_syms), np.nan)
+        low_min_mat = np.full((n_bars, n_syms), np.nan)
+        short_period, long_period = 10, 50  # MA crossover windows
+        short_ma_mat = long_ma_mat = None
+
+        for k, bars in enumerate(stock_data.values()):
+            close = bars.close
+            pos = bar_pos[k]
+            bar = np.arange(len(bars))
+
+            if strategy in ('mean-reversion', 'bollinger-bands'):
+                mid, sd = rolling_mean_std(close, lookback_period)
+                mid, sd = mid[pos], sd[pos]
+                if strategy == 'mean-reversion':
+                    # Whole z-score column at once; NaN (never trades) during warmup or when std is 0
+                    np.divide(close_mat[:, k] - mid, sd, out=z_mat[:, k], where=sd > 0)
                 else:
-                    benchmark_value_series.append(initial_capital)
-                continue
+                    bb_upper_mat[:, k] = mid + (2 * sd)
+                    bb_lower_mat[:, k] = mid - (2 * sd)
 
-            # Get current prices for all symbols
-            current_prices = {}
-            for sym in stock_data:
-                if current_date in stock_data[sym].index:
-                    current_prices[sym] = stock_data[sym].loc[current_date, 'Close']
-
-            # ===== STRATEGY 1: BUY AND HOLD =====
-            if strategy == 'buy-and-hold':
-                # Execute on first day after warmup
-                if i == lookback_period:
-                    for sym, weight in zip(stock_data.keys(), weights):
-                        if sym in current_prices and current_prices[sym] > 0:
-                            allocation = cash * weight
-                            shares_to_buy = int(allocation / current_prices[sym])
-                            if shares_to_buy > 0:
-                                cost = shares_to_buy * current_prices[sym]
-                                positions[sym] = shares_to_buy
-                                cash -= cost
-                                trade_log.append({
-                                    'date': str(current_date.date()),
-                                    'symbol': sym,
-                                    'action': 'BUY',
-                                    'shares': shares_to_buy,
-                                    'price': current_prices[sym],
-                                    'total': cost
-                                })
-
-            # ===== STRATEGY 2: MEAN REVERSION =====
-            elif strategy == 'mean-reversion':
-                for sym in stock_data:
-                    if sym not in current_prices:
-                        continue
-
-                    # Calculate z-score over lookback period
-                    hist_slice = stock_data[sym].loc[:current_date, 'Close'].tail(lookback_period)
-                    if len(hist_slice) >= lookback_period:
-                        mean_price = hist_slice.mean()
-                        std_price = hist_slice.std()
-
-                        if std_price > 0:
-                            z_score = (current_prices[sym] - mean_price) / std_price
-
-                            # Buy when z-score < entry_threshold (oversold)
-                            if z_score < entry_threshold and positions[sym] == 0:
-                                shares_to_buy = int((cash * position_size) / current_prices[sym])
-                                if shares_to_buy > 0:
-                                    cost = shares_to_buy * current_prices[sym]
-                                    if cost <= cash:
-                                        positions[sym] = shares_to_buy
-                                        cash -= cost
-                                        trade_log.append({
-                                            'date': str(current_date.date()),
-                                            'symbol': sym,
-                                            'action': 'BUY',
-                                            'shares': shares_to_buy,
-                                            'price': current_prices[sym],
-                                            'total': cost,
-                                            'z_score': z_score
-                                        })
-
-                            # Sell when z-score > exit_threshold (overbought) or hit stop loss
-                            elif positions[sym] > 0:
-                                if z_score > exit_threshold:
-                                    proceeds = positions[sym] * current_prices[sym]
-                                    trade_log.append({
-                                        'date': str(current_date.date()),
-                                        'symbol': sym,
-                                        'action': 'SELL',
-                                        'shares': positions[sym],
-                                        'price': current_prices[sym],
-                                        'total': proceeds,
-                                        'z_score': z_score
-                                    })
-                                    cash += proceeds
-                                    positions[sym] = 0
-
-            # ===== STRATEGY 3: MOMENTUM =====
             elif strategy == 'momentum':
-                # Calculate momentum for all symbols
-                momentum_scores = {}
-                for sym in stock_data:
-                    hist_slice = stock_data[sym].loc[:current_date, 'Close'].tail(lookback_period + 1)
-                    if len(hist_slice) >= lookback_period + 1:
-                        returns = (hist_slice.iloc[-1] - hist_slice.iloc[0]) / hist_slice.iloc[0]
-                        momentum_scores[sym] = returns
-
-                if momentum_scores:
-                    # Sort by momentum and select top performers
-                    sorted_momentum = sorted(momentum_scores.items(), key=lambda x: x[1], reverse=True)
-                    num_positions = max(1, int(len(sorted_momentum) * position_size))
-                    top_performers = [sym for sym, _ in sorted_momentum[:num_positions]]
-
-                    # Exit positions not in top performers
-                    for sym in list(positions.keys()):
-                        if positions[sym] > 0 and sym not in top_performers and sym in current_prices:
-                            proceeds = positions[sym] * current_prices[sym]
-                            trade_log.append({
-                                'date': str(current_date.date()),
-                                'symbol': sym,
-                                'action': 'SELL',
-                                'shares': positions[sym],
-                                'price': current_prices[sym],
-                                'total': proceeds
-                            })
-                            cash += proceeds
-                            positions[sym] = 0
-
-                    # Enter positions in top performers
-                    for sym in top_performers:
-                        if sym in current_prices and positions[sym] == 0:
-                            shares_to_buy = int((cash / num_positions) / current_prices[sym])
-                            if shares_to_buy > 0:
-                                cost = shares_to_buy * current_prices[sym]
-                                if cost <= cash:
-                                    positions[sym] = shares_to_buy
-                                    cash -= cost
-                                    trade_log.append({
-                                        'date': str(current_date.date()),
-                                        'symbol': sym,
-                                        'action': 'BUY',
-                                        'shares': shares_to_buy,
-                                        'price': current_prices[sym],
-                                        'total': cost,
-                                        'momentum': momentum_scores[sym]
-                                    })
-
-            # ===== STRATEGY 4: RSI =====
+                base = np.full(close.size, np.nan)
+                if lookback_period < close.size:
+                    base[lookback_period:] = close[:close.size - lookback_period]
+                momentum_mat[:, k] = ((close - base) / base)[pos]
+
             elif strategy == 'rsi':
-                for sym in stock_data:
-                    if sym not in current_prices:
-                        continue
+                # Same Wilder RSI (14) as the charts - one Numba pass, masked until the lookback fills
+                rsi = np.where(bar >= lookback_period, rsi_from_close(close, 14), np.nan)
+                rsi_mat[:, k] = rsi[pos]
 
-                    # Calculate RSI
-                    hist_slice = stock_data[sym].loc[:current_date, 'Close'].tail(lookback_period + 1)
-                    if len(hist_slice) >= lookback_period + 1:
-                        delta = hist_slice.diff()
-                        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-                        loss = -delta.where(delta < 0, 0).rolling(window=14).mean()
-
-                        if len(gain) > 0 and len(loss) > 0 and loss.iloc[-1] != 0:
-                            rs = gain.iloc[-1] / loss.iloc[-1]
-                            rsi = 100 - (100 / (1 + rs))
-
-                            # Buy when RSI < 30 (oversold)
-                            if rsi < 30 and positions[sym] == 0:
-                                shares_to_buy = int((cash * position_size) / current_prices[sym])
-                                if shares_to_buy > 0:
-                                    cost = shares_to_buy * current_prices[sym]
-                                    if cost <= cash:
-                                        positions[sym] = shares_to_buy
-                                        cash -= cost
-                                        trade_log.append({
-                                            'date': str(current_date.date()),
-                                            'symbol': sym,
-                                            'action': 'BUY',
-                                            'shares': shares_to_buy,
-                                            'price': current_prices[sym],
-                                            'total': cost,
-                                            'rsi': rsi
-                                        })
-
-                            # Sell when RSI > 70 (overbought)
-                            elif rsi > 70 and positions[sym] > 0:
-                                proceeds = positions[sym] * current_prices[sym]
-                                trade_log.append({
-                                    'date': str(current_date.date()),
-                                    'symbol': sym,
-                                    'action': 'SELL',
-                                    'shares': positions[sym],
-                                    'price': current_prices[sym],
-                                    'total': proceeds,
-                                    'rsi': rsi
-                                })
-                                cash += proceeds
-                                positions[sym] = 0
+            elif strategy == 'breakout':
+                # Lookback extremes exclude the current bar: bar j reads the window ending at j-1
+                high_max = rolling_max(bars.high, lookback_period)
+                low_min = rolling_min(bars.low, lookback_period)
+                high_max_mat[:, k] = np.concatenate(([np.nan], high_max[:-1]))[pos]
+                low_min_mat[:, k] = np.concatenate(([np.nan], low_min[:-1]))[pos]
+
+        if strategy == 'ma-crossover':
+            # One rolling pass over the whole Close matrix; "previous" MAs are just row i-1
+            short_ma_mat = pd.DataFrame(close_mat).rolling(short_period).mean().to_numpy()
+            long_ma_mat = pd.DataFrame(close_mat).rolling(long_period).mean().to_numpy()
+
+        z_ratio = np.full(n_bars, np.nan)
+        if strategy == 'pairs-trading' and n_syms >= 2:
+            # Use first two symbols as the pair; z-score of today's ratio vs its rolling mean/std.
+            # PERFORMANCE FIX: Ratio taken straight off the aligned Close columns, then one
+            # bottleneck move_mean/move_std pass each instead of pandas rolling + index realignment
+            ratio = np.ascontiguousarray(close_mat[:, 0] / close_mat[:, 1])
+            ratio_mean = rolling_mean(ratio, lookback_period)
+            ratio_std = rolling_std(ratio, lookback_period)
+            np.divide(ratio - ratio_mean, ratio_std, out=z_ratio, where=ratio_std > 0)
 
-            # ===== STRATEGY 5: BOLLINGER BANDS =====
-            elif strategy == 'bollinger-bands':
-                for sym in stock_data:
-                    if sym not in current_prices:
-                        continue
+        # ========== STRATEGY EXECUTION LOOP - 8 REAL STRATEGIES ==========
+
+        # ===== STRATEGY 1: BUY AND HOLD =====
+        # PERFORMANCE FIX: Positions never change after the single buy on the first post-warmup
+        # bar, so the whole equity curve is one (N,S) @ (S,) product instead of a per-day loop.
+        if strategy == 'buy-and-hold':
+            portfolio_values = np.full(n_bars, float(cash))
 
-                    # Calculate Bollinger Bands
-                    hist_slice = stock_data[sym].loc[:current_date, 'Close'].tail(lookback_period)
-                    if len(hist_slice) >= lookback_period:
-                        sma = hist_slice.mean()
-                        std = hist_slice.std()
-                        upper_band = sma + (2 * std)
-                        lower_band = sma - (2 * std)
-
-                        # Buy at lower band (oversold)
-                        if current_prices[sym] <= lower_band and positions[sym] == 0:
-                            shares_to_buy = int((cash * position_size) / current_prices[sym])
-                            if shares_to_buy > 0:
-                                cost = shares_to_buy * current_prices[sym]
-                                if cost <= cash:
-                                    positions[sym] = shares_to_buy
-                                    cash -= cost
-                                    trade_log.append({
-                                        'date': str(current_date.date()),
-                                        'symbol': sym,
-                                        'action': 'BUY',
-                                        'shares': shares_to_buy,
-                                        'price': current_prices[sym],
-                                        'total': cost,
-                                        'lower_band': lower_band
-                                    })
-
-                        # Sell at upper band (overbought)
-                        elif current_prices[sym] >= upper_band and positions[sym] > 0:
-                            proceeds = positions[sym] * current_prices[sym]
+            if lookback_period < n_bars:
+                # Execute on first day after warmup
+                buy_date = sorted_dates[lookback_period]
+                buy_prices = close_mat[lookback_period]
+                for k, (sym, weight) in enumerate(zip(sym_list, weights)):
+                    price = buy_prices[k]
+                    if price > 0:
+                        allocation = cash * weight
+                        shares_to_buy = int(allocation / price)
+                        if shares_to_buy > 0:
+                            cost = shares_to_buy * price
+                            positions[k] = shares_to_buy
+                            cash -= cost
                             trade_log.append({
-                                'date': str(current_date.date()),
+                                'date': str(buy_date.date()),
                                 'symbol': sym,
-                                'action': 'SELL',
-                                'shares': positions[sym],
-                                'price': current_prices[sym],
-                                'total': proceeds,
-                                'upper_band': upper_band
+                                'action': 'BUY',
+                                'shares': shares_to_buy,
+                                'price': price,
+                                'total': cost
                             })
-                            cash += proceeds
-                            positions[sym] = 0
-
-            # ===== STRATEGY 6: MA CROSSOVER =====
-            elif strategy == 'ma-crossover':
-                short_period = 10
-                long_period = 50
 
-                for sym in stock_data:
-                    if sym not in current_prices:
-                        continue
+                portfolio_values[lookback_period:] = close_mat[lookback_period:] @ positions + cash
 
-                    # Need enough data for long MA
-                    hist_slice = stock_data[sym].loc[:current_date, 'Close']
-                    if len(hist_slice) >= long_period:
-                        short_ma = hist_slice.tail(short_period).mean()
-                        long_ma = hist_slice.tail(long_period).mean()
-
-                        # Previous MAs for crossover detection
-                        prev_short_ma = hist_slice.tail(short_period + 1).head(short_period).mean()
-                        prev_long_ma = hist_slice.tail(long_period + 1).head(long_period).mean()
-
-                        # Golden cross: short MA crosses above long MA
-                        if prev_short_ma <= prev_long_ma and short_ma > long_ma and positions[sym] == 0:
-                            shares_to_buy = int((cash * position_size) / current_prices[sym])
-                            if shares_to_buy > 0:
-                                cost = shares_to_buy * current_prices[sym]
-                                if cost <= cash:
-                                    positions[sym] = shares_to_buy
-                                    cash -= cost
-                                    trade_log.append({
-                                        'date': str(current_date.date()),
-                                        'symbol': sym,
-                                        'action': 'BUY',
-                                        'shares': shares_to_buy,
-                                        'price': current_prices[sym],
-                                        'total': cost,
-                                        'short_ma': short_ma,
-                                        'long_ma': long_ma
-                                    })
-
-                        # Death cross: short MA crosses below long MA
-                        elif prev_short_ma >= prev_long_ma and short_ma < long_ma and positions[sym] > 0:
-                            proceeds = positions[sym] * current_prices[sym]
-                            trade_log.append({
-                                'date': str(current_date.date()),
-                                'symbol': sym,
-                                'action': 'SELL',
-                                'shares': positions[sym],
-                                'price': current_prices[sym],
-                                'total': proceeds,
-                                'short_ma': short_ma,
-                                'long_ma': long_ma
-                            })
-                            cash += proceeds
-                            positions[sym] = 0
+            portfolio_values = portfolio_values.tolist()
 
-            # ===== STRATEGY 7: BREAKOUT =====
-            elif strategy == 'breakout':
-                for sym in stock_data:
-                    if sym not in current_prices:
-                        continue
+        else:
+            # PERFORMANCE FIX: Every other strategy is an entry/exit signal matrix (bars x symbols)
+            # built vectorized by its BACKTEST_STRATEGY_FNS runner; the bar-by-bar cash/position
+            # loop runs as a Numba kernel (backtest_numba). NaN indicators compare False, so
+            # warmup bars never trade.
+            run_strategy = BACKTEST_STRATEGY_FNS.get(strategy, _bt_no_trades)
+            kernel_out, trade_fields, trade_extra = run_strategy({
+                'close_mat': close_mat,
+                'start': min(lookback_period, n_bars),
+                'position_size': position_size,
+                'cash': float(cash),
+                'entry_threshold': entry_threshold,
+                'exit_threshold': exit_threshold,
+                'z_mat': z_mat,
+                'momentum_mat': momentum_mat,
+                'rsi_mat': rsi_mat,
+                'bb_upper_mat': bb_upper_mat,
+                'bb_lower_mat': bb_lower_mat,
+                'short_ma_mat': short_ma_mat,
+                'long_ma_mat': long_ma_mat,
+                'high_max_mat': high_max_mat,
+                'low_min_mat': low_min_mat,
+                'z_ratio': z_ratio,
+            })
 
-                    # Get historical highs/lows
-                    hist_slice = stock_data[sym].loc[:current_date].tail(lookback_period + 1)
-                    if len(hist_slice) >= lookback_period + 1:
-                        # Exclude current day for breakout calculation
-                        lookback_high = hist_slice['High'].iloc[:-1].max()
-                        lookback_low = hist_slice['Low'].iloc[:-1].min()
-
-                        # Breakout above resistance
-                        if current_prices[sym] > lookback_high and positions[sym] == 0:
-                            shares_to_buy = int((cash * position_size) / current_prices[sym])
-                            if shares_to_buy > 0:
-                                cost = shares_to_buy * current_prices[sym]
-                                if cost <= cash:
-                                    positions[sym] = shares_to_buy
-                                    cash -= cost
-                                    trade_log.append({
-                                        'date': str(current_date.date()),
-                                        'symbol': sym,
-                                        'action': 'BUY',
-                                        'shares': shares_to_buy,
-                                        'price': current_prices[sym],
-                                        'total': cost,
-                                        'breakout_level': lookback_high
-                                    })
-
-                        # Breakdown below support (exit)
-                        elif current_prices[sym] < lookback_low and positions[sym] > 0:
-                            proceeds = positions[sym] * current_prices[sym]
-                            trade_log.append({
-                                'date': str(current_date.date()),
-                                'symbol': sym,
-                                'action': 'SELL',
-                                'shares': positions[sym],
-                                'price': current_prices[sym],
-                                'total': proceeds,
-                                'breakdown_level': lookback_low
-                            })
-                            cash += proceeds
-                            positions[sym] = 0
-
-            # ===== STRATEGY 8: PAIRS TRADING =====
-            elif strategy == 'pairs-trading':
-                if len(stock_data) >= 2:
-                    # Use first two symbols as the pair
-                    sym1, sym2 = list(stock_data.keys())[:2]
-
-                    if sym1 in current_prices and sym2 in current_prices:
-                        # Calculate price ratio and z-score
-                        hist1 = stock_data[sym1].loc[:current_date, 'Close'].tail(lookback_period)
-                        hist2 = stock_data[sym2].loc[:current_date, 'Close'].tail(lookback_period)
-
-                        if len(hist1) >= lookback_period and len(hist2) >= lookback_period:
-                            ratio = hist1 / hist2
-                            mean_ratio = ratio.mean()
-                            std_ratio = ratio.std()
-
-                            if std_ratio > 0:
-                                current_ratio = current_prices[sym1] / current_prices[sym2]
-                                z_score = (current_ratio - mean_ratio) / std_ratio
-
-                                # Spread too high: short sym1, long sym2
-                                if z_score > 2 and positions[sym1] == 0 and positions[sym2] == 0:
-                                    # Sell sym1 (short simulation via holding cash)
-                                    shares1 = int((cash * 0.5 * position_size) / current_prices[sym1])
-                                    shares2 = int((cash * 0.5 * position_size) / current_prices[sym2])
-
-                                    if shares2 > 0:
-                                        cost = shares2 * current_prices[sym2]
-                                        if cost <= cash:
-                                            positions[sym2] = shares2
-                                            cash -= cost
-                                            trade_log.append({
-                                                'date': str(current_date.date()),
-                                                'symbol': sym2,
-                                                'action': 'BUY',
-                                                'shares': shares2,
-                                                'price': current_prices[sym2],
-                                                'total': cost,
-                                                'z_score': z_score,
-                                                'pair_trade': True
-                                            })
-
-                                # Spread too low: long sym1, short sym2
-                                elif z_score < -2 and positions[sym1] == 0 and positions[sym2] == 0:
-                                    shares1 = int((cash * position_size) / current_prices[sym1])
-                                    if shares1 > 0:
-                                        cost = shares1 * current_prices[sym1]
-                                        if cost <= cash:
-                                            positions[sym1] = shares1
-                                            cash -= cost
-                                            trade_log.append({
-                                                'date': str(current_date.date()),
-                                                'symbol': sym1,
-                                                'action': 'BUY',
-                                                'shares': shares1,
-                                                'price': current_prices[sym1],
-                                                'total': cost,
-                                                'z_score': z_score,
-                                                'pair_trade': True
-                                            })
-
-                                # Spread normalized: close positions
-                                elif abs(z_score) < 0.5:
-                                    for sym in [sym1, sym2]:
-                                        if positions[sym] > 0 and sym in current_prices:
-                                            proceeds = positions[sym] * current_prices[sym]
-                                            trade_log.append({
-                                                'date': str(current_date.date()),
-                                                'symbol': sym,
-                                                'action': 'SELL',
-                                                'shares': positions[sym],
-                                                'price': current_prices[sym],
-                                                'total': proceeds,
-                                                'z_score': z_score,
-                                                'pair_trade': True
-                                            })
-                                            cash += proceeds
-                                            positions[sym] = 0
-
-            # Calculate portfolio value
-            portfolio_value = cash
-            for sym in positions:
-                if positions[sym] > 0 and sym in current_prices:
-                    portfolio_value += positions[sym] * current_prices[sym]
-
-            portfolio_values.append(portfolio_value)
-
-            # Track benchmark value
-            if benchmark_data is not None and current_date in benchmark_data.index:
-                benchmark_price = benchmark_data.loc[current_date, 'Close']
-                benchmark_value = benchmark_shares * benchmark_price
-                benchmark_value_series.append(benchmark_value)
-            else:
-                benchmark_value_series.append(initial_capital)
+            equity, t_bar, t_sym, t_side, t_shares, t_price, t_total = kernel_out
+            portfolio_values = equity.tolist()
+
+            for bar_i, k, side, shares, price, total in zip(
+                t_bar.tolist(), t_sym.tolist(), t_side.tolist(), t_shares.tolist(), t_price.tolist(), t_total.tolist()
+            ):
+                trade = {
+                    'date': str(sorted_dates[bar_i].date()),
+                    'symbol': sym_list[k],
+                    'action': 'BUY' if side == TRADE_BUY else 'SELL',
+                    'shares': shares,
+                    'price': price,
+                    'total': total
+                }
+                for field, values in trade_fields[side].items():
+                    trade[field] = float(values[bar_i, k])
+                trade.update(trade_extra)
+                trade_log.append(trade)
 
         # ========== CALCULATE METRICS FROM STRATEGY RESULTS ==========
 
@@ -2882,11 +3955,6 @@ async def backtest_strategy(request: dict):
         portfolio_returns = portfolio_value.pct_change().dropna()
         cumulative_returns = (1 + portfolio_returns).cumprod()
 
-        # Create dataframe for grouping
-        portfolio_df = pd.DataFrame({
-            'Value': portfolio_value
-        })
-
         # Calculate risk metrics
         annual_return = portfolio_returns.mean() * 252
         annual_volatility = portfolio_returns.std() * np.sqrt(252)
@@ -2897,11 +3965,8 @@ async def backtest_strategy(request: dict):
         downside_deviation = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0
         sortino_ratio = (annual_return - 0.02) / downside_deviation if downside_deviation > 0 else 0
 
-        # Max drawdown
-        cumulative = (1 + portfolio_returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = drawdown.min()
+        # Max drawdown (reuses the cumulative curve above)
+        max_drawdown = max_drawdown_from_growth(cumulative_returns.to_numpy())
 
         # Win rate
         positive_days = (portfolio_returns > 0).sum()
@@ -2909,10 +3974,10 @@ async def backtest_strategy(request: dict):
         win_rate = (positive_days / total_days) * 100 if total_days > 0 else 0
 
         # Performance by year
-        portfolio_df['Return'] = portfolio_returns
-        yearly_returns = portfolio_df.groupby(portfolio_df.index.year)['Return'].apply(
-            lambda x: ((1 + x).prod() - 1) * 100
-        ).to_dict()
+        # PERFORMANCE FIX: Cythonized groupby prod over calendar years (the same bins as resample('YE'),
+        # without the pandas-version-specific alias) instead of a Python lambda per year group
+        daily_growth = 1 + portfolio_value.pct_change()
+        yearly_returns = ((daily_growth.groupby(daily_growth.index.year).prod() - 1) * 100).to_dict()
 
         result = {
             'performance': {
@@ -2927,14 +3992,13 @@ async def backtest_strategy(request: dict):
                 'initialCapital': initial_capital
             },
             'yearlyReturns': yearly_returns,
-            'chart': [
-                {
-                    'date': str(date.date()),
-                    'portfolioValue': float(value),
-                    'benchmark': float(benchmark_value_series[i]) if i < len(benchmark_value_series) else float(initial_capital)
-                }
-                for i, (date, value) in enumerate(portfolio_value.items())
-            ],
+            # PERFORMANCE FIX: Columnar equity curve - three parallel arrays (written straight from numpy
+            # by orjson_response below) instead of one dict per bar; the client zips them by index.
+            'chart': {
+                'dates': sorted_dates.strftime('%Y-%m-%d').tolist(),
+                'portfolioValue': portfolio_value.to_numpy(dtype=float),
+                'benchmark': np.asarray(benchmark_value_series, dtype=float),
+            },
             'symbols': symbols,
             'weights': weights,
             'startDate': start_date,
@@ -2950,7 +4014,8 @@ async def backtest_strategy(request: dict):
 
         logger.info(f"✅ BACKTEST COMPLETE: {len(portfolio_value)} data points, symbols={list(stock_data.keys())}, hash={result['_debug']['requestHash']}")
 
-        return result
+        # chart columns are float64 ndarrays - serialize with orjson directly (jsonable_encoder rejects ndarrays)
+        return orjson_response(result)
 
     except HTTPException:
         raise
@@ -2958,6 +4023,92 @@ async def backtest_strategy(request: dict):
         logger.error(f"Backtest API error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to run backtest: {str(e)}")
 
+RISK_FREE_RATE = 0.02
+EFFICIENT_FRONTIER_POINTS = 500
+DEGENERATE_SHARPE_SAMPLES = 5000  # Long-only portfolios scored when no tangency portfolio exists
+
+def portfolio_stats(weights: np.ndarray, mean_returns: np.ndarray, cov: np.ndarray):
+    """Annual return and volatility of one (N,) or many (K, N) weight vectors - all quadratic forms in one einsum"""
+    W = np.atleast_2d(weights)
+    rets = W @ mean_returns
+    vols = np.sqrt(np.maximum(np.einsum('ki,ij,kj->k', W, cov, W), 0.0))
+    return rets, vols
+
+def sharpe_ratios(rets: np.ndarray, vols: np.ndarray, risk_free: float = RISK_FREE_RATE) -> np.ndarray:
+    """(return - rf) / volatility, 0 where volatility is 0"""
+    return np.divide(rets - risk_free, vols, out=np.zeros_like(vols), where=vols > 0)
+
+def sample_portfolios(num_portfolios: int, n_assets: int) -> np.ndarray:
+    """
+    PERFORMANCE FIX: All Monte Carlo portfolios as one (K, N) matrix of long-only weights (rows sum to 1),
+    so returns/volatilities come from one matmul + einsum instead of a Python loop of tiny np.dots
+    """
+    weights = np.random.random((num_portfolios, n_assets))
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights
+
+def frontier_records(weights: np.ndarray, rets: np.ndarray, vols: np.ndarray, sharpes: np.ndarray,
+                     symbols_list: List[str]) -> list:
+    """Frontier chart points ({return %, volatility %, sharpe, weights}) zipped from column arrays"""
+    return [
+        {'return': r, 'volatility': v, 'sharpe': sh, 'weights': dict(zip(symbols_list, w))}
+        for r, v, sh, w in zip((rets * 100).tolist(), (vols * 100).tolist(), sharpes.tolist(), weights.tolist())
+    ]
+
+def mpt_closed_form(mean_returns: np.ndarray, cov: np.ndarray, risk_free: float = RISK_FREE_RATE,
+                    n_points: int = EFFICIENT_FRONTIER_POINTS) -> dict:
+    """
+    PERFORMANCE FIX: Analytical Markowitz solution (fully invested, shorting allowed) in place of random
+    weight sampling. With A = 1'S^-1 mu, B = mu'S^-1 mu, C = 1'S^-1 1, D = BC - A^2:
+    min-variance w = S^-1 1 / C, tangency w = S^-1 (mu - rf) / (A - rf C), and the frontier portfolio
+    for target return m is w = g + m h (Merton 1972). Returns the weight arrays.
+    """
+    n = mean_returns.size
+    ones = np.ones(n)
+    try:
+        solved = np.linalg.solve(cov, np.column_stack((ones, mean_returns)))
+    except np.linalg.LinAlgError:
+        # Singular covariance (e.g. perfectly collinear assets): least-norm pseudo-inverse solution
+        solved = np.linalg.pinv(cov) @ np.column_stack((ones, mean_returns))
+    inv_ones, inv_mu = solved[:, 0], solved[:, 1]
+    A = ones @ inv_mu
+    B = mean_returns @ inv_mu
+    C = ones @ inv_ones
+    D = B * C - A * A
+
+    min_vol_w = inv_ones / C
+    denom = A - risk_free * C
+    tangency_w = (inv_mu - risk_free * inv_ones) / denom if denom > 0 else None
+
+    # Efficient branch from the minimum-variance return up past the best single asset / tangency return
+    min_vol_ret = A / C
+    top_ret = float(mean_returns.max())
+    if tangency_w is not None:
+        top_ret = max(top_ret, float(tangency_w @ mean_returns))
+    if D > 1e-12 and top_ret > min_vol_ret:
+        targets = np.linspace(min_vol_ret, top_ret, n_points)
+        g = (B * inv_ones - A * inv_mu) / D
+        h = (C * inv_mu - A * inv_ones) / D
+        frontier_w = g + targets[:, None] * h
+    else:
+        frontier_w = min_vol_w[None, :]
+
+    if tangency_w is not None:
+        max_sharpe_w = tangency_w
+    else:
+        # Risk-free rate at/above the minimum-variance return: no tangency on the efficient branch (its Sharpe
+        # is only approached with unbounded leverage). Take the best Sharpe among the frontier points, the
+        # single assets and sampled long-only portfolios instead of falling back to minimum variance.
+        candidates = np.vstack((frontier_w, np.eye(n), sample_portfolios(DEGENERATE_SHARPE_SAMPLES, n)))
+        cand_rets, cand_vols = portfolio_stats(candidates, mean_returns, cov)
+        max_sharpe_w = candidates[np.argmax(sharpe_ratios(cand_rets, cand_vols, risk_free))]
+
+    return {
+        'frontier_weights': frontier_w,
+        'max_sharpe_weights': max_sharpe_w,
+        'min_vol_weights': min_vol_w,
+    }
+
 @app.post("/api/quant/optimize")
 async def optimize_portfolio(request: dict):
     """
@@ -2976,19 +4127,12 @@ async def optimize_portfolio(request: dict):
         # Fetch historical data
         async def fetch_history(xstock_symbol: str):
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     return None
 
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    hist = ticker.history(start=start_date, end=end_date, timeout=15)
-                    if hist.empty:
-                        return None
-                    return hist['Close']
-
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                bars = await fetch_daily_history(real_symbol, start_date, end_date)
+                return bars.close_series() if bars is not None else None
             except Exception as e:
                 logger.warning(f"Could not fetch history for {xstock_symbol}: {e}")
                 return None
@@ -3026,57 +4170,28 @@ async def optimize_portfolio(request: dict):
         logger.info(f"Expected annual returns (%): {(mean_returns * 100).tolist()} %")
         logger.info(f"Annual volatilities (%): {(np.sqrt(np.diag(cov_matrix)) * 100).tolist()} %")
 
-        # Generate efficient frontier (simple Monte Carlo)
-        num_portfolios = 5000
-        results = []
-
-        for _ in range(num_portfolios):
-            weights = np.random.random(len(valid_data))
-            weights /= weights.sum()
-
-            portfolio_return = np.dot(weights, mean_returns)
-            portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-            sharpe_ratio = (portfolio_return - 0.02) / portfolio_volatility if portfolio_volatility > 0 else 0
-
-            results.append({
-                'return': float(portfolio_return * 100),
-                'volatility': float(portfolio_volatility * 100),
-                'sharpe': float(sharpe_ratio),
-                'weights': weights.tolist()
-            })
-
-        # Find optimal portfolios
-        max_sharpe_idx = max(range(len(results)), key=lambda i: results[i]['sharpe'])
-        min_vol_idx = min(range(len(results)), key=lambda i: results[i]['volatility'])
+        # Efficient frontier, max-Sharpe and min-volatility portfolios in closed form
+        mu, cov = mean_returns.to_numpy(), cov_matrix.to_numpy()
+        mpt = mpt_closed_form(mu, cov)
+        symbols_list = [s for s, _ in valid_data]
 
-        optimal_sharpe = results[max_sharpe_idx]
-        optimal_min_vol = results[min_vol_idx]
+        def portfolio_summary(weights: np.ndarray) -> dict:
+            ret, vol = portfolio_stats(weights, mu, cov)
+            return {
+                'weights': dict(zip(symbols_list, weights.tolist())),
+                'expectedReturn': float(ret[0] * 100),
+                'volatility': float(vol[0] * 100),
+                'sharpe': float(sharpe_ratios(ret, vol)[0])
+            }
 
-        # Convert weights arrays to dictionaries
-        symbols_list = [s for s, _ in valid_data]
+        frontier_ret, frontier_vol = portfolio_stats(mpt['frontier_weights'], mu, cov)
+        frontier_sharpe = sharpe_ratios(frontier_ret, frontier_vol)
 
         result = {
-            'efficientFrontier': [
-                {
-                    'return': r['return'],
-                    'volatility': r['volatility'],
-                    'sharpe': r['sharpe'],
-                    'weights': {sym: float(w) for sym, w in zip(symbols_list, r['weights'])}
-                }
-                for r in results[::10]  # Every 10th point for performance
-            ],
-            'maxSharpePortfolio': {
-                'weights': {sym: float(w) for sym, w in zip(symbols_list, optimal_sharpe['weights'])},
-                'expectedReturn': optimal_sharpe['return'],
-                'volatility': optimal_sharpe['volatility'],
-                'sharpe': optimal_sharpe['sharpe']
-            },
-            'minVolatilityPortfolio': {
-                'weights': {sym: float(w) for sym, w in zip(symbols_list, optimal_min_vol['weights'])},
-                'expectedReturn': optimal_min_vol['return'],
-                'volatility': optimal_min_vol['volatility'],
-                'sharpe': optimal_min_vol['sharpe']
-            },
+            'efficientFrontier': frontier_records(mpt['frontier_weights'], frontier_ret, frontier_vol,
+                                                  frontier_sharpe, symbols_list),
+            'maxSharpePortfolio': portfolio_summary(mpt['max_sharpe_weights']),
+            'minVolatilityPortfolio': portfolio_summary(mpt['min_vol_weights']),
             'symbols': symbols_list,
             'tradingDays': len(portfolio_df),
             'timestamp': int(time.time() * 1000)
@@ -3145,18 +4260,12 @@ async def black_litterman_model(request: dict):
 
                 logger.info(f"Fetching {xstock_symbol} -> {real_symbol} from {start_date} to {end_date}")
 
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    hist = ticker.history(start=start_date, end=end_date, timeout=15)
-                    if hist.empty:
-                        logger.warning(f"Empty history for {xstock_symbol} ({real_symbol})")
-                        return None
-                    logger.info(f"Successfully fetched {len(hist)} data points for {xstock_symbol}")
-                    return hist['Close']
-
-                loop = asyncio.get_event_loop()
-                prices = await loop.run_in_executor(None, fetch)
-                return (xstock_symbol, prices)
+                bars = await fetch_daily_history(real_symbol.replace('.', '-'), start_date, end_date)
+                if bars is None:
+                    logger.warning(f"Empty history for {xstock_symbol} ({real_symbol})")
+                    return (xstock_symbol, None)
+                logger.info(f"Successfully fetched {len(bars)} data points for {xstock_symbol}")
+                return (xstock_symbol, bars.close_series())
             except Exception as e:
                 logger.error(f"Failed to fetch {xstock_symbol}: {e}")
                 return (xstock_symbol, None)
@@ -3228,24 +4337,16 @@ async def black_litterman_model(request: dict):
 
             # Optimize using implied returns
             num_portfolios = 1000
-            results_list = []
-
-            for _ in range(num_portfolios):
-                weights = np.random.random(n_assets)
-                weights /= weights.sum()
-
-                portfolio_return = np.dot(weights, implied_returns)
-                portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-                sharpe_ratio = (portfolio_return - 0.02) / portfolio_volatility if portfolio_volatility > 0 else 0
-
-                results_list.append({
-                    'sharpe': sharpe_ratio,
-                    'return': portfolio_return,
-                    'volatility': portfolio_volatility,
-                    'weights': weights
-                })
-
-            best = max(results_list, key=lambda x: x['sharpe'])
+            weights = sample_portfolios(num_portfolios, n_assets)
+            port_returns, port_vols = portfolio_stats(weights, implied_returns, cov_matrix)
+            port_sharpes = sharpe_ratios(port_returns, port_vols)
+            best_idx = int(np.argmax(port_sharpes))
+            best = {
+                'sharpe': port_sharpes[best_idx],
+                'return': port_returns[best_idx],
+                'volatility': port_vols[best_idx],
+                'weights': weights[best_idx]
+            }
 
             return {
                 'impliedReturns': {sym: float(ret * 100) for sym, ret in zip(symbols_list, implied_returns)},
@@ -3310,47 +4411,38 @@ async def black_litterman_model(request: dict):
 
         # ===== STEP 3: Black-Litterman Formula =====
         # μ_BL = [(τΣ)^-1 + P'Ω^-1P]^-1 [(τΣ)^-1π + P'Ω^-1Q]
+        # PERFORMANCE FIX: Evaluated in the equivalent (Woodbury) form that never inverts an n×n matrix:
+        #   μ_BL = π + τΣP' S^-1 (Q - Pπ),   M^-1 = τΣ - τΣP' S^-1 PτΣ,   S = PτΣP' + Ω
+        # S is only views×views and SPD, so one Cholesky factorization + triangular solves replace
+        # the three np.linalg.inv calls (τΣ, Ω, M) - cheaper and numerically more stable.
 
         tau_sigma = tau * cov_matrix
 
-        # DIAGNOSTIC: Check tau_sigma before inversion
+        # DIAGNOSTIC: Check tau_sigma conditioning
         logger.info(f"[DIAGNOSTIC] tau_sigma determinant: {np.linalg.det(tau_sigma)}")
         logger.info(f"[DIAGNOSTIC] tau_sigma condition number: {np.linalg.cond(tau_sigma)}")
 
-        try:
-            tau_sigma_inv = np.linalg.inv(tau_sigma)
-        except np.linalg.LinAlgError as e:
-            logger.error(f"[ERROR] Failed to invert tau_sigma matrix: {e}")
-            raise HTTPException(status_code=500, detail=f"Singular matrix error in tau_sigma: {e}")
-
-        # DIAGNOSTIC: Check Omega before inversion
-        logger.info(f"[DIAGNOSTIC] Omega determinant: {np.linalg.det(Omega)}")
-        logger.info(f"[DIAGNOSTIC] Omega condition number: {np.linalg.cond(Omega)}")
-
-        try:
-            omega_inv = np.linalg.inv(Omega)
-        except np.linalg.LinAlgError as e:
-            logger.error(f"[ERROR] Failed to invert Omega matrix: {e}")
-            raise HTTPException(status_code=500, detail=f"Singular matrix error in Omega: {e}")
-
-        # Posterior precision matrix
-        M = tau_sigma_inv + P.T @ omega_inv @ P
+        # Ω is diagonal (one independent uncertainty per view)
+        omega_diag = np.diag(Omega)
+        if not np.all(omega_diag > 0):
+            logger.error(f"[ERROR] Omega has non-positive view variances: {omega_diag.tolist()}")
+            raise HTTPException(status_code=500, detail="Singular matrix error in Omega: non-positive view variance")
 
-        # DIAGNOSTIC: Check M before inversion
-        logger.info(f"[DIAGNOSTIC] M determinant: {np.linalg.det(M)}")
-        logger.info(f"[DIAGNOSTIC] M condition number: {np.linalg.cond(M)}")
+        tau_sigma_pt = tau_sigma @ P.T
+        view_cov = P @ tau_sigma_pt + np.diag(omega_diag)
 
         try:
-            M_inv = np.linalg.inv(M)
+            view_cov_factor = cho_factor(view_cov)
         except np.linalg.LinAlgError as e:
-            logger.error(f"[ERROR] Failed to invert M matrix: {e}")
-            raise HTTPException(status_code=500, detail=f"Singular matrix error in M: {e}")
+            logger.error(f"[ERROR] Failed to factor view covariance PτΣP' + Ω: {e}")
+            raise HTTPException(status_code=500, detail=f"Singular matrix error in view covariance: {e}")
 
         # Posterior mean returns
-        mu_bl = M_inv @ (tau_sigma_inv @ implied_returns + P.T @ omega_inv @ Q)
+        mu_bl = implied_returns + tau_sigma_pt @ cho_solve(view_cov_factor, Q - P @ implied_returns)
 
         # Posterior covariance matrix
         # Σ_BL = Σ + M^-1
+        M_inv = tau_sigma - tau_sigma_pt @ cho_solve(view_cov_factor, tau_sigma_pt.T)
         sigma_bl = cov_matrix + M_inv
 
         logger.info(f"Black-Litterman updated returns: {(mu_bl * 100).tolist()} %")
@@ -3359,56 +4451,28 @@ async def black_litterman_model(request: dict):
         # Generate efficient frontier using BL posterior returns and covariance
         logger.info("GENERATING EFFICIENT FRONTIER - NEW CODE V2.0")
         num_portfolios = 300  # Reduced from 1000 to prevent memory issues on free tier
-        results_list = []
-        efficient_frontier = []
-
-        for _ in range(num_portfolios):
-            weights = np.random.random(n_assets)
-            weights /= weights.sum()
-
-            portfolio_return = np.dot(weights, mu_bl)
-            portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(sigma_bl, weights)))
-            sharpe_ratio = (portfolio_return - 0.02) / portfolio_volatility if portfolio_volatility > 0 else 0
-
-            results_list.append({
-                'sharpe': sharpe_ratio,
-                'return': portfolio_return,
-                'volatility': portfolio_volatility,
-                'weights': weights
-            })
+        weights = sample_portfolios(num_portfolios, n_assets)
+        port_returns, port_vols = portfolio_stats(weights, mu_bl, sigma_bl)
+        port_sharpes = sharpe_ratios(port_returns, port_vols)
 
-            # Add to efficient frontier (all portfolios for visualization)
-            efficient_frontier.append({
-                'return': float(portfolio_return * 100),
-                'volatility': float(portfolio_volatility * 100),
-                'sharpe': float(sharpe_ratio),
-                'weights': {sym: float(w) for sym, w in zip(symbols_list, weights)}
-            })
+        # Add to efficient frontier (all portfolios for visualization)
+        efficient_frontier = frontier_records(weights, port_returns, port_vols, port_sharpes, symbols_list)
+
+        def pick(i: int) -> dict:
+            return {'sharpe': port_sharpes[i], 'return': port_returns[i], 'volatility': port_vols[i], 'weights': weights[i]}
 
         # Find optimal Sharpe ratio portfolio
-        best = max(results_list, key=lambda x: x['sharpe'])
+        best = pick(int(np.argmax(port_sharpes)))
 
         # Find minimum volatility portfolio
-        min_vol = min(results_list, key=lambda x: x['volatility'])
+        min_vol = pick(int(np.argmin(port_vols)))
 
         # Also generate MPT efficient frontier for comparison (using historical cov, not BL)
-        mpt_frontier = []
-        for _ in range(num_portfolios):
-            weights = np.random.random(n_assets)
-            weights /= weights.sum()
-
-            # Use historical returns (mean) and covariance
-            historical_returns = returns.mean().values * 252
-            portfolio_return_mpt = np.dot(weights, historical_returns)
-            portfolio_volatility_mpt = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-            sharpe_ratio_mpt = (portfolio_return_mpt - 0.02) / portfolio_volatility_mpt if portfolio_volatility_mpt > 0 else 0
-
-            mpt_frontier.append({
-                'return': float(portfolio_return_mpt * 100),
-                'volatility': float(portfolio_volatility_mpt * 100),
-                'sharpe': float(sharpe_ratio_mpt),
-                'weights': {sym: float(w) for sym, w in zip(symbols_list, weights)}
-            })
+        # Use historical returns (mean) and covariance
+        historical_returns = returns.mean().values * 252
+        mpt_weights = sample_portfolios(num_portfolios, n_assets)
+        mpt_returns, mpt_vols = portfolio_stats(mpt_weights, historical_returns, cov_matrix)
+        mpt_frontier = frontier_records(mpt_weights, mpt_returns, mpt_vols, sharpe_ratios(mpt_returns, mpt_vols), symbols_list)
 
         result = {
             'impliedReturns': {sym: float(ret * 100) for sym, ret in zip(symbols_list, implied_returns)},
@@ -3481,15 +4545,8 @@ async def calculate_risk_metrics(request: dict):
                 if not real_symbol:
                     return None
 
-                def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
-                    hist = ticker.history(start=start_date, end=end_date, timeout=15)
-                    if hist.empty:
-                        return None
-                    return hist['Close']
-
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                bars = await fetch_daily_history(real_symbol.replace('.', '-'), start_date, end_date)
+                return bars.close_series() if bars is not None else None
             except Exception as e:
                 logger.warning(f"Could not fetch history for {xstock_symbol}: {e}")
                 return None
@@ -3529,10 +4586,7 @@ async def calculate_risk_metrics(request: dict):
         sortino_ratio = (annual_return - 0.02) / downside_deviation if downside_deviation > 0 else 0
 
         # Max drawdown
-        cumulative = (1 + portfolio_returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = drawdown.min()
+        max_drawdown = max_drawdown_from_growth((1 + portfolio_returns.to_numpy()).cumprod())
 
         # Beta (vs S&P 500)
         covariance = portfolio_returns.cov(benchmark_returns)
@@ -3622,7 +4676,7 @@ async def calculate_correlation(request: dict):
 
         for real_symbol in real_symbols:
             try:
-                ticker = yf.Ticker(real_symbol)
+                ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                 hist = ticker.history(start=start_date, end=end_date, timeout=10)
                 if not hist.empty:
                     all_data[real_symbol] = hist['Close']
@@ -3811,19 +4865,19 @@ async def monte_carlo_simulation(request: dict):
         # Fetch historical data to calculate returns
         async def fetch_history(xstock_symbol: str):
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     return None
 
                 def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                    ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                     hist = ticker.history(start=start_date, timeout=15)
                     if hist.empty:
                         return None
                     return hist['Close']
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch history for {xstock_symbol}: {e}")
                 return None
@@ -3930,13 +4984,13 @@ async def analyze_portfolio(request: dict):
                 if xstock_symbol.startswith('^'):
                     real_symbol = xstock_symbol
                 else:
-                    real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                    real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                     if not real_symbol:
                         logger.warning(f"⚠️ Symbol {xstock_symbol} not found in mapping")
                         return None
 
                 def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                    ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                     hist = ticker.history(start=start_date, end=end_date, timeout=15)
                     info = ticker.info
                     if hist.empty:
@@ -3949,8 +5003,8 @@ async def analyze_portfolio(request: dict):
                         'sector': info.get('sector', 'Benchmark' if xstock_symbol.startswith('^') else 'Unknown')
                     }
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch history for {xstock_symbol}: {e}")
                 return None
@@ -4074,10 +5128,7 @@ async def analyze_portfolio(request: dict):
                         beta = covariance / benchmark_variance if benchmark_variance > 0 else 1.0
 
                         # Max drawdown
-                        cumulative = (1 + portfolio_returns).cumprod()
-                        running_max = cumulative.expanding().max()
-                        drawdown = (cumulative - running_max) / running_max
-                        max_drawdown = drawdown.min()
+                        max_drawdown = max_drawdown_from_growth((1 + portfolio_returns.to_numpy()).cumprod())
 
                         # Benchmark comparison
                         benchmark_annual_return = benchmark_returns.mean() * 252
@@ -4225,12 +5276,12 @@ async def optimize_portfolio_allocation(request: dict):
         # Fetch historical data
         async def fetch_history(xstock_symbol: str):
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     return None
 
                 def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                    ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                     hist = ticker.history(start=start_date, timeout=15)
                     info = ticker.info
                     if hist.empty:
@@ -4241,8 +5292,8 @@ async def optimize_portfolio_allocation(request: dict):
                         'beta': float(info.get('beta', 1.0)) if info.get('beta') else 1.0
                     }
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch history for {xstock_symbol}: {e}")
                 return None
@@ -4273,26 +5324,18 @@ async def optimize_portfolio_allocation(request: dict):
 
         # Monte Carlo optimization with constraints
         num_portfolios = 5000
-        results = []
-
-        for _ in range(num_portfolios):
-            weights = np.random.random(len(valid_data))
-            weights /= weights.sum()
-
-            portfolio_return = np.dot(weights, mean_returns)
-            portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-            sharpe_ratio = (portfolio_return - 0.02) / portfolio_volatility if portfolio_volatility > 0 else 0
-
-            # Filter by risk tolerance
-            if portfolio_volatility <= profile['max_vol']:
-                results.append({
-                    'return': float(portfolio_return * 100),
-                    'volatility': float(portfolio_volatility * 100),
-                    'sharpe': float(sharpe_ratio),
-                    'weights': weights.tolist()
-                })
+        weights = sample_portfolios(num_portfolios, len(valid_data))
+        port_returns, port_vols = portfolio_stats(weights, mean_returns.to_numpy(), cov_matrix.to_numpy())
+        port_sharpes = sharpe_ratios(port_returns, port_vols)
+
+        # Filter by risk tolerance
+        within_risk = port_vols <= profile['max_vol']
+        weights, port_returns, port_vols, port_sharpes = (
+            weights[within_risk], port_returns[within_risk], port_vols[within_risk], port_sharpes[within_risk]
+        )
+        has_candidates = port_vols.size > 0
 
-        if not results:
+        if not has_candidates:
             # Fallback to equal weight
             equal_weights = [1.0 / len(valid_data)] * len(valid_data)
             portfolio_return = np.dot(equal_weights, mean_returns)
@@ -4305,14 +5348,19 @@ async def optimize_portfolio_allocation(request: dict):
         else:
             # Find best allocation for objective
             if objective == 'growth':
-                best = max(results, key=lambda x: x['return'])
+                best_idx = int(np.argmax(port_returns))
             elif objective == 'income':
                 # Weight by dividend yield
-                div_yields = [data['dividendYield'] for _, data in valid_data]
-                best_idx = max(range(len(results)), key=lambda i: sum(results[i]['weights'][j] * div_yields[j] for j in range(len(div_yields))))
-                best = results[best_idx]
+                div_yields = np.array([data['dividendYield'] for _, data in valid_data])
+                best_idx = int(np.argmax(weights @ div_yields))
             else:  # balanced
-                best = max(results, key=lambda x: x['sharpe'])
+                best_idx = int(np.argmax(port_sharpes))
+            best = {
+                'return': float(port_returns[best_idx] * 100),
+                'volatility': float(port_vols[best_idx] * 100),
+                'sharpe': float(port_sharpes[best_idx]),
+                'weights': weights[best_idx].tolist()
+            }
 
             recommended_allocation = [
                 {'symbol': sym, 'weight': float(w * 100), 'dividendYield': data['dividendYield'], 'beta': data['beta']}
@@ -4322,9 +5370,9 @@ async def optimize_portfolio_allocation(request: dict):
         result = {
             'recommended': {
                 'allocation': recommended_allocation,
-                'expectedReturn': best.get('return', 0) if results else float(portfolio_return * 100),
-                'expectedVolatility': best.get('volatility', 0) if results else float(portfolio_volatility * 100),
-                'sharpeRatio': best.get('sharpe', 0) if results else float((portfolio_return - 0.02) / portfolio_volatility),
+                'expectedReturn': best.get('return', 0) if has_candidates else float(portfolio_return * 100),
+                'expectedVolatility': best.get('volatility', 0) if has_candidates else float(portfolio_volatility * 100),
+                'sharpeRatio': best.get('sharpe', 0) if has_candidates else float((portfolio_return - 0.02) / portfolio_volatility),
                 'strategy': f'{risk_tolerance.title()} Risk / {objective.title()} Objective'
             },
             'profile': {
@@ -4361,7 +5409,7 @@ async def get_options_chain(xstock_symbol: str, expiration: str = Query(None, de
     - Implied volatility
     """
     cache_key = f"options_chain_{xstock_symbol}_{expiration or 'all'}"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         return cached
 
@@ -4370,7 +5418,7 @@ async def get_options_chain(xstock_symbol: str, expiration: str = Query(None, de
         if not real_symbol:
             raise HTTPException(status_code=404, detail=f"xStock symbol {xstock_symbol} not found")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
 
         # Get available expiration dates
         expirations = ticker.options
@@ -4393,7 +5441,15 @@ async def get_options_chain(xstock_symbol: str, expiration: str = Query(None, de
         # Process calls
         calls_df = option_chain.calls
         calls = []
-        for _, row in calls_df.iterrows():
+        # PERFORMANCE FIX: Greeks for the whole chain in one vectorized Black-Scholes pass
+        call_greeks = calculate_greeks_batch(
+            current_price,
+            calls_df['strike'].to_numpy(dtype=float),
+            calls_df['impliedVolatility'].fillna(0).to_numpy(dtype=float),
+            expirations_to_years(expiration),
+            'call'
+        )
+        for i, (_, row) in enumerate(calls_df.iterrows()):
             strike = float(row.get('strike', 0))
             calls.append({
                 'strike': strike,
@@ -4410,16 +5466,24 @@ async def get_options_chain(xstock_symbol: str, expiration: str = Query(None, de
                 'moneyness': 'ITM' if current_price > strike else 'OTM',
                 'intrinsicValue': max(0, current_price - strike),
                 # Calculate Greeks using Black-Scholes
-                'delta': calculate_delta(current_price, strike, float(row.get('impliedVolatility', 0)), expiration, 'call'),
-                'gamma': calculate_gamma(current_price, strike, float(row.get('impliedVolatility', 0)), expiration),
-                'theta': calculate_theta(current_price, strike, float(row.get('impliedVolatility', 0)), expiration, 'call'),
-                'vega': calculate_vega(current_price, strike, float(row.get('impliedVolatility', 0)), expiration),
+                'delta': float(call_greeks['delta'][i]),
+                'gamma': float(call_greeks['gamma'][i]),
+                'theta': float(call_greeks['theta'][i]),
+                'vega': float(call_greeks['vega'][i]),
             })
 
         # Process puts
         puts_df = option_chain.puts
         puts = []
-        for _, row in puts_df.iterrows():
+        # PERFORMANCE FIX: Greeks for the whole chain in one vectorized Black-Scholes pass
+        put_greeks = calculate_greeks_batch(
+            current_price,
+            puts_df['strike'].to_numpy(dtype=float),
+            puts_df['impliedVolatility'].fillna(0).to_numpy(dtype=float),
+            expirations_to_years(expiration),
+            'put'
+        )
+        for i, (_, row) in enumerate(puts_df.iterrows()):
             strike = float(row.get('strike', 0))
             puts.append({
                 'strike': strike,
@@ -4436,10 +5500,10 @@ async def get_options_chain(xstock_symbol: str, expiration: str = Query(None, de
                 'moneyness': 'ITM' if current_price < strike else 'OTM',
                 'intrinsicValue': max(0, strike - current_price),
                 # Calculate Greeks using Black-Scholes
-                'delta': calculate_delta(current_price, strike, float(row.get('impliedVolatility', 0)), expiration, 'put'),
-                'gamma': calculate_gamma(current_price, strike, float(row.get('impliedVolatility', 0)), expiration),
-                'theta': calculate_theta(current_price, strike, float(row.get('impliedVolatility', 0)), expiration, 'put'),
-                'vega': calculate_vega(current_price, strike, float(row.get('impliedVolatility', 0)), expiration),
+                'delta': float(put_greeks['delta'][i]),
+                'gamma': float(put_greeks['gamma'][i]),
+                'theta': float(put_greeks['theta'][i]),
+                'vega': float(put_greeks['vega'][i]),
             })
 
         result = {
@@ -4499,7 +5563,7 @@ async def scan_unusual_activity_background():
         async def check_unusual_activity(xstock_symbol: str):
             try:
                 real_symbol = map_xstock_to_symbol(xstock_symbol)
-                ticker = yf.Ticker(real_symbol)
+                ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
 
                 # Get nearest expiration
                 expirations = ticker.options
@@ -4624,7 +5688,7 @@ async def get_unusual_options_activity(background_tasks: BackgroundTasks):
         async def quick_check(xstock_symbol: str):
             try:
                 real_symbol = map_xstock_to_symbol(xstock_symbol)
-                ticker = yf.Ticker(real_symbol)
+                ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                 expirations = ticker.options
 
                 if not expirations or len(expirations) == 0:
@@ -4734,7 +5798,7 @@ async def get_put_call_ratio(xstock_symbol: str):
     - Interpretation (bullish/bearish signal)
     """
     cache_key = f"put_call_ratio_{xstock_symbol}"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         return cached
 
@@ -4743,7 +5807,7 @@ async def get_put_call_ratio(xstock_symbol: str):
         if not real_symbol:
             raise HTTPException(status_code=404, detail=f"xStock symbol {xstock_symbol} not found")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         expirations = ticker.options
 
         if not expirations or len(expirations) == 0:
@@ -4848,7 +5912,7 @@ async def get_implied_volatility_surface(xstock_symbol: str):
     - Historical IV comparison
     """
     cache_key = f"implied_vol_{xstock_symbol}"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         return cached
 
@@ -4857,7 +5921,7 @@ async def get_implied_volatility_surface(xstock_symbol: str):
         if not real_symbol:
             raise HTTPException(status_code=404, detail=f"xStock symbol {xstock_symbol} not found")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         info = ticker.info
         current_price = float(info.get('currentPrice', 0))
 
@@ -4984,7 +6048,7 @@ async def get_options_greeks_analysis(xstock_symbol: str, expiration: str = Quer
     - Aggregated portfolio Greeks
     """
     cache_key = f"options_greeks_{xstock_symbol}_{expiration or 'all'}"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         return cached
 
@@ -4993,7 +6057,7 @@ async def get_options_greeks_analysis(xstock_symbol: str, expiration: str = Quer
         if not real_symbol:
             raise HTTPException(status_code=404, detail=f"xStock symbol {xstock_symbol} not found")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         info = ticker.info
         current_price = float(info.get('currentPrice', 0))
 
@@ -5007,6 +6071,7 @@ async def get_options_greeks_analysis(xstock_symbol: str, expiration: str = Quer
             raise HTTPException(status_code=400, detail=f"Invalid expiration. Available: {expirations}")
 
         option_chain = ticker.option_chain(expiration)
+        T = precompute_T(expiration)  # Once per chain, not 4x per contract
 
         # Note: yfinance doesn't always provide Greeks directly
         # We'll return what's available and indicate if Greeks need to be calculated
@@ -5040,10 +6105,10 @@ async def get_options_greeks_analysis(xstock_symbol: str, expiration: str = Quer
 
             # Calculate Greeks using Black-Scholes model
             if implied_volatility > 0:
-                delta = calculate_delta(current_price, strike, implied_volatility, expiration, 'call')
-                gamma = calculate_gamma(current_price, strike, implied_volatility, expiration)
-                theta = calculate_theta(current_price, strike, implied_volatility, expiration, 'call')
-                vega = calculate_vega(current_price, strike, implied_volatility, expiration)
+                delta = calculate_delta(current_price, strike, implied_volatility, T, 'call')
+                gamma = calculate_gamma(current_price, strike, implied_volatility, T)
+                theta = calculate_theta(current_price, strike, implied_volatility, T, 'call')
+                vega = calculate_vega(current_price, strike, implied_volatility, T)
 
                 greeks['delta'] = round(delta, 4)
                 greeks['gamma'] = round(gamma, 4)
@@ -5074,10 +6139,10 @@ async def get_options_greeks_analysis(xstock_symbol: str, expiration: str = Quer
 
             # Calculate Greeks using Black-Scholes model
             if implied_volatility > 0:
-                delta = calculate_delta(current_price, strike, implied_volatility, expiration, 'put')
-                gamma = calculate_gamma(current_price, strike, implied_volatility, expiration)
-                theta = calculate_theta(current_price, strike, implied_volatility, expiration, 'put')
-                vega = calculate_vega(current_price, strike, implied_volatility, expiration)
+                delta = calculate_delta(current_price, strike, implied_volatility, T, 'put')
+                gamma = calculate_gamma(current_price, strike, implied_volatility, T)
+                theta = calculate_theta(current_price, strike, implied_volatility, T, 'put')
+                vega = calculate_vega(current_price, strike, implied_volatility, T)
 
                 greeks['delta'] = round(delta, 4)
                 greeks['gamma'] = round(gamma, 4)
@@ -5147,7 +6212,7 @@ async def get_historical_iv_rank(xstock_symbol: str, days: int = Query(30, descr
     - Mean reversion analysis
     """
     cache_key = f"historical_iv_{xstock_symbol}_{days}"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         return cached
 
@@ -5156,7 +6221,7 @@ async def get_historical_iv_rank(xstock_symbol: str, days: int = Query(30, descr
         if not real_symbol:
             raise HTTPException(status_code=404, detail=f"xStock symbol {xstock_symbol} not found")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         info = ticker.info
         current_price = float(info.get('currentPrice', 0))
 
@@ -5300,13 +6365,11 @@ async def screen_options(
     - Open interest threshold
     """
     cache_key = f"options_screen_{optionType}_{moneyness}_{deltaMin}_{deltaMax}_{ivMin}_{ivMax}_{volumeMin}_{sortBy}_{sortOrder}"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         return cached
 
     try:
-        from datetime import datetime, timedelta
-
         all_results = []
         # All 63 xStocks
         symbols = [
@@ -5328,7 +6391,7 @@ async def screen_options(
                 if not real_symbol:
                     continue
 
-                ticker = yf.Ticker(real_symbol)
+                ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                 info = ticker.info
                 current_price = float(info.get('currentPrice', 0))
 
@@ -5340,10 +6403,11 @@ async def screen_options(
                     continue
 
                 # Screen first 3 expirations
+                now = datetime.now()
                 for exp in expirations[:3]:
                     try:
-                        exp_date = datetime.strptime(exp, '%Y-%m-%d')
-                        days_to_exp = (exp_date - datetime.now()).days
+                        days_to_exp = (_parse_exp(exp) - now).days
+                        T = precompute_T(exp, now)
 
                         if days_to_exp < daysToExpirationMin or days_to_exp > daysToExpirationMax:
                             continue
@@ -5367,7 +6431,7 @@ async def screen_options(
                                     continue
 
                                 # Calculate delta
-                                delta = calculate_delta(current_price, strike, iv/100, exp, 'call')
+                                delta = calculate_delta(current_price, strike, iv/100, T, 'call')
 
                                 if delta < deltaMin or delta > deltaMax:
                                     continue
@@ -5396,9 +6460,9 @@ async def screen_options(
                                     'openInterest': oi,
                                     'impliedVolatility': iv,
                                     'delta': delta,
-                                    'gamma': calculate_gamma(current_price, strike, iv/100, exp),
-                                    'theta': calculate_theta(current_price, strike, iv/100, exp, 'call'),
-                                    'vega': calculate_vega(current_price, strike, iv/100, exp),
+                                    'gamma': calculate_gamma(current_price, strike, iv/100, T),
+                                    'theta': calculate_theta(current_price, strike, iv/100, T, 'call'),
+                                    'vega': calculate_vega(current_price, strike, iv/100, T),
                                     'moneyness': money,
                                     'breakeven': strike + last_price,
                                     'roi': ((current_price - strike - last_price) / last_price * 100) if last_price > 0 else 0,
@@ -5422,7 +6486,7 @@ async def screen_options(
                                     continue
 
                                 # Calculate delta
-                                delta = calculate_delta(current_price, strike, iv/100, exp, 'put')
+                                delta = calculate_delta(current_price, strike, iv/100, T, 'put')
 
                                 if abs(delta) < deltaMin or abs(delta) > deltaMax:
                                     continue
@@ -5451,9 +6515,9 @@ async def screen_options(
                                     'openInterest': oi,
                                     'impliedVolatility': iv,
                                     'delta': abs(delta),
-                                    'gamma': calculate_gamma(current_price, strike, iv/100, exp),
-                                    'theta': calculate_theta(current_price, strike, iv/100, exp, 'put'),
-                                    'vega': calculate_vega(current_price, strike, iv/100, exp),
+                                    'gamma': calculate_gamma(current_price, strike, iv/100, T),
+                                    'theta': calculate_theta(current_price, strike, iv/100, T, 'put'),
+                                    'vega': calculate_vega(current_price, strike, iv/100, T),
                                     'moneyness': money,
                                     'breakeven': strike - last_price,
                                     'roi': ((strike - current_price - last_price) / last_price * 100) if last_price > 0 else 0,
@@ -5501,7 +6565,7 @@ async def get_realtime_data(xstock_symbol: str):
     cache_key = f"realtime_{xstock_symbol}"
 
     # Try cache first
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached data for {xstock_symbol}")
         return cached_data
@@ -5529,7 +6593,7 @@ async def get_historical_data(
     cache_key = f"historical_{xstock_symbol}_{period}_{interval}"
 
     # Try cache first
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         return cached_data
 
@@ -5561,7 +6625,7 @@ async def get_chart_data(
     # Try cache first (shorter TTL for intraday, longer for historical)
     is_intraday = timeframe.endswith('m') or timeframe.endswith('h')
     cache_ttl = 30 if is_intraday else 300  # 30s for intraday, 5 min for daily+
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached chart data for {xstock_symbol} {timeframe}")
         return cached_data
@@ -5607,34 +6671,29 @@ async def get_chart_data(
     try:
         logger.info(f"Fetching chart data for {real_symbol}: timeframe={timeframe}, period={config['period']}, interval={config['interval']}")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         hist = ticker.history(period=config["period"], interval=config["interval"], timeout=30)
 
         if hist.empty:
             raise ValueError(f"No chart data available for {real_symbol}")
 
         # Format data for Lightweight Charts
-        candlesticks = []
-        volume_data = []
-
-        for index, row in hist.iterrows():
-            timestamp = int(index.timestamp())
-
-            # Candlestick data
-            candlesticks.append({
-                "time": timestamp,
-                "open": float(row["Open"]),
-                "high": float(row["High"]),
-                "low": float(row["Low"]),
-                "close": float(row["Close"])
-            })
-
-            # Volume data
-            volume_data.append({
-                "time": timestamp,
-                "value": float(row["Volume"]),
-                "color": "#26a69a" if row["Close"] >= row["Open"] else "#ef5350"
-            })
+        # PERFORMANCE FIX: Epoch seconds for every bar in one vectorized pass and columnar
+        # to_dict('records') - no iterrows() row Series or per-row Timestamp.timestamp() calls
+        times = hist.index.as_unit('ns').asi8 // 10**9
+
+        # Candlestick data
+        candles = hist[['Open', 'High', 'Low', 'Close']].astype(np.float64)
+        candles.columns = ['open', 'high', 'low', 'close']
+        candles.insert(0, 'time', times)
+        candlesticks = candles.to_dict('records')
+
+        # Volume data
+        volume_data = pd.DataFrame({
+            'time': times,
+            'value': hist['Volume'].to_numpy(dtype=np.float64),
+            'color': np.where(hist['Close'].to_numpy() >= hist['Open'].to_numpy(), "#26a69a", "#ef5350")
+        }).to_dict('records')
 
         # Calculate technical indicators (SMA)
         technicals = {}
@@ -5670,7 +6729,7 @@ async def get_fundamentals(xstock_symbol: str):
     cache_key = f"fundamentals_{xstock_symbol}"
 
     # Try cache first (1 hour TTL for fundamentals)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached fundamentals for {xstock_symbol}")
         return cached_data
@@ -5683,7 +6742,7 @@ async def get_fundamentals(xstock_symbol: str):
     try:
         logger.info(f"Fetching fundamentals for {real_symbol}")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         info = ticker.info
 
         # Valuation Metrics
@@ -5795,7 +6854,7 @@ async def get_earnings(xstock_symbol: str):
     cache_key = f"earnings_{xstock_symbol}"
 
     # Try cache first (1 hour TTL)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached earnings for {xstock_symbol}")
         return cached_data
@@ -5808,7 +6867,7 @@ async def get_earnings(xstock_symbol: str):
     try:
         logger.info(f"Fetching earnings for {real_symbol}")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
 
         # Quarterly earnings (last 8 quarters)
         quarterly_earnings = []
@@ -5917,7 +6976,7 @@ async def get_analysts(xstock_symbol: str):
     cache_key = f"analysts_{xstock_symbol}"
 
     # Try cache first (1 hour TTL)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached analyst data for {xstock_symbol}")
         return cached_data
@@ -5930,7 +6989,7 @@ async def get_analysts(xstock_symbol: str):
     try:
         logger.info(f"Fetching analyst data for {real_symbol}")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
         info = ticker.info
 
         # Price targets
@@ -6040,7 +7099,7 @@ async def get_ownership(xstock_symbol: str):
     cache_key = f"ownership_{xstock_symbol}"
 
     # Try cache first (1 hour TTL)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached ownership data for {xstock_symbol}")
         return cached_data
@@ -6053,7 +7112,7 @@ async def get_ownership(xstock_symbol: str):
     try:
         logger.info(f"Fetching ownership data for {real_symbol}")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
 
         # Institutional holders (top 10)
         institutional_holders = []
@@ -6143,7 +7202,7 @@ async def get_news(xstock_symbol: str):
     cache_key = f"news_{xstock_symbol}"
 
     # Try cache first (30 min TTL for news)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         logger.info(f"Returning cached news for {xstock_symbol}")
         return cached_data
@@ -6156,7 +7215,7 @@ async def get_news(xstock_symbol: str):
     try:
         logger.info(f"Fetching news for {real_symbol}")
 
-        ticker = yf.Ticker(real_symbol)
+        ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
 
         # Fetch news articles (last 20)
         news_articles = []
@@ -6204,7 +7263,6 @@ async def get_news(xstock_symbol: str):
                         pub_date = content.get('pubDate')
                         if pub_date:
                             # Parse ISO format: "2025-10-03T14:56:00Z"
-                            from datetime import datetime
                             try:
                                 dt = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
                                 publish_time = int(dt.timestamp())
@@ -6274,13 +7332,13 @@ async def screen_stocks(filters: dict = Body(...)):
         # Process each stock in parallel for performance
         async def process_stock(xstock_symbol: str):
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     return None
 
                 # Fetch stock data in thread pool (yfinance blocks)
                 def fetch_stock_data():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                    ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                     info = ticker.info
 
                     # Calculate technical indicators if needed
@@ -6289,16 +7347,19 @@ async def screen_stocks(filters: dict = Body(...)):
                     if filters.get('rsi') or filters.get('priceVsSMA20'):
                         hist = ticker.history(period='3mo', timeout=10)
                         if not hist.empty and len(hist) >= 15:
-                            rsi = calculate_rsi(hist, 14)
+                            # Only the latest RSI is needed - skip building the chart point list
+                            rsi_values = rsi_from_close(hist['Close'].to_numpy(dtype=np.float64), 14)
+                            rsi_values = rsi_values[~np.isnan(rsi_values)]
+                            rsi = float(rsi_values[-1]) if rsi_values.size else None
 
                     return {
                         'info': info,
                         'hist': hist,
-                        'rsi': rsi[-1]['value'] if rsi and len(rsi) > 0 else None
+                        'rsi': rsi
                     }
 
-                loop = asyncio.get_event_loop()
-                data = await loop.run_in_executor(None, fetch_stock_data)
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(YF_POOL, fetch_stock_data)
 
                 info = data['info']
                 stock_data = {
@@ -6311,22 +7372,22 @@ async def screen_stocks(filters: dict = Body(...)):
                     "changePercent": float(info.get('regularMarketChangePercent', 0)),
                     "volume": int(info.get('volume', 0)),
                     "marketCap": float(info.get('marketCap', 0)),
-                    "pe": float(info.get('trailingPE', 0)) if info.get('trailingPE') else None,
-                    "pb": float(info.get('priceToBook', 0)) if info.get('priceToBook') else None,
-                    "dividendYield": float(info.get('dividendYield', 0)) if info.get('dividendYield') else None,
-                    "epsGrowth": float(info.get('earningsGrowth', 0)) if info.get('earningsGrowth') else None,
-                    "revenueGrowth": float(info.get('revenueGrowth', 0)) if info.get('revenueGrowth') else None,
-                    "debtToEquity": float(info.get('debtToEquity', 0)) if info.get('debtToEquity') else None,
-                    "roe": float(info.get('returnOnEquity', 0)) if info.get('returnOnEquity') else None,
+                    "pe": _fopt(info.get('trailingPE')),
+                    "pb": _fopt(info.get('priceToBook')),
+                    "dividendYield": _fopt(info.get('dividendYield')),
+                    "epsGrowth": _fopt(info.get('earningsGrowth')),
+                    "revenueGrowth": _fopt(info.get('revenueGrowth')),
+                    "debtToEquity": _fopt(info.get('debtToEquity')),
+                    "roe": _fopt(info.get('returnOnEquity')),
                     "rsi": data['rsi'],
-                    "shortPercent": float(info.get('shortPercentOfFloat', 0)) if info.get('shortPercentOfFloat') else None,
-                    "beta": float(info.get('beta', 0)) if info.get('beta') else None,
+                    "shortPercent": _fopt(info.get('shortPercentOfFloat')),
+                    "beta": _fopt(info.get('beta')),
                     # Advanced Fundamental Filters
-                    "priceToSales": float(info.get('priceToSalesTrailing12Months', 0)) if info.get('priceToSalesTrailing12Months') else None,
-                    "evToEbitda": float(info.get('enterpriseToEbitda', 0)) if info.get('enterpriseToEbitda') else None,
-                    "currentRatio": float(info.get('currentRatio', 0)) if info.get('currentRatio') else None,
-                    "quickRatio": float(info.get('quickRatio', 0)) if info.get('quickRatio') else None,
-                    "freeCashflow": float(info.get('freeCashflow', 0)) if info.get('freeCashflow') else None,
+                    "priceToSales": _fopt(info.get('priceToSalesTrailing12Months')),
+                    "evToEbitda": _fopt(info.get('enterpriseToEbitda')),
+                    "currentRatio": _fopt(info.get('currentRatio')),
+                    "quickRatio": _fopt(info.get('quickRatio')),
+                    "freeCashflow": _fopt(info.get('freeCashflow')),
                 }
 
                 # Apply filters
@@ -6339,12 +7400,9 @@ async def screen_stocks(filters: dict = Body(...)):
                 logger.warning(f"Error processing {xstock_symbol}: {e}")
                 return None
 
-        # Process all stocks in parallel (batches of 10 for safety)
-        batch_size = 10
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i+batch_size]
-            batch_results = await asyncio.gather(*[process_stock(sym) for sym in batch])
-            results.extend([r for r in batch_results if r is not None])
+        # Process all stocks in parallel (up to 32 in flight)
+        all_results = await gather_bounded(process_stock(sym) for sym in all_symbols)
+        results.extend([r for r in all_results if r is not None])
 
         # Sort results
         sort_by = filters.get('sortBy', 'marketCap')
@@ -6499,7 +7557,7 @@ async def get_market_pulse():
     cache_key = "market_pulse"
 
     # Try cache first
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         return cached_data
 
@@ -6510,7 +7568,7 @@ async def get_market_pulse():
 
         for symbol in major_symbols:
             try:
-                ticker = yf.Ticker(symbol)
+                ticker = yf.Ticker(symbol, session=SHARED_YF_SESSION)
                 hist = ticker.history(period="5d", interval="1d", timeout=30)
 
                 if not hist.empty and len(hist) > 1:
@@ -6533,12 +7591,18 @@ async def get_market_pulse():
         current_time = datetime.now()
         market_status = "Open" if current_time.weekday() < 5 and 9 <= current_time.hour < 16 else "Closed"
 
+        # Top-N via argpartition over aligned arrays instead of full sorts
+        change_pct = np.array([m["changePercent"] for m in market_data], dtype=np.float64)
+        volume = np.array([m["volume"] for m in market_data], dtype=np.float64)
+        gainers = top_n_indices(np.where(change_pct > 0, change_pct, -np.inf), min(3, int((change_pct > 0).sum())))
+        losers = top_n_indices(np.where(change_pct < 0, change_pct, np.inf), min(3, int((change_pct < 0).sum())), largest=False)
+
         pulse_data = {
             "marketStatus": market_status,
             "lastUpdate": int(time.time() * 1000),
-            "topGainers": sorted([m for m in market_data if m["changePercent"] > 0], key=lambda x: x["changePercent"], reverse=True)[:3],
-            "topLosers": sorted([m for m in market_data if m["changePercent"] < 0], key=lambda x: x["changePercent"])[:3],
-            "mostActive": sorted(market_data, key=lambda x: x["volume"], reverse=True)[:3],
+            "topGainers": [market_data[i] for i in gainers],
+            "topLosers": [market_data[i] for i in losers],
+            "mostActive": [market_data[i] for i in top_n_indices(volume, 3)],
             "marketCap": sum(m.get("marketCap", 0) for m in market_data),
             "volume": sum(m.get("volume", 0) for m in market_data)
         }
@@ -6555,7 +7619,7 @@ async def get_sector_analysis():
     cache_key = "sector_analysis"
 
     # Try cache first (1 hour TTL)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         return cached_data
 
@@ -6569,12 +7633,12 @@ async def get_sector_analysis():
         async def fetch_stock_sector_data(xstock_symbol: str):
             """Fetch stock data for sector analysis"""
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     return None
 
                 def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                    ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                     info = ticker.info
                     hist = ticker.history(period='1mo', timeout=5)  # Reduced timeout
 
@@ -6591,33 +7655,29 @@ async def get_sector_analysis():
                         'sector': info.get('sector', 'Unknown'),
                         'price': float(info.get('currentPrice', 0)),
                         'marketCap': float(info.get('marketCap', 0)),
-                        'pe': float(info.get('trailingPE', 0)) if info.get('trailingPE') else None,
-                        'pb': float(info.get('priceToBook', 0)) if info.get('priceToBook') else None,
-                        'ps': float(info.get('priceToSalesTrailing12Months', 0)) if info.get('priceToSalesTrailing12Months') else None,
-                        'roe': float(info.get('returnOnEquity', 0) * 100) if info.get('returnOnEquity') else None,
-                        'profitMargin': float(info.get('profitMargins', 0) * 100) if info.get('profitMargins') else None,
-                        'epsGrowth': float(info.get('earningsQuarterlyGrowth', 0) * 100) if info.get('earningsQuarterlyGrowth') else None,
-                        'revenueGrowth': float(info.get('revenueGrowth', 0) * 100) if info.get('revenueGrowth') else None,
-                        'debtToEquity': float(info.get('debtToEquity', 0)) if info.get('debtToEquity') else None,
+                        'pe': _fopt(info.get('trailingPE')),
+                        'pb': _fopt(info.get('priceToBook')),
+                        'ps': _fopt(info.get('priceToSalesTrailing12Months')),
+                        'roe': _fopt(info.get('returnOnEquity'), 100),
+                        'profitMargin': _fopt(info.get('profitMargins'), 100),
+                        'epsGrowth': _fopt(info.get('earningsQuarterlyGrowth'), 100),
+                        'revenueGrowth': _fopt(info.get('revenueGrowth'), 100),
+                        'debtToEquity': _fopt(info.get('debtToEquity')),
                         'priceChange': float(price_change),
                         'volume': int(info.get('volume', 0))
                     }
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch sector data for {xstock_symbol}: {e}")
                 return None
 
-        # Fetch all stocks in parallel (batches of 50 for faster fetching)
-        batch_size = 50
-        all_stock_data = []
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i+batch_size]
-            # Use return_exceptions=True to prevent one failure from blocking all
-            batch_results = await asyncio.gather(*[fetch_stock_sector_data(sym) for sym in batch], return_exceptions=True)
-            # Filter out None and exceptions
-            all_stock_data.extend([r for r in batch_results if r is not None and not isinstance(r, Exception)])
+        # Fetch all stocks in parallel (up to 32 in flight)
+        # Use return_exceptions=True to prevent one failure from blocking all
+        all_results = await gather_bounded((fetch_stock_sector_data(sym) for sym in all_symbols), return_exceptions=True)
+        # Filter out None and exceptions
+        all_stock_data = [r for r in all_results if r is not None and not isinstance(r, Exception)]
 
         # Group by sector
         for stock in all_stock_data:
@@ -6702,7 +7762,7 @@ async def get_sector_historical_performance(period: str = "1y"):
     cache_key = f"sector_historical_{period}"
 
     # Try cache first (24 hour TTL - historical data doesn't change often)
-    cached_data = await get_cache(cache_key)
+    cached_data = await get_cache_response(cache_key)
     if cached_data:
         return cached_data
 
@@ -6725,12 +7785,12 @@ async def get_sector_historical_performance(period: str = "1y"):
         async def fetch_stock_history(xstock_symbol: str):
             """Fetch historical price data for a stock"""
             try:
-                real_symbol = STOCK_SYMBOLS.get(xstock_symbol)
+                real_symbol = STOCK_SYMBOLS_YF.get(xstock_symbol)
                 if not real_symbol:
                     return None
 
                 def fetch():
-                    ticker = yf.Ticker(real_symbol.replace('.', '-'))
+                    ticker = yf.Ticker(real_symbol, session=SHARED_YF_SESSION)
                     info = ticker.info
                     hist = ticker.history(period=yf_period, timeout=5)  # Reduced timeout for faster failures
 
@@ -6757,30 +7817,20 @@ async def get_sector_historical_performance(period: str = "1y"):
                         'symbol': xstock_symbol,
                         'sector': sector,
                         'performance': float(performance),
-                        'history': [
-                            {
-                                'time': int(index.timestamp()),
-                                'value': float(row['Close'])
-                            }
-                            for index, row in hist.iterrows()
-                        ]
+                        'history': series_to_points(hist['Close'])
                     }
 
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, fetch)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(YF_POOL, fetch)
             except Exception as e:
                 logger.warning(f"Could not fetch history for {xstock_symbol}: {e}")
                 return None
 
-        # Fetch all stocks in parallel (batches of 50 for faster fetching)
-        batch_size = 50
-        all_stock_data = []
-        for i in range(0, len(all_symbols), batch_size):
-            batch = all_symbols[i:i+batch_size]
-            # Use return_exceptions=True to prevent one failure from blocking all
-            batch_results = await asyncio.gather(*[fetch_stock_history(sym) for sym in batch], return_exceptions=True)
-            # Filter out None and exceptions
-            all_stock_data.extend([r for r in batch_results if r is not None and not isinstance(r, Exception)])
+        # Fetch all stocks in parallel (up to 32 in flight)
+        # Use return_exceptions=True to prevent one failure from blocking all
+        all_results = await gather_bounded((fetch_stock_history(sym) for sym in all_symbols), return_exceptions=True)
+        # Filter out None and exceptions
+        all_stock_data = [r for r in all_results if r is not None and not isinstance(r, Exception)]
 
         # Group by sector and calculate sector-level historical performance
         sectors: Dict[str, Dict] = {}
@@ -6870,13 +7920,16 @@ async def get_all_xstocks():
 
     # Add async caching with 15-minute TTL
     cache_key = "all_xstocks_1d"
-    cached = await get_cache(cache_key)
+    cached = await get_cache_response(cache_key)
     if cached:
         logger.info("💾 Returning cached all-xstocks data")
         return cached
 
     logger.info("🔄 Fetching fresh all-xstocks data")
-    stocks_data = get_comprehensive_stocks_data()
+    # Intel page only reads price/change fields - skip the per-ticker earnings calls
+    stocks_data = await asyncio.get_running_loop().run_in_executor(
+        YF_POOL, functools.partial(get_comprehensive_stocks_data, include_earnings=False)
+    )
 
     # Convert to Intel page format
     intel_data = {}
@@ -6894,13 +7947,11 @@ async def get_all_xstocks():
             'lastUpdate': stock['lastUpdated']
         }
 
-    result = clean_data_for_json(intel_data)
-
-    # Cache for 15 minutes (900 seconds)
-    await set_cache(cache_key, result, ttl_seconds=900)
+    # Cache for 15 minutes (900 seconds) - orjson handles NaN/numpy, no pre-clean pass
+    await set_cache(cache_key, intel_data, ttl_seconds=900)
     logger.info("✅ Cached all-xstocks data for 15 minutes")
 
-    return result
+    return orjson_response(intel_data)
 
 @app.get("/api/dashboard/market")
 async def get_unified_dashboard(period: str = Query(default="1d", pattern="^(1d|1w|1mo|3mo|ytd|1y)$")):
@@ -6914,21 +7965,29 @@ async def get_unified_dashboard(period: str = Query(default="1d", pattern="^(1d|
         logger.info(f"📊 Fetching unified market dashboard for period: {period}")
 
         # Fetch all data components with proper period parameter
-        stocks_data = get_comprehensive_stocks_data(period=period)
-        indices_data = get_comprehensive_indices_data(period=period)
-        sectors_data = get_comprehensive_sectors_data(period)
-        movers_data = get_market_movers_data(period)
+        # Stocks (yfinance, thread pool) and indices (aiohttp) fetch concurrently without blocking the loop
+        loop = asyncio.get_running_loop()
+        stocks_data, indices_data = await asyncio.gather(
+            loop.run_in_executor(YF_POOL, get_comprehensive_stocks_data, period),
+            get_comprehensive_indices_data(period=period)
+        )
+        # Stocks are fetched once; the two downstream transforms fan out over that payload
+        sectors_data, movers_data = await asyncio.gather(
+            loop.run_in_executor(YF_POOL, get_comprehensive_sectors_data, period, stocks_data),
+            loop.run_in_executor(YF_POOL, get_market_movers_data, period, stocks_data)
+        )
 
         # Calculate pulse data
         if stocks_data:
-            total_volume = sum(stock['volume'] for stock in stocks_data)
+            # Column reductions over the SoA frame instead of per-dict generator sums
+            frame = stocks_frame(stocks_data)
+            total_volume = float(frame['volume'].sum())
             avg_volume = total_volume / len(stocks_data)
-            avg_change = sum(stock['changePercent'] for stock in stocks_data) / len(stocks_data)
-            total_market_cap = sum(stock['marketCap'] for stock in stocks_data)
+            avg_change = float(frame['changePercent'].mean())
+            total_market_cap = float(frame['marketCap'].sum())
 
-            volumes = [stock['volume'] for stock in stocks_data]
-            avg_volumes = [stock['avgVolume'] for stock in stocks_data if stock['avgVolume'] > 0]
-            volume_change = ((sum(volumes) / sum(avg_volumes)) - 1) * 100 if avg_volumes else 0
+            avg_volumes = frame['avgVolume'][frame['avgVolume'] > 0]
+            volume_change = ((total_volume / float(avg_volumes.sum())) - 1) * 100 if len(avg_volumes) else 0
 
             momentum = 'bullish' if avg_change > 1.0 else 'bearish' if avg_change < -1.0 else 'neutral'
             fear_greed = max(0, min(100, 50 + (avg_change * 10)))
@@ -6975,7 +8034,7 @@ async def get_unified_dashboard(period: str = Query(default="1d", pattern="^(1d|
         }
 
         logger.info(f"✅ Unified dashboard ready: {len(stocks_data)} stocks, {processing_time:.2f}ms")
-        return clean_data_for_json(response)
+        return orjson_response(response)
 
     except Exception as e:
         logger.error(f"❌ Error in unified dashboard endpoint: {e}")
@@ -7002,6 +8061,8 @@ warmup_status = {
 @app.on_event("startup")
 async def warmup_cache():
     """On-demand caching only - warmup disabled to prevent blocking"""
+    await connect_redis()
+    warmup_jit_kernels()
     logger.info("✅ Service started - using on-demand caching (no warmup to avoid blocking)")
     logger.info("🚀 Charts will cache as users browse - first load builds cache for instant subsequent loads")
 
@@ -7023,6 +8084,9 @@ async def background_cache_refresh():
 
     xstock_symbols = load_xstock_symbols()
     xstock_symbols_with_x = [s + 'x' if not s.endswith('x') else s for s in xstock_symbols]
+    # Priority refresh goes to the largest names first, remaining symbols keep file order
+    largest = [s + 'x' for s in top_symbols_by_market_cap(20, xstock_symbols)]
+    xstock_symbols_with_x = largest + [s for s in xstock_symbols_with_x if s not in largest]
 
     market_indices = ['^GSPC', '^DJI', '^IXIC', '^RUT', '^VIX',
                      'XLE', 'XLF', 'XLK', 'XLI', 'XLV',
@@ -7102,6 +8166,19 @@ async def start_background_tasks():
     logger.info("📊 Background tasks disabled - using on-demand caching strategy")
 
 
+@app.on_event("shutdown")
+async def close_http_session():
+    """Close the shared aiohttp session"""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
+
+@app.on_event("shutdown")
+async def shutdown_yf_pool():
+    """Stop the yfinance I/O pool without waiting on in-flight Yahoo calls"""
+    YF_POOL.shutdown(wait=False)
+
+
 # ==================== PORTFOLIO ANALYTICS ENDPOINTS ====================
 
 @app.post("/api/portfolio/analyze")
@@ -7145,13 +8222,15 @@ async def analyze_portfolio(request: dict):
 
         logger.info(f"📊 Portfolio analysis request for {len(symbols)} symbols")
 
-        result = portfolio_analytics.calculate_portfolio_metrics(
+        # Blocking fetch + numerics: run on YF_POOL so the event loop keeps serving other requests
+        result = await asyncio.get_running_loop().run_in_executor(YF_POOL, functools.partial(
+            portfolio_analytics.calculate_portfolio_metrics,
             symbols=symbols,
             start_date=start_date,
             end_date=end_date,
             portfolio_weights=portfolio_weights,
             benchmark_symbol=benchmark_symbol
-        )
+        ))
 
         return sanitize_dict(result)
 
@@ -7203,14 +8282,16 @@ async def optimize_portfolio(request: dict):
 
         logger.info(f"🎯 Portfolio optimization request for {len(symbols)} symbols")
 
-        result = portfolio_analytics.optimize_portfolio(
+        # Blocking fetch + numerics: run on YF_POOL so the event loop keeps serving other requests
+        result = await asyncio.get_running_loop().run_in_executor(YF_POOL, functools.partial(
+            portfolio_analytics.optimize_portfolio,
             symbols=symbols,
             start_date=start_date,
             end_date=end_date,
             min_weight=min_weight,
             max_weight=max_weight,
             n_portfolios=n_portfolios
-        )
+        ))
 
         return sanitize_dict(result)
 
@@ -7265,7 +8346,9 @@ async def portfolio_monte_carlo(request: dict):
 
         logger.info(f"🎲 Monte Carlo simulation for {len(symbols)} symbols, {num_simulations} iterations")
 
-        result = portfolio_analytics.run_monte_carlo(
+        # Blocking fetch + numerics: run on YF_POOL so the event loop keeps serving other requests
+        result = await asyncio.get_running_loop().run_in_executor(YF_POOL, functools.partial(
+            portfolio_analytics.run_monte_carlo,
             symbols=symbols,
             start_date=start_date,
             end_date=end_date,
@@ -7273,7 +8356,7 @@ async def portfolio_monte_carlo(request: dict):
             time_horizon_days=time_horizon_days,
             num_simulations=num_simulations,
             portfolio_weights=portfolio_weights
-        )
+        ))
 
         return sanitize_dict(result)
 
@@ -90,15 +90,20 @@ def create_cache_cleanup_strategy(memory_manager: MemoryManager, caches: Dict[st
         cleanup_priority = ['3mo', 'ytd', '1y', '1mo', '1w', '1d']
 
         for period in cleanup_priority:
-            if period in caches and caches[period].get('data') is not None:
-                logger.info(f"Clearing cache for period: {period}")
-                caches[period]['data'] = None
-                caches[period]['timestamp'] = 0
-
-                # Check if we've freed enough memory
-                if not memory_manager.check_memory_pressure():
-                    logger.info("Memory pressure resolved")
-                    break
+            # Every detail-level slot of the period: the bare key plus '<period>:lite', ':earnings+options', ...
+            slots = [key for key in list(caches) if key == period or key.startswith(f"{period}:")]
+            for key in slots:
+                entry = caches[key]
+                if entry.get('data') is not None:
+                    logger.info(f"Clearing cache for period: {key}")
+                    entry['data'] = None
+                    entry['timestamp'] = 0
+                    entry.pop('frame', None)
+
+            # Check if we've freed enough memory
+            if not memory_manager.check_memory_pressure():
+                logger.info("Memory pressure resolved")
+                break
 
         # Force garbage collection
         gc.collect()
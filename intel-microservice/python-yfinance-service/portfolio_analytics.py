@@ -7,6 +7,7 @@ Date: 2025-01-05
 """
 
 import yfinance as yf
+from yf_session import SHARED_YF_SESSION  # same session as main.py - YfData is a process-wide singleton
 import numpy as np
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -15,6 +16,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Long-lived I/O pool for per-symbol history downloads - sized for network waits and reused across
+# requests instead of spinning up (and tearing down) a 10-thread executor on every fetch
+_FETCH_POOL_WORKERS = 32
+_FETCH_POOL = ThreadPoolExecutor(max_workers=_FETCH_POOL_WORKERS, thread_name_prefix="yf-analytics")
+
 
 class PortfolioAnalyticsService:
     """
@@ -45,7 +51,7 @@ class PortfolioAnalyticsService:
         Fetch historical data for multiple symbols in parallel
 
         Pattern: intel-microservice/quantitative_engine.py:38-72
-        Uses ThreadPoolExecutor with 10 workers for parallel fetching
+        Fans out over the shared module-level fetch pool (_FETCH_POOL)
 
         Args:
             symbols: List of stock symbols
@@ -57,7 +63,7 @@ class PortfolioAnalyticsService:
         """
         def fetch_symbol(symbol: str):
             try:
-                ticker = yf.Ticker(symbol)
+                ticker = yf.Ticker(symbol, session=SHARED_YF_SESSION)
                 hist = ticker.history(start=start_date, end=end_date)
                 if not hist.empty:
                     logger.info(f"✅ Fetched {len(hist)} days for {symbol}")
@@ -71,14 +77,13 @@ class PortfolioAnalyticsService:
 
         historical_data = {}
 
-        # Parallel fetching with 10 workers (Intel pattern)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(fetch_symbol, sym) for sym in symbols]
+        # Parallel fetching on the shared pool (Intel pattern)
+        futures = [_FETCH_POOL.submit(fetch_symbol, sym) for sym in symbols]
 
-            for future in as_completed(futures):
-                symbol, data = future.result()
-                if data is not None:
-                    historical_data[symbol] = data
+        for future in as_completed(futures):
+            symbol, data = future.result()
+            if data is not None:
+                historical_data[symbol] = data
 
         logger.info(f"📊 Fetched historical data for {len(historical_data)}/{len(symbols)} symbols")
         return historical_data
@@ -242,11 +247,10 @@ class PortfolioAnalyticsService:
         metrics['cvar95'] = cvar_95 * 100
         metrics['cvar99'] = cvar_99 * 100
 
-        # 6. Maximum Drawdown
-        cumulative = (1 + portfolio_returns_aligned).cumprod()
-        running_max = cumulative.cummax()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = float(drawdown.min())
+        # 6. Maximum Drawdown (running peak via one np.maximum.accumulate pass over the growth curve)
+        cumulative = (1 + portfolio_returns_aligned.to_numpy()).cumprod()
+        running_max = np.maximum.accumulate(cumulative)
+        max_drawdown = float((cumulative / running_max - 1.0).min()) if cumulative.size else float('nan')
         metrics['maxDrawdown'] = max_drawdown * 100
 
         # 7. Downside Volatility (for Sortino Ratio)
@@ -448,22 +452,18 @@ class PortfolioAnalyticsService:
         weights = np.array([portfolio_weights.get(sym, 0) for sym in returns.columns])
 
         # Run simulations
-        simulation_paths = np.zeros((num_simulations, time_horizon_days + 1))
+        # PERFORMANCE FIX: The portfolio return w.(mu + L z) is linear in the correlated draw, so
+        # w.mu + (L'w).z has exactly the same distribution as drawing all N asset returns per day.
+        # One (sims x days) normal matrix and a single cumprod value every path at once instead
+        # of a Python loop over sims x days.
+        port_mean = float(weights @ mean_returns.values)
+        port_std = float(np.linalg.norm(L.T @ weights))
+        portfolio_returns = port_mean + port_std * np.random.randn(num_simulations, time_horizon_days)
+
+        simulation_paths = np.empty((num_simulations, time_horizon_days + 1))
         simulation_paths[:, 0] = initial_capital
-
-        for sim in range(num_simulations):
-            portfolio_value = initial_capital
-
-            for day in range(time_horizon_days):
-                # Generate correlated random returns
-                random_returns = np.dot(L, np.random.randn(len(symbols)))
-                daily_returns = mean_returns.values + random_returns
-
-                # Calculate portfolio return
-                portfolio_return = np.dot(weights, daily_returns)
-                portfolio_value *= (1 + portfolio_return)
-
-                simulation_paths[sim, day + 1] = portfolio_value
+        np.cumprod(1 + portfolio_returns, axis=1, out=simulation_paths[:, 1:])
+        simulation_paths[:, 1:] *= initial_capital
 
         # Calculate statistics
         final_values = simulation_paths[:, -1]
@@ -485,7 +485,7 @@ class PortfolioAnalyticsService:
         percentile_paths = {
             5: simulation_paths[np.argmin(np.abs(final_values - statistics['percentile5']))].tolist(),
             25: simulation_paths[np.argmin(np.abs(final_values - statistics['percentile25']))].tolist(),
-            50: simulation_paths[np.argmin(np.abs(final_values - statistics['percentile50']))].tolist(),
+            50: simulation_paths[np.argmin(np.abs(final_values - statistics['median']))].tolist(),
             75: simulation_paths[np.argmin(np.abs(final_values - statistics['percentile75']))].tolist(),
             95: simulation_paths[np.argmin(np.abs(final_values - statistics['percentile95']))].tolist()
         }
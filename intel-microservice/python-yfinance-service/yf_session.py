@@ -0,0 +1,14 @@
+"""
+Process-wide yfinance HTTP session.
+
+yfinance's YfData is a singleton: every yf.Ticker(session=X) / YfData(session=X) swaps its
+session, while the cached crumb stays bound to the cookies of whichever session fetched it.
+main.py and portfolio_analytics.py therefore share this one session instead of each owning one.
+"""
+from curl_cffi import requests as cffi_requests  # yfinance's HTTP client (Yahoo requires curl_cffi sessions)
+
+# PERFORMANCE FIX: One long-lived yfinance session - keep-alive connections (per-thread curl handles) and the
+# Yahoo cookie/crumb survive across calls. yf.download otherwise builds a fresh session on every call.
+# Transport failures (resets, timeouts) are retried with exponential backoff instead of failing the fetch.
+YF_SESSION_RETRY = cffi_requests.RetryStrategy(count=3, delay=0.2, jitter=0.1, backoff="exponential")
+SHARED_YF_SESSION = cffi_requests.Session(impersonate="chrome", retry=YF_SESSION_RETRY)